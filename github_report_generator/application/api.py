@@ -1,12 +1,21 @@
+import os
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from ..infrastructure import GitHubClient
-from ..domain import ReportGenerator
+from ..infrastructure.github import RequestMetrics, utc_now
+from ..infrastructure.storage import SQLiteStore
+from .services.contributors_service import ContributorsService
+from .services.incremental_sync_service import IncrementalSyncService
+from .services.languages_service import LanguagesService
+from .services.pull_requests_service import PullRequestsService
+from .services.report_service import ReportService
+from .services.stored_report_service import StoredReportService
 
 from ..infrastructure.visualization import (
     create_pr_size_chart,
@@ -27,10 +36,35 @@ app.add_middleware(
 )
 
 
+# Optional local store (GITHUB_REPORT_STORE): fetched data is synced into it
+# incrementally and offline reports are built from it alone
+_store: Optional[SQLiteStore] = None
+
+
+def get_store() -> Optional[SQLiteStore]:
+    global _store
+    store_path = os.getenv("GITHUB_REPORT_STORE")
+    if _store is None and store_path:
+        _store = SQLiteStore(store_path)
+    return _store
+
+
+def get_max_age() -> timedelta:
+    # GITHUB_REPORT_MAX_AGE (seconds): repositories synced into the store
+    # more recently, e.g. by the sync daemon, are reported from it alone
+    return timedelta(seconds=float(os.getenv("GITHUB_REPORT_MAX_AGE") or 0))
+
+
+# Shared by every client the API creates, so /metrics covers all requests
+# served since startup
+metrics = RequestMetrics()
+
+
 class ReportRequest(BaseModel):
     repo_name: str
     days: Optional[int] = 30
     github_token: Optional[str] = None
+    offline: bool = False
 
 
 class ReportResponse(BaseModel):
@@ -38,6 +72,16 @@ class ReportResponse(BaseModel):
     charts: Dict[str, Dict]
 
 
+class OrganizationReportRequest(BaseModel):
+    # Either an organization (or user) name or an explicit repository list
+    org: Optional[str] = None
+    repos: Optional[List[str]] = None
+    days: Optional[int] = 30
+    github_token: Optional[str] = None
+    include_archived: bool = False
+    parallel_repos: int = ReportService.DEFAULT_PARALLEL_REPOS
+
+
 @app.get("/")
 async def root():
     return {
@@ -47,33 +91,37 @@ async def root():
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """GitHub API request metrics in the Prometheus text format."""
+    return PlainTextResponse(
+        metrics.to_prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
 @app.post("/api/report")
-async def generate_report(request: ReportRequest) -> ReportResponse:
+def generate_report(request: ReportRequest) -> ReportResponse:
+    # A plain def runs in FastAPI's thread pool, so concurrent reports fetch
+    # in parallel (and coalesce identical GitHub requests) rather than
+    # blocking the event loop one after another.
     try:
-        # Initialize GitHub client
-        client = GitHubClient(token=request.github_token)
-
         # Calculate date range
-        end_date = datetime.now()
+        end_date = utc_now()
         start_date = end_date - timedelta(days=request.days)
-
-        # Get repository data
-        prs = client.get_pull_requests(
-            request.repo_name, start_date=start_date, end_date=end_date
-        )
-        contributor_stats = client.get_contributor_stats(request.repo_name)
-        languages = client.get_repository_languages(request.repo_name)
-
-        # Generate report
-        report_gen = ReportGenerator()
-        report = report_gen.generate_report(
-            repo_name=request.repo_name,
-            prs=prs,
-            period_start=start_date,
-            period_end=end_date,
-            contributor_stats=contributor_stats,
-            languages=languages,
-        )
+        store = get_store()
+
+        if request.offline:
+            if store is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Offline reports need GITHUB_REPORT_STORE to be set",
+                )
+            _check_read_access(request.repo_name, request.github_token)
+            report = StoredReportService(store).generate_report(
+                request.repo_name, start_date, end_date
+            )
+        else:
+            report = _generate_from_github(request, store, start_date, end_date)
 
         # Generate chart data
         size_chart = create_pr_size_chart(report)
@@ -90,7 +138,98 @@ async def generate_report(request: ReportRequest) -> ReportResponse:
             "cycle_times": cycle_chart.to_dict(),
         }
 
-        return ReportResponse(report=report.model_dump(), charts=charts)
+        return ReportResponse(report=report.validated().model_dump(), charts=charts)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/org-report")
+def generate_organization_report(request: OrganizationReportRequest) -> Dict:
+    """Per-repository reports plus a rollup; a plain def for the same reason
+    as generate_report."""
+    if bool(request.org) == bool(request.repos):
+        raise HTTPException(status_code=400, detail="Give either org or repos")
+    try:
+        end_date = utc_now()
+        start_date = end_date - timedelta(days=request.days)
+        reports = _report_service(request.github_token, get_store())
+        try:
+            repo_names = request.repos or reports.list_repositories(
+                request.org, include_archived=request.include_archived
+            )
+            report = reports.generate_organization_report(
+                request.org or "repositories",
+                repo_names,
+                start_date,
+                end_date,
+                parallel_repos=request.parallel_repos,
+                show_progress=False,
+            )
+        finally:
+            reports.github_client.close()
+        return report.validated().model_dump()
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _can_read(client: GitHubClient, github_token: Optional[str], repo_name: str) -> bool:
+    # The store holds whatever was synced with other tokens (the sync
+    # daemon's or other callers'), so stored data is only served to callers
+    # whose own token can read the repository
+    return bool(github_token) and client.can_read_repository(repo_name, github_token)
+
+
+def _check_read_access(repo_name: str, github_token: Optional[str]) -> None:
+    if not github_token:
+        raise HTTPException(
+            status_code=401,
+            detail="Offline reports need a github_token that can read the repository",
+        )
+    client = GitHubClient(token=github_token, metrics=metrics)
+    try:
+        allowed = _can_read(client, github_token, repo_name)
+    finally:
+        client.close()
+    if not allowed:
+        raise HTTPException(
+            status_code=403,
+            detail=f"github_token cannot read {repo_name}",
+        )
+
+
+def _report_service(
+    github_token: Optional[str], store: Optional[SQLiteStore]
+) -> ReportService:
+    client = GitHubClient(token=github_token, metrics=metrics)
+    prs_service = PullRequestsService(client)
+    if store is not None:
+        prs_service = IncrementalSyncService(prs_service, store)
+    return ReportService(
+        client,
+        prs_service,
+        ContributorsService(client, store),
+        LanguagesService(client, store),
+        store=store,
+        max_age=get_max_age(),
+        store_access=lambda repo_name: _can_read(client, github_token, repo_name),
+    )
+
+
+def _generate_from_github(
+    request: ReportRequest,
+    store: Optional[SQLiteStore],
+    start_date: datetime,
+    end_date: datetime,
+):
+    reports = _report_service(request.github_token, store)
+    try:
+        return reports.generate_report(
+            request.repo_name, start_date, end_date, show_progress=False
+        )
+    finally:
+        reports.github_client.close()
@@ -1,22 +1,52 @@
 import argparse
 import os
 import sys
-from datetime import datetime
+from datetime import timedelta
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import yaml
 from dotenv import load_dotenv
 
-from .services import pull_requests_service, contributors_service, languages_service
-from ..infrastructure.github import GitHubClient
-from ..domain import ReportGenerator
-from ..domain import PullRequestState
+from .services import (
+    pull_requests_service,
+    graphql_pull_requests_service,
+    incremental_sync_service,
+    stored_report_service,
+    contributors_service,
+    languages_service,
+    report_service,
+)
+from ..infrastructure.github import (
+    Cassette,
+    GitHubClient,
+    AsyncGitHubClient,
+    HttpCache,
+    RateLimitScheduler,
+)
+from ..infrastructure.storage import SQLiteStore
+from ..domain import OrganizationReport, ReportGenerator
 from ..application.utils import calculate_date_range
-from ..application.formatters import SUPPORTED_FORMATS, format_report
+from ..application.formatters import (
+    SUPPORTED_FORMATS,
+    format_organization_report,
+    format_report,
+)
 from ..application.gui import ReportGeneratorGUI
 
 
+def _replay_latency(value: str) -> Optional[float]:
+    # None stands for "replay with the recorded latencies"
+    if value == "recorded":
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected seconds or 'recorded', got {value!r}"
+        )
+
+
 class ReportCLI:
     def __init__(self):
         self.parser = self._create_parser()
@@ -28,11 +58,41 @@ class ReportCLI:
             description="Generate GitHub repository contribution reports."
         )
 
-        # Required arguments
+        # Repositories: one positional repo, or several with --org/--repos
         parser.add_argument(
             "repo",
+            nargs="?",
             help='GitHub repository in format "owner/repo"',
         )
+        repos_group = parser.add_argument_group("Multi-repository options")
+        repos_group.add_argument(
+            "--org",
+            help=(
+                "Report on every (non-archived) repository of an organization "
+                "or user, plus a rollup of all of them"
+            ),
+        )
+        repos_group.add_argument(
+            "--repos",
+            nargs="+",
+            metavar="OWNER/REPO",
+            help="Report on these repositories, plus a rollup of all of them",
+        )
+        repos_group.add_argument(
+            "--include-archived",
+            action="store_true",
+            help="With --org, include archived repositories",
+        )
+        repos_group.add_argument(
+            "--parallel-repos",
+            type=int,
+            default=report_service.ReportService.DEFAULT_PARALLEL_REPOS,
+            help=(
+                "Repositories fetched at once; they share one client and rate "
+                "limit budget "
+                f"(default: {report_service.ReportService.DEFAULT_PARALLEL_REPOS})"
+            ),
+        )
 
         # (Mock data option removed)
 
@@ -41,15 +101,13 @@ class ReportCLI:
         date_group.add_argument(
             "--month",
             type=int,
-            help="Month to generate report for (1-12, defaults to current month)",
+            help="Month to generate report for (1-12, defaults to current month in UTC)",
             choices=range(1, 13),
-            default=datetime.now().month,
         )
         date_group.add_argument(
             "--year",
             type=int,
-            help="Year to generate report for (defaults to current year)",
-            default=datetime.now().year,
+            help="Year to generate report for (defaults to current year in UTC)",
         )
         date_group.add_argument(
             "--days",
@@ -70,6 +128,120 @@ class ReportCLI:
             help="Output format (default: json)",
         )
 
+        # Performance options
+        perf_group = parser.add_argument_group("Performance options")
+        perf_group.add_argument(
+            "--concurrency",
+            type=int,
+            default=AsyncGitHubClient.DEFAULT_CONCURRENCY,
+            help=(
+                "Maximum concurrent GitHub requests when fetching PR details "
+                f"(default: {AsyncGitHubClient.DEFAULT_CONCURRENCY}, 0 disables)"
+            ),
+        )
+
+        perf_group.add_argument(
+            "--prefetch-pages",
+            type=int,
+            default=2,
+            help=(
+                "Number of PR list pages to read ahead of the detail/review "
+                "workers (default: 2)"
+            ),
+        )
+        perf_group.add_argument(
+            "--engine",
+            choices=["rest", "graphql"],
+            default="rest",
+            help=(
+                "API used to fetch pull requests; graphql batches sizes and "
+                "reviews for many PRs per request and needs a token (default: rest)"
+            ),
+        )
+        perf_group.add_argument(
+            "--stats-wait",
+            type=float,
+            default=0.0,
+            help=(
+                "Seconds to keep waiting for contributor statistics GitHub is "
+                "still computing once pull requests are fetched; the report is "
+                "marked partial without them (default: 0)"
+            ),
+        )
+
+        # Cache options
+        cache_group = parser.add_argument_group("Cache options")
+        cache_group.add_argument(
+            "--cache-dir",
+            help=(
+                "Directory for a persistent HTTP cache; cached responses are "
+                "revalidated with ETag/Last-Modified instead of refetched"
+            ),
+        )
+        cache_group.add_argument(
+            "--cache-size",
+            type=int,
+            default=HttpCache.DEFAULT_MAX_BYTES // (1024 * 1024),
+            help=(
+                "Maximum size of the persistent cache in MB "
+                f"(default: {HttpCache.DEFAULT_MAX_BYTES // (1024 * 1024)})"
+            ),
+        )
+
+        cache_group.add_argument(
+            "--incremental",
+            action="store_true",
+            help=(
+                "Keep PRs, contributor stats and languages in a local store in "
+                "--cache-dir and only fetch PRs updated since the previous run"
+            ),
+        )
+        cache_group.add_argument(
+            "--max-age",
+            type=float,
+            default=0.0,
+            help=(
+                "With --incremental, build the report from the store without "
+                "calling GitHub if it was synced (e.g. by the sync daemon) "
+                "within this many seconds (default: 0)"
+            ),
+        )
+        cache_group.add_argument(
+            "--offline",
+            action="store_true",
+            help=(
+                "Build the report from the local store in --cache-dir without "
+                "calling GitHub"
+            ),
+        )
+
+        # Record/replay options
+        cassette_group = parser.add_argument_group("Record/replay options")
+        cassette_mode = cassette_group.add_mutually_exclusive_group()
+        cassette_mode.add_argument(
+            "--record",
+            metavar="DIR",
+            help="Record every GitHub response of this run into a cassette directory",
+        )
+        cassette_mode.add_argument(
+            "--replay",
+            metavar="DIR",
+            help=(
+                "Answer GitHub requests from a recorded cassette directory "
+                "instead of the network"
+            ),
+        )
+        cassette_group.add_argument(
+            "--replay-latency",
+            type=_replay_latency,
+            default=0.0,
+            help=(
+                "Simulated latency per replayed response, in seconds, or "
+                "'recorded' for the time each response originally took "
+                "(default: 0)"
+            ),
+        )
+
         # Configuration
         config_group = parser.add_argument_group("Configuration")
         config_group.add_argument(
@@ -118,84 +290,188 @@ class ReportCLI:
         # Parse command-line arguments
         self.args = self.parser.parse_args(args)
 
+        targets = [self.args.repo, self.args.org, self.args.repos]
+        if sum(target is not None for target in targets) != 1:
+            self.parser.error("give exactly one of REPO, --org or --repos")
+        if self.args.offline and not self.args.repo:
+            self.parser.error("--offline reports on a single repository")
+        if (self.args.incremental or self.args.offline) and not self.args.cache_dir:
+            self.parser.error("--incremental and --offline require --cache-dir")
+        if self.args.replay and not os.path.isdir(self.args.replay):
+            self.parser.error(f"cassette directory not found: {self.args.replay}")
+
         # Load configuration
         self.config = self.load_config(self.args.config)
 
-        # Check GitHub token
-        token = os.getenv("GITHUB_TOKEN")
-        if not token:
+        if self.args.offline:
+            return self._run_offline()
+
+        # Check GitHub token; GITHUB_TOKENS and `github.tokens` in the config
+        # add more tokens to the rate limit pool
+        github_config = self.config.get("github") or {}
+        tokens = RateLimitScheduler.tokens_from_env(
+            os.getenv("GITHUB_TOKEN"), github_config.get("tokens")
+        )
+        token = tokens[0] if tokens else None
+        if not token and not self.args.replay:
             print(
                 "\nWARNING: GITHUB_TOKEN not provided. Proceeding with unauthenticated requests."
                 "\nYou can provide a token by setting the GITHUB_TOKEN environment variable."
                 "\nThis is required for authenticated requests and higher rate limits."
             )
 
-        github = GitHubClient(token=token)
+        http_cache = (
+            HttpCache(self.args.cache_dir, max_bytes=self.args.cache_size * 1024 * 1024)
+            if self.args.cache_dir
+            else None
+        )
+        cassette = None
+        if self.args.record:
+            cassette = Cassette(self.args.record, mode="record")
+        elif self.args.replay:
+            cassette = Cassette(
+                self.args.replay,
+                mode="replay",
+                latency=0.0 if self.args.replay_latency is None else self.args.replay_latency,
+                recorded_latency=self.args.replay_latency is None,
+            )
+        github = GitHubClient(
+            token=token,
+            tokens=tokens,
+            max_workers=max(1, self.args.concurrency),
+            http_cache=http_cache,
+            cassette=cassette,
+        )
 
-        prs_service = pull_requests_service.PullRequestsService(github)
-        contrib_service = contributors_service.ContributorsService(github)
-        language_service = languages_service.LanguagesService(github)
+        if self.args.engine == "graphql" and token:
+            prs_service = graphql_pull_requests_service.GraphQLPullRequestsService(
+                github
+            )
+        else:
+            if self.args.engine == "graphql":
+                print(
+                    "\nWARNING: The GraphQL engine requires GITHUB_TOKEN. "
+                    "Falling back to the REST engine."
+                )
+            prs_service = pull_requests_service.PullRequestsService(
+                github,
+                concurrency=self.args.concurrency or None,
+                prefetch_pages=self.args.prefetch_pages,
+            )
+        # Incremental runs record everything they fetch in the local store
+        store = SQLiteStore(self.args.cache_dir) if self.args.incremental else None
+        if store is not None:
+            prs_service = incremental_sync_service.IncrementalSyncService(
+                prs_service, store
+            )
+        reports = report_service.ReportService(
+            github,
+            prs_service,
+            contributors_service.ContributorsService(github, store),
+            languages_service.LanguagesService(github, store),
+            ReportGenerator(initiative_patterns=self.config.get("initiative_patterns")),
+            stats_wait=self.args.stats_wait,
+            store=store,
+            max_age=timedelta(seconds=self.args.max_age),
+        )
 
         try:
             # Calculate date range
             start_date, end_date = calculate_date_range(self.args)
 
-            # Initialize report generator with initiative patterns
-            report_gen = ReportGenerator(
-                initiative_patterns=self.config.get("initiative_patterns")
-            )
-
             if self.args.debug:
-                print(f"Fetching data for {self.args.repo}...")
+                target = self.args.repo or self.args.org or ", ".join(self.args.repos)
+                print(f"Fetching data for {target}...")
                 print(f"Auth mode: {'token' if token else 'unauthenticated'}")
+                print(f"Token pool: {len(tokens)} token(s)")
 
-            # Fetch pull requests
-            prs = prs_service.get_pull_requests(
-                repo_name=self.args.repo,
-                state=PullRequestState.ALL,
-                start_date=start_date,
-                end_date=end_date,
-                show_progress=True,
-            )
-
-            # Fetch additional data if needed
-            contributor_stats = contrib_service.get_contributor_stats(self.args.repo)
-            languages = language_service.get_repository_languages(self.args.repo)
-
-            # Generate the report
-            report = report_gen.generate_report(
-                repo_name=self.args.repo,
-                prs=prs,
-                period_start=start_date,
-                period_end=end_date,
-                contributor_stats=contributor_stats,
-                languages=languages,
-            )
-
-            # Format and output the report
-            output = format_report(report, self.args.format)
-
-            # Write to file or print to console
-            if self.args.output:
-                output_path = Path(self.args.output)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, "w") as f:
-                    f.write(output)
-                print(f"Report written to {output_path}")
+            if self.args.repo:
+                report = reports.generate_report(self.args.repo, start_date, end_date)
             else:
-                print(output)
+                repo_names = self.args.repos or reports.list_repositories(
+                    self.args.org, include_archived=self.args.include_archived
+                )
+                report = reports.generate_organization_report(
+                    self.args.org or "repositories",
+                    repo_names,
+                    start_date,
+                    end_date,
+                    parallel_repos=self.args.parallel_repos,
+                )
 
+            if self.args.debug:
+                stats = github.cache_stats
+                print(
+                    f"Response cache: {stats['hits']} hits, {stats['misses']} misses, "
+                    f"{stats['evictions']} evictions, {stats['bytes']} bytes held"
+                )
+                concurrency = github.concurrency_controller.snapshot()
+                print(
+                    f"Concurrency: limit {concurrency['limit']}/"
+                    f"{concurrency['max_limit']}, "
+                    f"{concurrency['throttles']} secondary rate limit backoffs"
+                )
+                for budget in github.rate_limiter.snapshot():
+                    print(
+                        f"Rate limit ({budget['token']}): {budget['remaining']}/"
+                        f"{budget['limit']} remaining, resets at "
+                        f"{budget['resets_at'] or 'unknown'}"
+                    )
+                print("Requests by endpoint (slowest first):")
+                for line in github.metrics.summary():
+                    print(f"  {line}")
+
+            self._write_report(report)
             return 0
 
         except Exception as e:
-            print(f"Error: {str(e)}", file=sys.stderr)
-            if self.args and self.args.debug:
-                import traceback
-
-                traceback.print_exc()
+            self._print_error(e)
             return 1
         finally:
             github.close()
+            if http_cache is not None:
+                http_cache.close()
+            if store is not None:
+                store.close()
+
+    def _run_offline(self) -> int:
+        store = SQLiteStore(self.args.cache_dir)
+        try:
+            start_date, end_date = calculate_date_range(self.args)
+            report = stored_report_service.StoredReportService(
+                store, initiative_patterns=self.config.get("initiative_patterns")
+            ).generate_report(self.args.repo, start_date, end_date)
+            self._write_report(report)
+            return 0
+        except Exception as e:
+            self._print_error(e)
+            return 1
+        finally:
+            store.close()
+
+    def _write_report(self, report) -> None:
+        # Format and output the report
+        if isinstance(report, OrganizationReport):
+            output = format_organization_report(report, self.args.format)
+        else:
+            output = format_report(report, self.args.format)
+
+        # Write to file or print to console
+        if self.args.output:
+            output_path = Path(self.args.output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w") as f:
+                f.write(output)
+            print(f"Report written to {output_path}")
+        else:
+            print(output)
+
+    def _print_error(self, error: Exception) -> None:
+        print(f"Error: {str(error)}", file=sys.stderr)
+        if self.args and self.args.debug:
+            import traceback
+
+            traceback.print_exc()
 
 
 def main():
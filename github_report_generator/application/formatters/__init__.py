@@ -1,6 +1,12 @@
 """Application formatters module."""
 
-from .format_console import format_console
-from .format_report import format_report, SUPPORTED_FORMATS
+from .format_console import format_console, format_organization_console
+from .format_report import format_report, format_organization_report, SUPPORTED_FORMATS
 
-__all__ = ["format_console", "format_report", "SUPPORTED_FORMATS"]
+__all__ = [
+    "format_console",
+    "format_organization_console",
+    "format_report",
+    "format_organization_report",
+    "SUPPORTED_FORMATS",
+]
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ...domain.model import RepositoryReport
+    from ...domain.model import OrganizationReport, RepositoryReport
 
 def format_console(report: "RepositoryReport") -> str:
         lines = [
@@ -57,4 +57,33 @@ def format_console(report: "RepositoryReport") -> str:
             else:
                 lines.append("No data available")
         
-        return "\n".join(lines)
\ No newline at end of file
+        return "\n".join(lines)
+
+def format_organization_console(report: "OrganizationReport") -> str:
+        lines = [
+            f"GitHub Organization Report: {report.name}",
+            f"Period: {report.period_start.date()} to {report.period_end.date()}",
+            f"Repositories: {len(report.repositories)} reported, "
+            f"{len(report.failed_repositories)} failed",
+            "=" * 80,
+            "\nRepositories:",
+        ]
+
+        for name, repo_report in sorted(
+            report.repositories.items(),
+            key=lambda x: x[1].total_prs,
+            reverse=True
+        ):
+            lines.append(
+                f"{name}: {repo_report.total_prs} PRs, "
+                f"{repo_report.prs_merged} merged, "
+                f"{len(repo_report.contributors)} contributors"
+                + (" (partial)" if repo_report.partial else "")
+            )
+        for name, error in sorted(report.failed_repositories.items()):
+            lines.append(f"{name}: failed ({error})")
+
+        if report.rollup is not None:
+            lines.extend(["", "All repositories:", "", format_console(report.rollup)])
+
+        return "\n".join(lines)
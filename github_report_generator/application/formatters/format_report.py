@@ -1,17 +1,29 @@
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ...domain.model import RepositoryReport
+    from ...domain.model import OrganizationReport, RepositoryReport
 
 SUPPORTED_FORMATS = ['json', 'html', 'console']
 
 def format_report(report: "RepositoryReport", fmt: str) -> str:
         """Format the report in the specified format."""
         if fmt == 'json':
-            return report.model_dump_json(indent=2)
+            # PRs are unvalidated records until the report leaves the process
+            return report.validated().model_dump_json(indent=2)
         elif fmt == 'html':
             from ...infrastructure.visualization import generate_html_report
             return generate_html_report(report)
         else:
             from .format_console import format_console
-            return format_console(report)
\ No newline at end of file
+            return format_console(report)
+
+def format_organization_report(report: "OrganizationReport", fmt: str) -> str:
+        """Format a multi-repository report; html and console show the rollup."""
+        if fmt == 'json':
+            return report.validated().model_dump_json(indent=2)
+        elif fmt == 'html':
+            from ...infrastructure.visualization import generate_html_report
+            return generate_html_report(report.rollup)
+        else:
+            from .format_console import format_organization_console
+            return format_organization_console(report)
@@ -173,7 +173,7 @@ class ChartUpdater:
             self._handle_chart_error("contributor", e)
 
     def update_velocity_charts(self, report: RepositoryReport):
-        weekly_metrics = calculate_weekly_metrics(report.prs)
+        weekly_metrics = report.weekly_metrics or calculate_weekly_metrics(report.prs)
         if not weekly_metrics:
             return
 
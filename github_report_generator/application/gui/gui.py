@@ -1,9 +1,12 @@
+import os
 import tkinter as tk
+from datetime import timedelta
 from typing import Optional
 
 from ...domain.management.chart_manager import ChartManager
 from ...domain.management.config_manager import ConfigManager
 from ...infrastructure.error.error_handler import ErrorHandler
+from ...infrastructure.storage import SQLiteStore
 from ...domain.management.event_manager import EventManager
 from ...domain.management.progress_manager import ProgressManager
 from ...domain.management.report_manager import ReportManager
@@ -31,13 +34,22 @@ class ReportGeneratorGUI:
             self.window_manager.get_main_container()
         )
 
-        # Initialize data managers
-        self.report_manager = ReportManager(self.progress_manager)
+        # Initialize data managers; GITHUB_REPORT_STORE points at a local
+        # store to sync into and to build offline reports from, and
+        # GITHUB_REPORT_MAX_AGE (seconds) lets fresh stored data skip GitHub
+        store_path = os.getenv("GITHUB_REPORT_STORE")
+        self.store = SQLiteStore(store_path) if store_path else None
+        self.report_manager = ReportManager(
+            self.progress_manager,
+            self.store,
+            max_age=timedelta(seconds=float(os.getenv("GITHUB_REPORT_MAX_AGE") or 0)),
+        )
 
         # Initialize state
         self.repo_entry: Optional[tk.Entry] = None
         self.token_entry: Optional[tk.Entry] = None
         self.days_entry: Optional[tk.Entry] = None
+        self.offline_var = tk.BooleanVar(value=False)
         self.input_validator: Optional[InputValidator] = None
 
         # Set up GUI
@@ -109,6 +121,15 @@ class ReportGeneratorGUI:
         generate_btn.pack(side=tk.RIGHT)
         GUIUtils.create_tooltip(generate_btn, "Click to generate the repository report")
 
+        if self.store is not None:
+            offline_check = tk.Checkbutton(
+                options_frame, text="Use stored data (offline)", variable=self.offline_var
+            )
+            offline_check.pack(side=tk.RIGHT, padx=5)
+            GUIUtils.create_tooltip(
+                offline_check, "Build the report from the local store without calling GitHub"
+            )
+
     def _generate_report(self) -> None:
         try:
             if not self.input_validator.validate_all():
@@ -122,6 +143,7 @@ class ReportGeneratorGUI:
                 repo_name=repo_name,
                 days=days,
                 token=token,
+                offline=self.offline_var.get(),
                 on_complete=lambda: self.event_manager.on_report_complete(
                     self.metrics_updater, self.chart_updater, self.report_manager
                 ),
@@ -140,6 +162,8 @@ class ReportGeneratorGUI:
             )
 
             # Clean up and close
+            if self.store is not None:
+                self.store.close()
             self.window_manager.cleanup()
 
         except Exception as e:
@@ -12,7 +12,7 @@ class MetricsUpdater:
         if not report:
             return
 
-        weekly_metrics = calculate_weekly_metrics(report.prs)
+        weekly_metrics = report.weekly_metrics or calculate_weekly_metrics(report.prs)
         if not weekly_metrics:
             return
 
@@ -1,33 +1,137 @@
+import threading
 import time
-from typing import Dict
+from typing import Any, Dict, List, Optional
 
 from ...infrastructure.github.github_client import GitHubClient
+from ...infrastructure.storage import SQLiteStore
 from ...domain.model import ContributorStats
 
 
-class ContributorsService:
-    def __init__(self, github_client: GitHubClient):
-        self.github_client = github_client
+class ContributorStatsPoll:
+    """Contributor statistics being fetched on a background thread.
 
-    def get_contributor_stats(self, repo_name: str) -> Dict[str, ContributorStats]:
-        stats = {}
+    Started by ``ContributorsService.start_contributor_stats``. GitHub answers
+    ``/stats/contributors`` with a 202 while it computes the statistics, so
+    the thread keeps polling (with exponential backoff, up to the service's
+    deadline) while the caller fetches pull requests.
+    """
 
+    def __init__(self, service: "ContributorsService", repo_name: str, deadline: float):
+        self.repo_name = repo_name
+        self._service = service
+        self._deadline = time.monotonic() + deadline
+        self._stats: Optional[Dict[str, ContributorStats]] = None
+        self._answered = threading.Event()
+        self._done = threading.Event()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"contributor-stats-{repo_name}", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
         try:
-            # Get contributor statistics
-            contributors = self.github_client.make_request(
-                "GET", f"repos/{repo_name}/stats/contributors"
+            contributors = self._service._poll(
+                self.repo_name, self._deadline, self._cancelled, self._answered
             )
+            if contributors is not None:
+                self._stats = self._service._to_stats(self.repo_name, contributors)
+        finally:
+            self._answered.set()
+            self._done.set()
+
+    def result(self, timeout: Optional[float] = None) -> Optional[Dict[str, ContributorStats]]:
+        """Return the statistics, or None if GitHub has not produced them yet.
+
+        Waits for the first answer from GitHub (so a repository whose stats
+        are already computed is never reported as partial), then for at most
+        ``timeout`` more seconds; ``None`` waits until the poll finishes.
+        """
+        self._answered.wait()
+        self._done.wait(timeout)
+        return self._stats
+
+    def cancel(self) -> None:
+        """Stop polling; a request already in flight is left to finish."""
+        self._cancelled.set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+
+class ContributorsService:
+    # Backoff between polls while GitHub computes the statistics (202)
+    INITIAL_POLL_DELAY = 1.0
+    MAX_POLL_DELAY = 16.0
+    # Give up on the statistics after this many seconds
+    DEFAULT_DEADLINE = 60.0
 
-            # If we get a 202, the stats are being generated, wait and retry
-            retries = 3
-            while retries > 0 and not contributors:
-                time.sleep(2)
+    def __init__(self, github_client: GitHubClient, store: Optional[SQLiteStore] = None):
+        self.github_client = github_client
+        # When set, the weekly statistics are recorded for offline reports
+        self.store = store
+
+    def get_contributor_stats(
+        self, repo_name: str, deadline: Optional[float] = None
+    ) -> Dict[str, ContributorStats]:
+        """Fetch contributor statistics, waiting up to ``deadline`` seconds
+        for GitHub to compute them. Returns an empty dict if they are not
+        ready in time."""
+        return self.start_contributor_stats(repo_name, deadline).result() or {}
+
+    def start_contributor_stats(
+        self, repo_name: str, deadline: Optional[float] = None
+    ) -> ContributorStatsPoll:
+        """Start fetching contributor statistics in the background."""
+        if deadline is None:
+            deadline = self.DEFAULT_DEADLINE
+        return ContributorStatsPoll(self, repo_name, deadline)
+
+    def _poll(
+        self,
+        repo_name: str,
+        deadline: float,
+        cancelled: threading.Event,
+        answered: threading.Event,
+    ) -> Optional[List[Dict[str, Any]]]:
+        # Returns the contributor list, or None if it was not ready in time
+        delay = self.INITIAL_POLL_DELAY
+        while True:
+            try:
                 contributors = self.github_client.make_request(
                     "GET", f"repos/{repo_name}/stats/contributors"
                 )
-                retries -= 1
-            
-            contributors = contributors or []
+            except Exception as e:
+                print(f"Warning: Error fetching contributor stats: {str(e)}")
+                return None
+            finally:
+                answered.set()
+
+            # A 202 (stats still being generated) comes back as an empty
+            # object rather than a list
+            if isinstance(contributors, list):
+                return contributors
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(
+                    f"Warning: Contributor stats for {repo_name} were not ready "
+                    "before the deadline"
+                )
+                return None
+            if cancelled.wait(min(delay, remaining)):
+                return None
+            delay = min(delay * 2, self.MAX_POLL_DELAY)
+
+    def _to_stats(
+        self, repo_name: str, contributors: List[Dict[str, Any]]
+    ) -> Dict[str, ContributorStats]:
+        stats = {}
+
+        try:
+            if self.store is not None and contributors:
+                self.store.replace_contributor_weeks(repo_name, contributors)
 
             for contributor in contributors:
                 if not contributor.get("author"):
@@ -49,8 +153,6 @@ class ContributorsService:
                 )
 
         except Exception as e:
-            print(f"Warning: Error fetching contributor stats: {str(e)}")
-            # Return empty stats rather than failing
-            pass
+            print(f"Warning: Error processing contributor stats: {str(e)}")
 
         return stats
@@ -0,0 +1,287 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from tqdm import tqdm
+
+from ...domain.model import PullRequest, PullRequestState
+from ...infrastructure.github.github_client import GitHubClient
+from ...infrastructure.github.timestamps import as_utc, parse_timestamp
+from .pull_requests_service import PullRequestsService
+from .timeline_service import TIMELINE_FIELDS, TimelineService
+
+# Reviews and labels are paged like REST: the first 100 come with the PR,
+# the rest in follow-up queries for the PRs that have more
+REVIEW_FIELDS = """
+  pageInfo { hasNextPage endCursor }
+  nodes {
+    author { login }
+    state
+    submittedAt
+    comments { totalCount }
+  }
+"""
+LABEL_FIELDS = """
+  pageInfo { hasNextPage endCursor }
+  nodes { name }
+"""
+PAGED_CONNECTIONS = {"reviews": REVIEW_FIELDS, "labels": LABEL_FIELDS}
+
+PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $states: [PullRequestState!], $first: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(
+      first: $first
+      after: $after
+      states: $states
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        state
+        createdAt
+        updatedAt
+        closedAt
+        mergedAt
+        author { login }
+        headRefName
+        labels(first: 100) {%s}
+        additions
+        deletions
+        changedFiles
+        commits { totalCount }
+        comments { totalCount }
+        reviews(first: 100) {%s}
+        ...Timeline
+      }
+    }
+  }
+}
+fragment Timeline on PullRequest {%s}
+""" % (LABEL_FIELDS, REVIEW_FIELDS, TIMELINE_FIELDS)
+
+# GraphQL states matching each REST `state` filter. REST reports merged PRs as
+# "closed", so CLOSED has to include MERGED to return the same set.
+GRAPHQL_STATES = {
+    PullRequestState.ALL: None,
+    PullRequestState.OPEN: ["OPEN"],
+    PullRequestState.CLOSED: ["CLOSED", "MERGED"],
+    PullRequestState.MERGED: ["MERGED"],
+}
+
+
+class GraphQLPullRequestsService:
+    """GraphQL alternative to ``PullRequestsService``.
+
+    Sizes, commit counts, labels, reviews and timeline events for up to
+    ``page_size`` PRs come back in a single query, instead of one list call plus two REST calls per
+    PR. The resulting ``PullRequest`` models are identical to the REST ones.
+    PRs with more than 100 reviews or labels get the rest in batched
+    follow-up queries, so review metrics see every review and no label is
+    dropped.
+    """
+
+    DEFAULT_PAGE_SIZE = 50
+    # Connections (a PR's reviews or labels) per follow-up query for items
+    # past the first page
+    FOLLOW_UP_BATCH_SIZE = 20
+
+    def __init__(self, github_client: GitHubClient, page_size: int = DEFAULT_PAGE_SIZE):
+        self.github_client = github_client
+        self.page_size = min(max(page_size, 1), 100)
+
+    def get_pull_requests(
+        self,
+        repo_name: str,
+        state: PullRequestState = PullRequestState.ALL,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        show_progress: bool = True,
+    ) -> List[PullRequest]:
+        owner, name = repo_name.split("/", 1)
+        start_date, end_date = as_utc(start_date), as_utc(end_date)
+        prs = []
+        cursor = None
+        page = 1
+
+        while True:
+            variables = {
+                "owner": owner,
+                "name": name,
+                "states": GRAPHQL_STATES[state],
+                "first": self.page_size,
+                "after": cursor,
+            }
+
+            try:
+                data = self.github_client.graphql(PULL_REQUESTS_QUERY, variables)
+            except Exception as e:
+                raise Exception(f"Error fetching pull requests: {str(e)}")
+
+            repository = data.get("repository")
+            if not repository:
+                raise Exception(f"Error fetching pull requests: repository {repo_name} not found")
+
+            connection = repository["pullRequests"]
+            nodes = connection["nodes"] or []
+            remaining = self._remaining_pages(owner, name, nodes)
+
+            reached_start = False
+            for node in tqdm(nodes, desc=f"Fetching PRs (page {page})") if show_progress else nodes:
+                pr, pr_details, reviews = self._to_rest_shape(
+                    node,
+                    repo_name,
+                    remaining["reviews"].get(node["number"]),
+                    remaining["labels"].get(node["number"]),
+                )
+
+                # Results are ordered by updatedAt, so nothing after this
+                # point can fall inside the window.
+                updated_at = parse_timestamp(pr["updated_at"])
+                if start_date and updated_at and updated_at < start_date:
+                    reached_start = True
+                    break
+
+                if not PullRequestsService._in_window(pr, state, start_date, end_date):
+                    continue
+
+                pull_request = PullRequestsService._build_pull_request(
+                    pr, pr_details, reviews
+                )
+                TimelineService.apply(pull_request, node)
+                prs.append(pull_request)
+
+            page_info = connection["pageInfo"]
+            if reached_start or not page_info["hasNextPage"]:
+                break
+
+            cursor = page_info["endCursor"]
+            page += 1
+
+        return prs
+
+    def _remaining_pages(
+        self, owner: str, name: str, nodes: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[int, List[Dict[str, Any]]]]:
+        """All items of every paged connection (reviews, labels) that has
+        more than its first page, by connection and PR number, with the rest
+        fetched in batched follow-up queries.
+
+        The nodes are payloads shared with the response cache and with
+        coalesced callers, so the pages are gathered into new lists.
+        """
+        items: Dict[str, Dict[int, List[Dict[str, Any]]]] = {
+            connection: {} for connection in PAGED_CONNECTIONS
+        }
+        cursors: Dict[Tuple[int, str], Optional[str]] = {}
+        for node in nodes:
+            for connection in PAGED_CONNECTIONS:
+                first_page = node.get(connection) or {}
+                page_info = first_page.get("pageInfo") or {}
+                if page_info.get("hasNextPage"):
+                    items[connection][node["number"]] = list(
+                        first_page.get("nodes") or []
+                    )
+                    cursors[(node["number"], connection)] = page_info.get("endCursor")
+
+        while cursors:
+            pending = list(cursors)
+            next_cursors: Dict[Tuple[int, str], Optional[str]] = {}
+            for i in range(0, len(pending), self.FOLLOW_UP_BATCH_SIZE):
+                batch = pending[i : i + self.FOLLOW_UP_BATCH_SIZE]
+                variables: Dict[str, Any] = {"owner": owner, "name": name}
+                for number, connection in batch:
+                    variables[f"{connection}{number}"] = cursors[(number, connection)]
+                try:
+                    data = self.github_client.graphql(
+                        self._follow_up_query(batch), variables
+                    )
+                except Exception as e:
+                    raise Exception(
+                        f"Error fetching pull request reviews and labels: {str(e)}"
+                    )
+
+                repository = data.get("repository") or {}
+                for number, connection in batch:
+                    more = (repository.get(f"pr{number}") or {}).get(connection) or {}
+                    items[connection][number].extend(more.get("nodes") or [])
+                    page_info = more.get("pageInfo") or {}
+                    if page_info.get("hasNextPage"):
+                        next_cursors[(number, connection)] = page_info.get("endCursor")
+            cursors = next_cursors
+
+        return items
+
+    @staticmethod
+    def _follow_up_query(batch: List[Tuple[int, str]]) -> str:
+        cursors = "".join(
+            f", ${connection}{number}: String" for number, connection in batch
+        )
+        connections: Dict[int, List[str]] = {}
+        for number, connection in batch:
+            connections.setdefault(number, []).append(
+                f"      {connection}(first: 100, after: ${connection}{number}) "
+                f"{{{PAGED_CONNECTIONS[connection]}}}\n"
+            )
+        lookups = "\n".join(
+            f"    pr{number}: pullRequest(number: {number}) {{\n"
+            f"{''.join(fields)}"
+            f"    }}"
+            for number, fields in connections.items()
+        )
+        return (
+            f"query($owner: String!, $name: String!{cursors}) {{\n"
+            "  repository(owner: $owner, name: $name) {\n"
+            f"{lookups}\n"
+            "  }\n"
+            "}\n"
+        )
+
+    @staticmethod
+    def _to_rest_shape(
+        node: Dict[str, Any],
+        repo_name: str,
+        reviews: Optional[List[Dict[str, Any]]] = None,
+        labels: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]:
+        """Map a GraphQL pull request node onto the REST list/detail/reviews
+        payloads; ``reviews`` and ``labels`` replace the node's first pages."""
+        if reviews is None:
+            reviews = node.get("reviews", {}).get("nodes") or []
+        if labels is None:
+            labels = node.get("labels", {}).get("nodes") or []
+        author = node.get("author")
+
+        pr = {
+            "number": node["number"],
+            "title": node["title"],
+            "state": "open" if node["state"] == "OPEN" else "closed",
+            "user": {"login": author["login"]} if author else None,
+            "created_at": node["createdAt"],
+            "updated_at": node["updatedAt"],
+            "closed_at": node.get("closedAt"),
+            "merged_at": node.get("mergedAt"),
+            "head": {"ref": node["headRefName"]},
+            "labels": labels,
+            "url": f"{GitHubClient.BASE_URL}/repos/{repo_name}/pulls/{node['number']}",
+        }
+        pr_details = {
+            "additions": node.get("additions", 0),
+            "deletions": node.get("deletions", 0),
+            "changed_files": node.get("changedFiles", 0),
+            "comments": node.get("comments", {}).get("totalCount", 0),
+            "review_comments": sum(
+                r.get("comments", {}).get("totalCount", 0) for r in reviews
+            ),
+            "commits": node.get("commits", {}).get("totalCount", 0),
+        }
+        rest_reviews = [
+            {
+                "user": {"login": r["author"]["login"]} if r.get("author") else None,
+                "state": r.get("state"),
+                "submitted_at": r.get("submittedAt"),
+            }
+            for r in reviews
+        ]
+
+        return pr, pr_details, rest_reviews
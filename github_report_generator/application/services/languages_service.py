@@ -1,16 +1,24 @@
-from typing import Dict
+from typing import Dict, Optional
 from ...infrastructure.github.github_client import GitHubClient
+from ...infrastructure.storage import SQLiteStore
 
 
 class LanguagesService:
-    def __init__(self, github_client: GitHubClient):
+    def __init__(self, github_client: GitHubClient, store: Optional[SQLiteStore] = None):
         self.github_client = github_client
+        # When set, the languages are recorded for offline reports
+        self.store = store
 
     def get_repository_languages(self, repo_name: str) -> Dict[str, int]:
         try:
-            return self.github_client.make_request(
+            languages = self.github_client.make_request(
                 "GET", f"repos/{repo_name}/languages"
             )
         except Exception as e:
             print(f"Warning: Error fetching repository languages: {str(e)}")
             return {}
+
+        if self.store is not None and languages:
+            self.store.save_languages(repo_name, languages)
+        # The payload is shared with the response cache; the report gets its own
+        return dict(languages)
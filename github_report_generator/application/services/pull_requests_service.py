@@ -1,14 +1,89 @@
+import asyncio
+import math
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
 from tqdm import tqdm
 
-from ...domain.model import PullRequest, PullRequestState
+from ...domain.model import (
+    PullRequest,
+    PullRequestRecord,
+    PullRequestState,
+    ReviewMetricsRecord,
+)
 from ...infrastructure.github.github_client import GitHubClient
+from ...infrastructure.github.async_github_client import AsyncGitHubClient
+from ...infrastructure.github.timestamps import as_utc, parse_timestamp, parse_timestamps
+from .timeline_service import TimelineService
+
+
+@dataclass
+class PaginationStats:
+    pages_fetched: int = 0
+    pages_total: Optional[int] = None  # from the Link rel="last" header
+    stopped_early: bool = False
+
+    @property
+    def pages_skipped(self) -> int:
+        if self.pages_total is None:
+            return 0
+        return max(self.pages_total - self.pages_fetched, 0)
+
+    @property
+    def requests_skipped(self) -> int:
+        # Every skipped page is one list request that was never made
+        return self.pages_skipped
+
 
 class PullRequestsService:
-    def __init__(self, github_client: GitHubClient):
+    WINDOWED_PER_PAGE = 100
+    FULL_SCAN_PER_PAGE = 30
+    # The only fields read from list items; the rest of each (large) PR
+    # object is skipped while the page is decoded.
+    LIST_FIELDS = (
+        "url",
+        "number",
+        "title",
+        "state",
+        "user.login",
+        "created_at",
+        "updated_at",
+        "closed_at",
+        "merged_at",
+        "head.ref",
+        "labels.name",
+    )
+    # Reviews are paged in full (GitHub's default page holds only 30) and
+    # only the fields the review metrics need are decoded.
+    REVIEWS_PER_PAGE = 100
+    REVIEW_FIELDS = ("user.login", "state", "submitted_at")
+
+    def __init__(
+        self,
+        github_client: GitHubClient,
+        concurrency: Optional[int] = None,
+        windowed: bool = True,
+        prefetch_pages: int = 2,
+        timeline: bool = True,
+    ):
         self.github_client = github_client
-    
+        # When set, PR details and reviews are fetched through an
+        # AsyncGitHubClient with at most this many requests in flight.
+        self.concurrency = concurrency
+        # Windowed mode stops paging once the list (sorted by updated_at,
+        # newest first) has moved past start_date instead of walking the
+        # repository's entire PR history.
+        self.windowed = windowed
+        self.per_page = self.WINDOWED_PER_PAGE if windowed else self.FULL_SCAN_PER_PAGE
+        # How many list pages the concurrent pipeline may read ahead of the
+        # detail/review workers.
+        self.prefetch_pages = max(1, prefetch_pages)
+        # First commit and ready-for-review times come from batched GraphQL
+        # queries (about one per 50 PRs); needs a token.
+        self.timeline = timeline
+        self.last_pagination = PaginationStats()
+
     def get_pull_requests(
         self,
         repo_name: str,
@@ -16,87 +91,475 @@ class PullRequestsService:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         show_progress: bool = True,
+    ) -> List[PullRequest]:
+        # PR timestamps are aware UTC; naive window bounds are taken as UTC
+        start_date, end_date = as_utc(start_date), as_utc(end_date)
+        if self.concurrency:
+            prs = asyncio.run(
+                self._get_pull_requests_concurrently(
+                    repo_name, state, start_date, end_date, show_progress
+                )
+            )
+        else:
+            prs = self._get_pull_requests_sequentially(
+                repo_name, state, start_date, end_date, show_progress
+            )
+
+        if self.timeline:
+            TimelineService(self.github_client).add_timelines(repo_name, prs)
+        return prs
+
+    def _get_pull_requests_sequentially(
+        self,
+        repo_name: str,
+        state: PullRequestState,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        show_progress: bool,
     ) -> List[PullRequest]:
         prs = []
-        page = 1
-        per_page = 30
-        
-        github_state = state.value if state != PullRequestState.MERGED else "closed"
+        stats = self.last_pagination = PaginationStats()
 
-        while True:
-            params = {
-                "state": github_state,
-                "sort": "updated",
-                "direction": "desc",
-                "per_page": per_page,
-                "page": page,
-            }
+        def add_page(pr_data: List[Dict[str, Any]], page: int) -> None:
+            in_window = [
+                pr
+                for pr in pr_data
+                if self._in_window(pr, state, start_date, end_date)
+            ]
 
+            # Fetch details and reviews for the whole page in one batch each;
+            # the bar advances as each request completes on the worker pool
+            progress = (
+                tqdm(
+                    total=2 * len(in_window),
+                    desc=f"Fetching PRs (page {page})",
+                    unit="request",
+                )
+                if show_progress
+                else None
+            )
+            on_done = (lambda url: progress.update(1)) if progress else None
             try:
-                pr_data = self.github_client.make_request("GET", f"repos/{repo_name}/pulls", params)
+                details = self.github_client.batch_request(
+                    [pr["url"] for pr in in_window], on_done=on_done
+                )
+                reviews = self.github_client.batch_all_pages(
+                    [f"{pr['url']}/reviews" for pr in in_window],
+                    self._review_params(),
+                    fields=self.REVIEW_FIELDS,
+                    on_done=on_done,
+                )
+            finally:
+                if progress is not None:
+                    progress.close()
+
+            for pr in in_window:
+                prs.append(
+                    self._build_pull_request(
+                        pr,
+                        details[pr["url"]],
+                        reviews[f"{pr['url']}/reviews"],
+                    )
+                )
+
+        page = 1
+        try:
+            while True:
+                pr_data, links = self.github_client.get_page(
+                    f"repos/{repo_name}/pulls",
+                    self._list_params(state, page),
+                    fields=self.LIST_FIELDS,
+                )
+                self._record_page(stats, links)
+                if page == 1:
+                    self._warn_if_budget_short(self.github_client, stats, start_date)
 
                 if not pr_data:
                     break
+                add_page(pr_data, page)
 
-                for pr in tqdm(pr_data, desc=f"Fetching PRs (page {page})") if show_progress else pr_data:
-                    if state == PullRequestState.MERGED and not pr.get("merged_at"):
-                        continue
+                if self._is_last_page(stats, pr_data, links, start_date):
+                    break
 
-                    updated_at = datetime.strptime(
-                        pr["updated_at"], "%Y-%m-%dT%H:%M:%SZ"
-                    )
-                    if start_date and updated_at < start_date:
-                        continue
-                    if end_date and updated_at > end_date:
-                        continue
-
-                    batch_urls = [pr["url"], f"{pr['url']}/reviews"]
-                    batch_results = self.github_client.batch_request(batch_urls)
-
-                    pr_details = batch_results[pr["url"]] or {}
-                    reviews = batch_results[f"{pr['url']}/reviews"] or []
-                    reviewers = list(
-                        set(r["user"]["login"] for r in reviews if r["user"])
-                    )
+                if self._fetch_all_pages(start_date):
+                    # Nothing to stop early for: the rest of the list comes
+                    # in one parallel wave, sized by the Link rel="last" page.
+                    for page_data in self.github_client.get_remaining_pages(
+                        links, fields=self.LIST_FIELDS
+                    ):
+                        stats.pages_fetched += 1
+                        page += 1
+                        add_page(page_data, page)
+                    break
 
-                    prs.append(
-                        PullRequest(
-                            number=pr["number"],
-                            title=pr["title"],
-                            state=PullRequestState(pr["state"].lower()),
-                            author=pr["user"]["login"] if pr["user"] else "unknown",
-                            created_at=datetime.strptime(
-                                pr["created_at"], "%Y-%m-%dT%H:%M:%SZ"
-                            ),
-                            updated_at=updated_at,
-                            closed_at=datetime.strptime(
-                                pr["closed_at"], "%Y-%m-%dT%H:%M:%SZ"
-                            )
-                            if pr["closed_at"]
-                            else None,
-                            merged_at=datetime.strptime(
-                                pr["merged_at"], "%Y-%m-%dT%H:%M:%SZ"
-                            )
-                            if pr["merged_at"]
-                            else None,
-                            additions=pr_details.get("additions", 0),
-                            deletions=pr_details.get("deletions", 0),
-                            changed_files=pr_details.get("changed_files", 0),
-                            comments=pr_details.get("comments", 0),
-                            review_comments=pr_details.get("review_comments", 0),
-                            commits=pr_details.get("commits", 0),
-                            branch=pr["head"]["ref"],
-                            labels=[label["name"] for label in pr.get("labels", [])],
-                            reviewers=reviewers,
-                        )
-                    )
+                page += 1
+
+        except Exception as e:
+            raise Exception(f"Error fetching pull requests: {str(e)}")
+
+        self._report_pagination(stats, show_progress)
+        return prs
+
+    async def fetch_pull_requests(
+        self,
+        client: AsyncGitHubClient,
+        repo_name: str,
+        state: PullRequestState = PullRequestState.ALL,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        show_progress: bool = True,
+    ) -> List[PullRequest]:
+        """Fetch pull requests through a list-page producer and detail workers.
+
+        The producer walks the list pages and feeds in-window PRs into a
+        bounded queue, running at most ``prefetch_pages`` pages ahead of the
+        workers that fetch details and reviews. Memory stays bounded by the
+        queue size however large the repository is.
+        """
+        start_date, end_date = as_utc(start_date), as_utc(end_date)
+        stats = self.last_pagination = PaginationStats()
+        queue: asyncio.Queue = asyncio.Queue(
+            maxsize=self.prefetch_pages * self.per_page
+        )
+        results: Dict[int, PullRequest] = {}
+        errors: List[Exception] = []
+
+        page_progress = (
+            tqdm(desc="Listing PR pages", unit="page", position=0)
+            if show_progress
+            else None
+        )
+        pr_progress = (
+            tqdm(desc="Fetching PR details", unit="PR", total=0, position=1)
+            if show_progress
+            else None
+        )
+
+        index = 0
+
+        async def enqueue(pr_data: List[Dict[str, Any]]) -> None:
+            nonlocal index
+            in_window = [
+                pr
+                for pr in pr_data
+                if self._in_window(pr, state, start_date, end_date)
+            ]
+            if pr_progress is not None:
+                pr_progress.total += len(in_window)
+                pr_progress.refresh()
 
-                if len(pr_data) < per_page:
+            for pr in in_window:
+                await queue.put((index, pr))
+                index += 1
+
+        async def produce() -> None:
+            page = 1
+            while True:
+                pr_data, links = await client.get_page(
+                    f"repos/{repo_name}/pulls",
+                    self._list_params(state, page),
+                    fields=self.LIST_FIELDS,
+                )
+                self._record_page(stats, links)
+                if page == 1:
+                    self._warn_if_budget_short(client, stats, start_date)
+                if page_progress is not None:
+                    page_progress.total = stats.pages_total
+                    page_progress.update(1)
+
+                if not pr_data:
+                    break
+                await enqueue(pr_data)
+
+                if self._is_last_page(stats, pr_data, links, start_date):
+                    break
+
+                if self._fetch_all_pages(start_date):
+                    # Nothing to stop early for: the rest of the list is
+                    # fetched in parallel, at most prefetch_pages pages ahead
+                    # of the queue, and fed to the workers in order.
+                    async for page_data in client.iter_remaining_pages(
+                        links, self.prefetch_pages, fields=self.LIST_FIELDS
+                    ):
+                        stats.pages_fetched += 1
+                        if page_progress is not None:
+                            page_progress.update(1)
+                        await enqueue(page_data)
                     break
 
                 page += 1
 
-            except Exception as e:
-                raise Exception(f"Error fetching pull requests: {str(e)}")
+        async def consume() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                index, pr = item
+                try:
+                    details, reviews = await asyncio.gather(
+                        client.batch_request([pr["url"]]),
+                        client.batch_all_pages(
+                            [f"{pr['url']}/reviews"],
+                            self._review_params(),
+                            fields=self.REVIEW_FIELDS,
+                        ),
+                    )
+                    results[index] = self._build_pull_request(
+                        pr,
+                        details[pr["url"]],
+                        reviews[f"{pr['url']}/reviews"],
+                    )
+                except Exception as e:
+                    # Keep draining so the producer never blocks on a full queue
+                    errors.append(e)
+                if pr_progress is not None:
+                    pr_progress.update(1)
+
+        workers = [
+            asyncio.create_task(consume()) for _ in range(client.max_concurrency)
+        ]
+        try:
+            try:
+                await produce()
+            finally:
+                for _ in workers:
+                    await queue.put(None)
+                await asyncio.gather(*workers)
+        except Exception as e:
+            raise Exception(f"Error fetching pull requests: {str(e)}")
+        finally:
+            for progress in (page_progress, pr_progress):
+                if progress is not None:
+                    progress.close()
+
+        if errors:
+            raise Exception(f"Error fetching pull requests: {str(errors[0])}")
+
+        self._report_pagination(stats, show_progress)
+        return [results[index] for index in sorted(results)]
+
+    async def _get_pull_requests_concurrently(
+        self,
+        repo_name: str,
+        state: PullRequestState,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        show_progress: bool,
+    ) -> List[PullRequest]:
+        async with AsyncGitHubClient(
+            token=self.github_client.token,
+            max_concurrency=self.concurrency,
+            http_cache=self.github_client.http_cache,
+            response_cache=self.github_client.response_cache,
+            rate_limiter=self.github_client.rate_limiter,
+            concurrency_controller=self.github_client.concurrency_controller,
+            metrics=self.github_client.metrics,
+            cassette=self.github_client.cassette,
+            base_url=self.github_client.base_url,
+            singleflight=self.github_client.singleflight,
+        ) as client:
+            return await self.fetch_pull_requests(
+                client, repo_name, state, start_date, end_date, show_progress
+            )
+
+    def _list_params(self, state: PullRequestState, page: int) -> Dict[str, Any]:
+        github_state = state.value if state != PullRequestState.MERGED else "closed"
+        return {
+            "state": github_state,
+            "sort": "updated",
+            "direction": "desc",
+            "per_page": self.per_page,
+            "page": page,
+        }
+
+    def _review_params(self) -> Dict[str, Any]:
+        return {"per_page": self.REVIEWS_PER_PAGE}
+
+    @staticmethod
+    def _record_page(stats: PaginationStats, links: Dict[str, str]) -> None:
+        stats.pages_fetched += 1
+        if "last" in links:
+            last_page = parse_qs(urlparse(links["last"]).query).get("page")
+            if last_page:
+                stats.pages_total = int(last_page[0])
+        elif "next" not in links:
+            # The last page carries no rel="last" link
+            stats.pages_total = stats.pages_fetched
+
+    def _fetch_all_pages(self, start_date: Optional[datetime]) -> bool:
+        # Without a window to stop at, every list page will be read
+        return not (self.windowed and start_date)
+
+    def _is_last_page(
+        self,
+        stats: PaginationStats,
+        pr_data: List[Dict[str, Any]],
+        links: Dict[str, str],
+        start_date: Optional[datetime],
+    ) -> bool:
+        # The last page carries no rel="next" link
+        if "next" not in links:
+            return True
+
+        # The list is sorted by updated_at descending, so once the last PR on
+        # a page predates the window every following page does too.
+        if self.windowed and start_date:
+            oldest = parse_timestamp(pr_data[-1]["updated_at"])
+            if oldest and oldest < start_date:
+                stats.stopped_early = True
+                return True
+
+        return False
+
+    def _warn_if_budget_short(
+        self,
+        client: Any,
+        stats: PaginationStats,
+        start_date: Optional[datetime],
+    ) -> None:
+        # Windowed runs stop at the start of the window, usually after a page
+        # or two; only a full scan is known to read the whole list
+        if stats.pages_total is None or not self._fetch_all_pages(start_date):
+            return
+        # The remaining list pages plus a detail and a reviews call per PR
+        pending = (stats.pages_total - stats.pages_fetched) + (
+            stats.pages_total * self.per_page * 2
+        )
+        wait = client.projected_wait(pending)
+        if wait > 0:
+            print(
+                f"\nWARNING: Up to {pending} more requests exceed the remaining "
+                f"rate limit budget; the report may take about "
+                f"{math.ceil(wait / 60)} more minutes while waiting for resets."
+            )
+
+    @staticmethod
+    def _report_pagination(stats: PaginationStats, show_progress: bool) -> None:
+        if show_progress and stats.stopped_early:
+            print(
+                f"Reached the start of the reporting window after "
+                f"{stats.pages_fetched} of {stats.pages_total or '?'} pages; "
+                f"skipped {stats.pages_skipped} pages "
+                f"({stats.requests_skipped} list requests)."
+            )
+
+    @staticmethod
+    def _in_window(
+        pr: Dict[str, Any],
+        state: PullRequestState,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> bool:
+        if state == PullRequestState.MERGED and not pr.get("merged_at"):
+            return False
+
+        created_at, updated_at = parse_timestamps((pr["created_at"], pr["updated_at"]))
+        if created_at is None or updated_at is None:
+            print(f"Warning: Skipping PR #{pr['number']}: malformed timestamps")
+            return False
+        if start_date and updated_at < start_date:
+            return False
+        if end_date and updated_at > end_date:
+            return False
+        return True
+
+    @staticmethod
+    def _build_pull_request(
+        pr: Dict[str, Any],
+        pr_details: Optional[Dict[str, Any]],
+        reviews: Optional[List[Dict[str, Any]]],
+    ) -> PullRequestRecord:
+        pr_details = pr_details or {}
+        reviews = reviews or []
+        reviewers = list(
+            set(r["user"]["login"] for r in reviews if r["user"])
+        )
+        created_at, updated_at, closed_at, merged_at = parse_timestamps(
+            pr.get(field)
+            for field in ("created_at", "updated_at", "closed_at", "merged_at")
+        )
+        author = pr["user"]["login"] if pr["user"] else "unknown"
+
+        # Trusted, already-parsed data: a record, validated only on output
+        return PullRequestRecord(
+            number=pr["number"],
+            title=pr["title"],
+            # REST reports merged PRs as "closed"
+            state=PullRequestState.MERGED
+            if pr["merged_at"]
+            else PullRequestState(pr["state"].lower()),
+            author=author,
+            created_at=created_at,
+            updated_at=updated_at,
+            closed_at=closed_at,
+            merged_at=merged_at,
+            additions=pr_details.get("additions", 0),
+            deletions=pr_details.get("deletions", 0),
+            changed_files=pr_details.get("changed_files", 0),
+            comments=pr_details.get("comments", 0),
+            review_comments=pr_details.get("review_comments", 0),
+            commits=pr_details.get("commits", 0),
+            branch=pr["head"]["ref"],
+            labels=[label["name"] for label in pr.get("labels", [])],
+            reviewers=reviewers,
+            review_metrics=PullRequestsService._review_metrics(
+                created_at, author, reviews
+            ),
+        )
+
+    @staticmethod
+    def _review_metrics(
+        created_at: datetime,
+        author: str,
+        reviews: List[Dict[str, Any]],
+    ) -> ReviewMetricsRecord:
+        """Derive review timings from a PR's reviews in one pass.
+
+        Reviews come back in submission order. The PR author's own reviews
+        (replies to review threads) are not reviews of the PR, and pending
+        reviews have no ``submitted_at`` yet; both are skipped. A new review
+        round starts with the first review after changes were requested.
+        """
+        reviewers = set()
+        first_review = None
+        first_approval = None
+        comments = 0
+        rounds = 0
+        awaiting_review = True
+
+        for review in reviews:
+            submitted_at = parse_timestamp(review.get("submitted_at"))
+            user = review.get("user")
+            if not submitted_at or (user and user["login"] == author):
+                continue
+            state = review.get("state")
+            if user:
+                reviewers.add(user["login"])
+
+            if first_review is None or submitted_at < first_review:
+                first_review = submitted_at
+            if state == "APPROVED" and (
+                first_approval is None or submitted_at < first_approval
+            ):
+                first_approval = submitted_at
+            if state == "COMMENTED":
+                comments += 1
+
+            if awaiting_review:
+                rounds += 1
+                awaiting_review = False
+            if state == "CHANGES_REQUESTED":
+                awaiting_review = True
+
+        def hours_since_created(moment: Optional[datetime]) -> Optional[float]:
+            if moment is None:
+                return None
+            return max((moment - created_at).total_seconds() / 3600, 0.0)
 
-        return prs
\ No newline at end of file
+        return ReviewMetricsRecord(
+            time_to_first_review=hours_since_created(first_review),
+            time_to_approval=hours_since_created(first_approval),
+            number_of_reviewers=len(reviewers),
+            number_of_comments=comments,
+            number_of_review_rounds=rounds,
+        )
@@ -0,0 +1,212 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from ...domain import ReportGenerator
+from ...domain.model import (
+    ContributorStats,
+    OrganizationReport,
+    PullRequest,
+    PullRequestState,
+    RepositoryReport,
+)
+from ...infrastructure.github import GitHubClient, ResourceNotFoundError, as_utc
+from ...infrastructure.storage import SQLiteStore
+from .contributors_service import ContributorsService
+from .languages_service import LanguagesService
+from .stored_report_service import StoredReportService
+
+
+class ReportService:
+    """Fetches repository data and builds reports for one or many repos.
+
+    Every repository goes through the same shared ``GitHubClient`` (and the
+    PR service built on it), so the HTTP pools, caches, token rate limits
+    and the adaptive concurrency limit are shared too. Several repositories
+    are fetched at once; how fast a large batch finishes is then bounded by
+    the rate limit budget rather than by the latency of each repo in turn.
+
+    With a ``store`` and ``max_age``, a repository synced within ``max_age``
+    (for instance by the sync daemon) is reported from the store alone.
+    When the store is shared between callers, ``store_access`` decides per
+    repository whether this caller may be given its stored data; without
+    its approval the repository is fetched from GitHub as usual.
+    """
+
+    DEFAULT_PARALLEL_REPOS = 4
+
+    def __init__(
+        self,
+        github_client: GitHubClient,
+        prs_service: Any,
+        contributors_service: Optional[ContributorsService] = None,
+        languages_service: Optional[LanguagesService] = None,
+        report_generator: Optional[ReportGenerator] = None,
+        stats_wait: float = 0.0,
+        store: Optional[SQLiteStore] = None,
+        max_age: Optional[timedelta] = None,
+        store_access: Optional[Callable[[str], bool]] = None,
+    ):
+        self.github_client = github_client
+        self.prs_service = prs_service
+        self.contributors_service = contributors_service or ContributorsService(
+            github_client
+        )
+        self.languages_service = languages_service or LanguagesService(github_client)
+        self.report_generator = report_generator or ReportGenerator()
+        # Extra seconds to wait for contributor stats GitHub is still computing
+        self.stats_wait = stats_wait
+        self.stored_reports = (
+            StoredReportService(store, report_generator=self.report_generator)
+            if store is not None
+            else None
+        )
+        self.max_age = max_age
+        self.store_access = store_access
+
+    def generate_report(
+        self,
+        repo_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        show_progress: bool = True,
+    ) -> RepositoryReport:
+        # Reports are in aware UTC; naive bounds are taken as UTC
+        start_date, end_date = as_utc(start_date), as_utc(end_date)
+        if (
+            self.stored_reports is not None
+            and self.stored_reports.is_fresh(repo_name, start_date, self.max_age)
+            and (self.store_access is None or self.store_access(repo_name))
+        ):
+            return self.stored_reports.generate_report(repo_name, start_date, end_date)
+
+        # GitHub may need a while to compute contributor statistics, so they
+        # are polled in the background while pull requests are fetched
+        stats_poll = self.contributors_service.start_contributor_stats(repo_name)
+        try:
+            prs = self.prs_service.get_pull_requests(
+                repo_name=repo_name,
+                state=PullRequestState.ALL,
+                start_date=start_date,
+                end_date=end_date,
+                show_progress=show_progress,
+            )
+            languages = self.languages_service.get_repository_languages(repo_name)
+            contributor_stats = stats_poll.result(timeout=self.stats_wait)
+        finally:
+            stats_poll.cancel()
+
+        return self.report_generator.generate_report(
+            repo_name=repo_name,
+            prs=prs,
+            period_start=start_date,
+            period_end=end_date,
+            contributor_stats=contributor_stats,
+            languages=languages,
+            missing_sections=[] if contributor_stats is not None else ["contributor_stats"],
+        )
+
+    def list_repositories(self, owner: str, include_archived: bool = False) -> List[str]:
+        """Full names of an organization's (or user's) repositories."""
+        params = {"per_page": 100, "type": "all"}
+        fields = ("full_name", "archived")
+        try:
+            pages = self.github_client.get_all_pages(
+                f"orgs/{owner}/repos", params, fields=fields
+            )
+        except ResourceNotFoundError:
+            pages = self.github_client.get_all_pages(
+                f"users/{owner}/repos", params, fields=fields
+            )
+        return sorted(
+            repo["full_name"]
+            for page in pages
+            for repo in page or []
+            if include_archived or not repo.get("archived")
+        )
+
+    def generate_organization_report(
+        self,
+        name: str,
+        repo_names: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        parallel_repos: int = DEFAULT_PARALLEL_REPOS,
+        show_progress: bool = True,
+    ) -> OrganizationReport:
+        """Report on each repository plus a rollup of all of them.
+
+        A repository that fails is listed in ``failed_repositories`` instead
+        of failing the whole run.
+        """
+        start_date, end_date = as_utc(start_date), as_utc(end_date)
+        report = OrganizationReport(
+            name=name, period_start=start_date, period_end=end_date
+        )
+        repo_names = list(dict.fromkeys(repo_names))
+        done = 0
+
+        def fetch(repo_name: str) -> RepositoryReport:
+            # Per-repo progress bars would interleave; one line per repo instead
+            return self.generate_report(
+                repo_name, start_date, end_date, show_progress=False
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, parallel_repos), thread_name_prefix="report-repo"
+        ) as executor:
+            futures = {executor.submit(fetch, repo): repo for repo in repo_names}
+            for future in as_completed(futures):
+                repo_name = futures[future]
+                try:
+                    repo_report = future.result()
+                    report.repositories[repo_name] = repo_report
+                    outcome = f"{repo_report.total_prs} PRs"
+                except Exception as e:
+                    report.failed_repositories[repo_name] = str(e)
+                    outcome = f"failed: {str(e)}"
+                done += 1
+                if show_progress:
+                    print(f"[{done}/{len(repo_names)}] {repo_name}: {outcome}")
+
+        # Keep the input order rather than completion order
+        report.repositories = {
+            repo: report.repositories[repo]
+            for repo in repo_names
+            if repo in report.repositories
+        }
+        report.rollup = self._rollup(name, report)
+        return report
+
+    def _rollup(self, name: str, report: OrganizationReport) -> RepositoryReport:
+        prs: List[PullRequest] = []
+        contributor_stats: Dict[str, ContributorStats] = {}
+        languages: Dict[str, int] = {}
+        missing_sections = set()
+
+        for repo_report in report.repositories.values():
+            prs.extend(repo_report.prs)
+            for language, size in repo_report.languages.items():
+                languages[language] = languages.get(language, 0) + size
+            for login, stats in repo_report.contributors.items():
+                merged = contributor_stats.setdefault(
+                    login, ContributorStats(login=login)
+                )
+                merged.commits += stats.commits
+                merged.additions += stats.additions
+                merged.deletions += stats.deletions
+            missing_sections.update(repo_report.missing_sections)
+        if report.failed_repositories:
+            missing_sections.add("failed_repositories")
+
+        # PR, review and initiative figures are recomputed over all PRs;
+        # commit totals come from the per-repo contributor statistics.
+        return self.report_generator.generate_report(
+            repo_name=name,
+            prs=prs,
+            period_start=report.period_start,
+            period_end=report.period_end,
+            contributor_stats=contributor_stats,
+            languages=languages,
+            missing_sections=sorted(missing_sections),
+        )
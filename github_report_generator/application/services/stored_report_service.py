@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from ...domain import ReportGenerator
+from ...domain.model import PullRequestState, RepositoryReport
+from ...infrastructure.github.timestamps import as_utc, utc_now
+from ...infrastructure.storage import SQLiteStore
+
+
+class StoredReportService:
+    """Builds reports from the local store without calling GitHub."""
+
+    def __init__(
+        self,
+        store: SQLiteStore,
+        initiative_patterns: Optional[Dict[str, str]] = None,
+        report_generator: Optional[ReportGenerator] = None,
+    ):
+        self.store = store
+        self.initiative_patterns = initiative_patterns
+        self.report_generator = report_generator
+
+    def is_fresh(
+        self, repo_name: str, start_date: datetime, max_age: Optional[timedelta]
+    ) -> bool:
+        """Whether the store was synced within ``max_age`` and covers
+        ``start_date``, so a report can skip GitHub altogether."""
+        if not max_age:
+            return False
+        sync_state = self.store.get_sync_state(repo_name)
+        if sync_state is None or sync_state.synced_at is None:
+            return False
+        if sync_state.covered_since and as_utc(start_date) < sync_state.covered_since:
+            return False
+        return utc_now() - sync_state.synced_at <= max_age
+
+    def generate_report(
+        self,
+        repo_name: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> RepositoryReport:
+        start_date, end_date = as_utc(start_date), as_utc(end_date)
+        sync_state = self.store.get_sync_state(repo_name)
+        if sync_state is None:
+            raise Exception(
+                f"No stored data for {repo_name}; sync it first "
+                "(e.g. with --incremental)"
+            )
+        if sync_state.covered_since and start_date < sync_state.covered_since:
+            print(
+                f"Warning: Stored pull requests for {repo_name} only cover "
+                f"updates since {sync_state.covered_since:%Y-%m-%d}"
+            )
+
+        prs = self.store.get_pull_requests(
+            repo_name, PullRequestState.ALL, start_date, end_date
+        )
+        report_gen = self.report_generator or ReportGenerator(
+            initiative_patterns=self.initiative_patterns
+        )
+        return report_gen.generate_report(
+            repo_name=repo_name,
+            prs=prs,
+            period_start=start_date,
+            period_end=end_date,
+            contributor_stats=self.store.get_contributor_stats(repo_name),
+            languages=self.store.get_languages(repo_name),
+        )
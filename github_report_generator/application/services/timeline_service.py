@@ -0,0 +1,102 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ...domain.model import PullRequest
+from ...infrastructure.github.github_client import GitHubClient
+from ...infrastructure.github.timestamps import parse_timestamp
+
+# Oldest commit, first "ready for review" and first review request of a PR.
+# Also spliced into the GraphQL engine's pull request query.
+TIMELINE_FIELDS = """
+  firstCommit: commits(first: 1) { nodes { commit { authoredDate committedDate } } }
+  readyForReview: timelineItems(itemTypes: [READY_FOR_REVIEW_EVENT], first: 1) {
+    nodes { ... on ReadyForReviewEvent { createdAt } }
+  }
+  reviewRequested: timelineItems(itemTypes: [REVIEW_REQUESTED_EVENT], first: 1) {
+    nodes { ... on ReviewRequestedEvent { createdAt } }
+  }
+"""
+
+
+class TimelineService:
+    """Adds first-commit, ready-for-review and review-request times to PRs.
+
+    REST has no cheap way to get these (commits plus the issue timeline per
+    PR), so they come from GraphQL, with one aliased ``pullRequest`` lookup
+    per PR and up to ``batch_size`` PRs per query. GraphQL needs a token;
+    without one the PRs are left as they are and reports fall back to
+    timing from PR creation.
+    """
+
+    DEFAULT_BATCH_SIZE = 50
+
+    def __init__(self, github_client: GitHubClient, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.github_client = github_client
+        self.batch_size = min(max(batch_size, 1), 100)
+
+    def add_timelines(self, repo_name: str, prs: List[PullRequest]) -> int:
+        """Fill the timeline fields of ``prs`` in place; returns how many
+        PRs were updated."""
+        if not self.github_client.token or not prs:
+            return 0
+
+        owner, name = repo_name.split("/", 1)
+        by_number = {pr.number: pr for pr in prs}
+        numbers = list(by_number)
+        updated = 0
+
+        for i in range(0, len(numbers), self.batch_size):
+            batch = numbers[i : i + self.batch_size]
+            try:
+                data = self.github_client.graphql(
+                    self._query(batch), {"owner": owner, "name": name}, partial=True
+                )
+            except Exception as e:
+                # Those PRs keep timing from creation; other batches may
+                # still succeed (a node limit or timeout hits one batch)
+                print(f"Warning: Error fetching PR timelines: {str(e)}")
+                continue
+
+            repository = data.get("repository") or {}
+            for number in batch:
+                node = repository.get(f"pr{number}")
+                if node:
+                    self.apply(by_number[number], node)
+                    updated += 1
+
+        return updated
+
+    @staticmethod
+    def _query(numbers: List[int]) -> str:
+        lookups = "\n".join(
+            f"    pr{number}: pullRequest(number: {number}) {{ ...Timeline }}"
+            for number in numbers
+        )
+        return (
+            "query($owner: String!, $name: String!) {\n"
+            "  repository(owner: $owner, name: $name) {\n"
+            f"{lookups}\n"
+            "  }\n"
+            "}\n"
+            f"fragment Timeline on PullRequest {{{TIMELINE_FIELDS}}}\n"
+        )
+
+    @staticmethod
+    def apply(pr: PullRequest, node: Dict[str, Any]) -> None:
+        """Copy the timeline fields of a GraphQL pull request node onto ``pr``."""
+        commits = (node.get("firstCommit") or {}).get("nodes") or []
+        if commits and commits[0].get("commit"):
+            commit = commits[0]["commit"]
+            # Rebased commits keep their original author date
+            dates = [
+                parse_timestamp(commit.get("authoredDate")),
+                parse_timestamp(commit.get("committedDate")),
+            ]
+            pr.first_commit_at = min((d for d in dates if d), default=None)
+        pr.ready_for_review_at = _first_event(node, "readyForReview")
+        pr.review_requested_at = _first_event(node, "reviewRequested")
+
+
+def _first_event(node: Dict[str, Any], alias: str) -> Optional[datetime]:
+    events = (node.get(alias) or {}).get("nodes") or []
+    return parse_timestamp(events[0].get("createdAt")) if events else None
@@ -0,0 +1,95 @@
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from ...infrastructure.github.github_client import GitHubClient
+from ...infrastructure.github.timestamps import utc_now
+from ...infrastructure.storage import SQLiteStore
+from .contributors_service import ContributorsService
+from .incremental_sync_service import IncrementalSyncService
+from .languages_service import LanguagesService
+from .pull_requests_service import PullRequestsService
+
+
+class WarmSyncService:
+    """Keeps the local store warm for a fixed list of repositories.
+
+    Every ``interval`` seconds each repository is synced incrementally (PRs
+    updated since the last round, with their reviews), together with its
+    contributor statistics and languages. Interactive reports reading the
+    same store then find fresh data and need not call GitHub at all (see
+    ``ReportService`` with ``max_age``). The rate budget the daemon may spend
+    is set on its client's ``RateLimitScheduler`` (``budget_share``).
+    """
+
+    DEFAULT_INTERVAL = 900.0
+    DEFAULT_DAYS = 90
+    DEFAULT_RATE_BUDGET = 0.5
+
+    def __init__(
+        self,
+        github_client: GitHubClient,
+        store: SQLiteStore,
+        repositories: List[str],
+        days: int = DEFAULT_DAYS,
+        interval: float = DEFAULT_INTERVAL,
+        concurrency: Optional[int] = None,
+    ):
+        self.github_client = github_client
+        self.store = store
+        self.repositories = list(dict.fromkeys(repositories))
+        self.days = days
+        self.interval = interval
+        self.prs_service = IncrementalSyncService(
+            PullRequestsService(github_client, concurrency=concurrency), store
+        )
+        self.contributors_service = ContributorsService(github_client, store)
+        self.languages_service = LanguagesService(github_client, store)
+
+    def sync_repository(self, repo_name: str) -> int:
+        """Sync one repository; returns the number of updated PRs fetched."""
+        start_date = utc_now() - timedelta(days=self.days)
+        stats_poll = self.contributors_service.start_contributor_stats(repo_name)
+        try:
+            self.prs_service.sync(repo_name, start_date, show_progress=False)
+            self.languages_service.get_repository_languages(repo_name)
+            # Nobody is waiting on the daemon; let the stats poll run to its
+            # deadline
+            stats_poll.result()
+        finally:
+            stats_poll.cancel()
+        return self.prs_service.last_sync_fetched
+
+    def run_once(self) -> Dict[str, Optional[str]]:
+        """Sync every repository once; maps each to its error, if any."""
+        errors: Dict[str, Optional[str]] = {}
+        for repo_name in self.repositories:
+            started = time.monotonic()
+            try:
+                fetched = self.sync_repository(repo_name)
+                errors[repo_name] = None
+                print(
+                    f"Synced {repo_name}: {fetched} updated PRs in "
+                    f"{time.monotonic() - started:.1f}s"
+                )
+            except Exception as e:
+                # One failing repository must not stop the others
+                errors[repo_name] = str(e)
+                print(f"Warning: Error syncing {repo_name}: {str(e)}")
+        return errors
+
+    def run(
+        self, stop: Optional[threading.Event] = None, rounds: Optional[int] = None
+    ) -> None:
+        """Sync on a schedule until ``stop`` is set (or after ``rounds``)."""
+        stop = stop or threading.Event()
+        completed = 0
+        while not stop.is_set():
+            started = time.monotonic()
+            self.run_once()
+            completed += 1
+            if rounds is not None and completed >= rounds:
+                return
+            # Rounds start every `interval` seconds, however long one took
+            stop.wait(max(self.interval - (time.monotonic() - started), 0.0))
@@ -0,0 +1,134 @@
+"""Background sync that keeps the local store warm for configured repositories.
+
+Reads the repository list and schedule from the ``sync`` section of the
+configuration file the CLI uses (``.github_report_config.yaml``):
+
+    sync:
+      repositories:
+        - owner/repo
+        - owner/other-repo
+      interval: 900      # seconds between sync rounds
+      days: 90           # history kept in the store
+      rate_budget: 0.5   # share of each token's hourly budget to spend
+
+and syncs them into the store at ``--cache-dir`` (or ``GITHUB_REPORT_STORE``):
+
+    python -m github_report_generator.application.sync_daemon --cache-dir ~/.cache/github-report
+
+CLI (``--incremental --max-age``), GUI and API reports (``GITHUB_REPORT_MAX_AGE``)
+over the same store are then built from it without calling GitHub.
+"""
+
+import argparse
+import os
+import signal
+import sys
+import threading
+
+from dotenv import load_dotenv
+
+from .cli import ReportCLI
+from .services.warm_sync_service import WarmSyncService
+from ..infrastructure.github import GitHubClient, HttpCache, RateLimitScheduler
+from ..infrastructure.storage import SQLiteStore
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Keep the local report store warm for configured repositories."
+    )
+    parser.add_argument(
+        "--config",
+        help="Path to configuration file",
+        default=".github_report_config.yaml",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.getenv("GITHUB_REPORT_STORE"),
+        help=(
+            "Directory of the local store (and persistent HTTP cache) "
+            "(default: GITHUB_REPORT_STORE)"
+        ),
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Sync every repository once and exit",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=0,
+        help="Maximum concurrent requests per repository (default: 0, sequential)",
+    )
+    return parser
+
+
+def main(args=None) -> int:
+    load_dotenv()
+    parser = _create_parser()
+    args = parser.parse_args(args)
+    if not args.cache_dir:
+        parser.error("--cache-dir (or GITHUB_REPORT_STORE) is required")
+
+    config = ReportCLI().load_config(args.config)
+    sync_config = config.get("sync") or {}
+    repositories = sync_config.get("repositories") or []
+    if not repositories:
+        print(
+            f"Error: no repositories under sync.repositories in {args.config}",
+            file=sys.stderr,
+        )
+        return 1
+
+    github_config = config.get("github") or {}
+    tokens = RateLimitScheduler.tokens_from_env(
+        os.getenv("GITHUB_TOKEN"), github_config.get("tokens")
+    )
+    # Keep the rest of each token's budget for interactive reports
+    rate_limiter = RateLimitScheduler(
+        tokens,
+        budget_share=float(
+            sync_config.get("rate_budget", WarmSyncService.DEFAULT_RATE_BUDGET)
+        ),
+    )
+    store = SQLiteStore(args.cache_dir)
+    # Unchanged contributor stats and languages come back as free 304s
+    http_cache = HttpCache(str(store.path.parent))
+    github = GitHubClient(
+        token=tokens[0] if tokens else None,
+        tokens=tokens,
+        http_cache=http_cache,
+        rate_limiter=rate_limiter,
+    )
+    service = WarmSyncService(
+        github,
+        store,
+        repositories,
+        days=int(sync_config.get("days", WarmSyncService.DEFAULT_DAYS)),
+        interval=float(sync_config.get("interval", WarmSyncService.DEFAULT_INTERVAL)),
+        concurrency=args.concurrency or None,
+    )
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        if args.once:
+            errors = service.run_once()
+            return 1 if any(errors.values()) else 0
+        print(
+            f"Syncing {len(service.repositories)} repositories every "
+            f"{service.interval:.0f}s into {store.path}"
+        )
+        service.run(stop)
+        return 0
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        github.close()
+        http_cache.close()
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
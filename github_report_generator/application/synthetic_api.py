@@ -0,0 +1,558 @@
+"""Synthetic stand-in for the parts of the GitHub REST API this tool uses.
+
+Serves seeded, deterministic repositories of any size (1k to 1M+ pull
+requests) with GitHub's pagination, rate limit headers, ETags and the 202
+warm-up of the statistics endpoints, so fetch throughput, rate limit handling
+and memory can be measured locally:
+
+    uvicorn github_report_generator.application.synthetic_api:app --port 8099
+    GITHUB_API_URL=http://127.0.0.1:8099 python -m github_report_generator.application.cli synthetic/repo-100000 --days 30
+
+A repository name ending in a number (``synthetic/repo-100000``) has that
+many pull requests; any other name gets ``SYNTHETIC_GITHUB_PRS`` (default
+1000). Items are generated on demand from the seed and the PR number, so a
+page costs the same for any repository size.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request, Response
+
+_MASK = 2**64 - 1
+_DAY = 24 * 60 * 60
+_WEEK = 7 * _DAY
+
+_LABELS = ["bug", "feature", "docs", "refactor", "test", "ci", "dependencies"]
+_BRANCH_KINDS = ["feature", "bugfix", "hotfix", "docs", "refactor", "test", "chore"]
+_REVIEW_STATES = ["APPROVED", "COMMENTED", "CHANGES_REQUESTED"]
+_LANGUAGES = ["Python", "TypeScript", "Go", "Rust", "Shell", "HTML", "Dockerfile"]
+_TEXT = (
+    "This change updates the implementation and adds coverage for the new "
+    "behaviour. It also cleans up a few related call sites and documents the "
+    "configuration options that were previously undocumented. "
+) * 16
+
+
+def _stable_hash(text: str) -> int:
+    # hash() of a str changes between processes; generated data must not
+    return int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+
+
+def _timestamp(seconds: float) -> str:
+    return datetime.fromtimestamp(int(seconds), timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+
+
+class SyntheticRepository:
+    """Deterministic pull request history of one synthetic repository.
+
+    PR numbers follow ``updated_at``, so listing by update time (what the
+    report uses) is a range of numbers and never needs sorting. Only
+    state-filtered listings build an index, once per repository and state.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        pull_requests: int,
+        seed: int,
+        anchor: float,
+        span_days: int = 3 * 365,
+    ):
+        self.name = name
+        self.size = max(0, pull_requests)
+        self.seed = seed
+        self.anchor = anchor
+        self.step = span_days * _DAY / max(self.size, 1)
+        self.contributors = max(5, min(500, self.size // 50))
+        self._name_hash = _stable_hash(name)
+        self._by_state: Dict[str, array] = {}
+        self._lock = threading.Lock()
+
+    def _unit(self, number: int, salt: int) -> float:
+        # splitmix64 of (seed, repo, number, salt) mapped to [0, 1)
+        x = (
+            self.seed * 0x9E3779B97F4A7C15
+            + number * 0xBF58476D1CE4E5B9
+            + salt * 0x94D049BB133111EB
+            + self._name_hash
+        ) & _MASK
+        x ^= x >> 30
+        x = (x * 0xBF58476D1CE4E5B9) & _MASK
+        x ^= x >> 27
+        x = (x * 0x94D049BB133111EB) & _MASK
+        x ^= x >> 31
+        return x / 2**64
+
+    def _rng(self, number: int, salt: int) -> random.Random:
+        return random.Random(int(self._unit(number, salt) * 2**53))
+
+    def updated_at(self, number: int) -> float:
+        return (
+            self.anchor
+            - (self.size - number) * self.step
+            - self._unit(number, 0) * self.step * 0.5
+        )
+
+    def timeline(self, number: int) -> Tuple[float, float]:
+        """(created_at, updated_at) as epoch seconds."""
+        updated = self.updated_at(number)
+        lifetime = self._rng(number, 10).expovariate(1 / (3 * _DAY))
+        return updated - min(lifetime, 60 * _DAY), updated
+
+    def state(self, number: int) -> Tuple[str, bool]:
+        """(state, merged); recent PRs are far more likely to be open."""
+        age = self.anchor - self.updated_at(number)
+        p_open = 0.3 if age < 14 * _DAY else 0.08 if age < 90 * _DAY else 0.01
+        if self._unit(number, 1) < p_open:
+            return "open", False
+        return "closed", self._unit(number, 2) < 0.7
+
+    def numbers(self, state: str) -> Any:
+        """PR numbers with the given list state, newest first."""
+        if state == "all":
+            return range(self.size, 0, -1)
+        with self._lock:
+            if state not in self._by_state:
+                self._by_state[state] = array(
+                    "l",
+                    (
+                        n
+                        for n in range(self.size, 0, -1)
+                        if self.state(n)[0] == state
+                    ),
+                )
+            return self._by_state[state]
+
+    def author(self, number: int) -> str:
+        # Zipf-like: a few authors open most PRs
+        rank = int(self._rng(number, 3).paretovariate(1.2)) - 1
+        return f"user{rank % self.contributors}"
+
+    def pull_request(self, number: int, base_url: str) -> Dict[str, Any]:
+        rng = self._rng(number, 4)
+        created, updated = self.timeline(number)
+        state, merged = self.state(number)
+        closed = updated if state == "closed" else None
+        kind = rng.choice(_BRANCH_KINDS)
+        login = self.author(number)
+        url = f"{base_url}/repos/{self.name}/pulls/{number}"
+        return {
+            "url": url,
+            "id": number * 1000 + 7,
+            "node_id": f"PR_{number:x}",
+            "html_url": f"https://github.com/{self.name}/pull/{number}",
+            "diff_url": f"https://github.com/{self.name}/pull/{number}.diff",
+            "number": number,
+            "state": state,
+            "locked": False,
+            "title": f"{kind.capitalize()}: change #{number}",
+            "user": {
+                "login": login,
+                "id": _stable_hash(login) & 0xFFFFFF,
+                "avatar_url": f"https://avatars.example.com/{login}",
+                "type": "User",
+            },
+            "body": _TEXT[: rng.randint(0, len(_TEXT))],
+            "labels": [
+                {"id": _LABELS.index(name) + 1, "name": name, "color": "ededed"}
+                for name in rng.sample(_LABELS, rng.choice([0, 0, 1, 1, 2]))
+            ],
+            "created_at": _timestamp(created),
+            "updated_at": _timestamp(updated),
+            "closed_at": _timestamp(closed) if closed else None,
+            "merged_at": _timestamp(closed) if closed and merged else None,
+            "draft": False,
+            "head": {
+                "label": f"{login}:{kind}/change-{number}",
+                "ref": f"{kind}/change-{number}",
+                "sha": f"{self._rng(number, 5).getrandbits(160):040x}",
+            },
+            "base": {"label": "main", "ref": "main"},
+            "review_comments_url": f"{url}/comments",
+            "commits_url": f"{url}/commits",
+        }
+
+    def pull_request_details(self, number: int, base_url: str) -> Dict[str, Any]:
+        pr = self.pull_request(number, base_url)
+        rng = self._rng(number, 6)
+        additions = min(int(rng.paretovariate(1.1) * 10), 20000)
+        pr.update(
+            {
+                "merged": pr["merged_at"] is not None,
+                "mergeable": pr["state"] == "open" or None,
+                "additions": additions,
+                "deletions": int(additions * rng.random()),
+                "changed_files": max(1, min(additions // 25, 300)),
+                "commits": rng.randint(1, 12),
+                "comments": int(rng.expovariate(0.5)),
+                "review_comments": int(rng.expovariate(0.3)),
+            }
+        )
+        return pr
+
+    def reviews(self, number: int) -> List[Dict[str, Any]]:
+        rng = self._rng(number, 7)
+        start, end = self.timeline(number)
+        reviews = []
+        for index in range(min(int(rng.expovariate(0.6)), 40)):
+            reviewer = f"user{rng.randrange(self.contributors)}"
+            reviews.append(
+                {
+                    "id": number * 100 + index,
+                    "user": {"login": reviewer, "type": "User"},
+                    "body": "",
+                    "state": rng.choice(_REVIEW_STATES),
+                    "submitted_at": _timestamp(start + (end - start) * rng.random()),
+                }
+            )
+        reviews.sort(key=lambda r: r["submitted_at"])
+        return reviews
+
+    def contributor_stats(self) -> List[Dict[str, Any]]:
+        # GitHub reports at most the top 100 contributors
+        first_week = int(self.anchor // _WEEK) * _WEEK - 51 * _WEEK
+        stats = []
+        for index in range(min(self.contributors, 100)):
+            rng = self._rng(index, 8)
+            weeks = []
+            for week in range(52):
+                commits = int(rng.expovariate(1 / max(self.size / 5000, 0.5)))
+                weeks.append(
+                    {
+                        "w": first_week + week * _WEEK,
+                        "a": commits * rng.randint(5, 80),
+                        "d": commits * rng.randint(1, 40),
+                        "c": commits,
+                    }
+                )
+            stats.append(
+                {
+                    "author": {"login": f"user{index}", "type": "User"},
+                    "total": sum(week["c"] for week in weeks),
+                    "weeks": weeks,
+                }
+            )
+        return stats
+
+    def languages(self) -> Dict[str, int]:
+        rng = self._rng(0, 9)
+        names = rng.sample(_LANGUAGES, rng.randint(1, 4))
+        return {name: rng.randint(1000, 5_000_000) for name in names}
+
+
+class SyntheticGitHub:
+    """Server state: repositories, rate limit buckets and warm-up counters."""
+
+    DEFAULT_PULL_REQUESTS = 1000
+    ANONYMOUS_RATE_LIMIT = 60
+
+    def __init__(
+        self,
+        seed: int = 42,
+        default_pull_requests: int = DEFAULT_PULL_REQUESTS,
+        rate_limit: int = 5000,
+        rate_limit_window: int = 60 * 60,
+        secondary_limit: Optional[int] = None,
+        warmup_requests: int = 1,
+        latency: float = 0.0,
+        anchor: Optional[float] = None,
+    ):
+        self.seed = seed
+        self.default_pull_requests = default_pull_requests
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        # Requests per second per client before a secondary rate limit 403
+        self.secondary_limit = secondary_limit
+        # How many statistics requests are answered with 202 first
+        self.warmup_requests = warmup_requests
+        self.latency = latency
+        self.anchor = anchor if anchor is not None else time.time()
+
+        self._repositories: Dict[str, SyntheticRepository] = {}
+        self._buckets: Dict[str, List[float]] = {}  # client -> [used, reset_at]
+        self._recent: Dict[str, List[float]] = {}  # client -> request times
+        self._warmups: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def repository(self, owner: str, repo: str) -> SyntheticRepository:
+        name = f"{owner}/{repo}"
+        with self._lock:
+            if name not in self._repositories:
+                match = re.search(r"(\d+)$", repo)
+                size = int(match.group(1)) if match else self.default_pull_requests
+                self._repositories[name] = SyntheticRepository(
+                    name, size, self.seed, self.anchor
+                )
+            return self._repositories[name]
+
+    def warmed_up(self, name: str) -> bool:
+        with self._lock:
+            seen = self._warmups.get(name, 0)
+            self._warmups[name] = seen + 1
+            return seen >= self.warmup_requests
+
+    def _client(self, request: Request) -> Tuple[str, int]:
+        auth = request.headers.get("Authorization")
+        if auth:
+            return auth, self.rate_limit
+        host = request.client.host if request.client else "unknown"
+        return f"anonymous:{host}", self.ANONYMOUS_RATE_LIMIT
+
+    def _rate_limit_headers(self, client: str, limit: int) -> Dict[str, str]:
+        used, reset_at = self._buckets[client]
+        return {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(max(limit - int(used), 0)),
+            "X-RateLimit-Used": str(int(used)),
+            "X-RateLimit-Reset": str(int(reset_at)),
+            "X-RateLimit-Resource": "core",
+        }
+
+    def respond(
+        self,
+        request: Request,
+        payload: Callable[[], Any],
+        links: Optional[Callable[[], Dict[str, str]]] = None,
+        status_code: int = 200,
+    ) -> Response:
+        client, limit = self._client(request)
+        now = time.time()
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None or bucket[1] <= now:
+                bucket = self._buckets[client] = [0, now + self.rate_limit_window]
+
+            if self.secondary_limit is not None:
+                recent = [t for t in self._recent.get(client, []) if t > now - 1]
+                self._recent[client] = recent
+                if len(recent) >= self.secondary_limit:
+                    return self._json(
+                        403,
+                        {"message": "You have exceeded a secondary rate limit."},
+                        {"Retry-After": "1", **self._rate_limit_headers(client, limit)},
+                    )
+                recent.append(now)
+
+            if bucket[0] >= limit:
+                return self._json(
+                    403,
+                    {"message": f"API rate limit exceeded for {client[:12]}..."},
+                    self._rate_limit_headers(client, limit),
+                )
+
+        body = json.dumps(payload(), separators=(",", ":")).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        with self._lock:
+            # Like GitHub, a 304 for a conditional request is free
+            not_modified = (
+                status_code == 200 and request.headers.get("If-None-Match") == etag
+            )
+            if not not_modified:
+                bucket[0] += 1
+            headers = self._rate_limit_headers(client, limit)
+
+        if status_code == 200:
+            headers["ETag"] = etag
+        if links:
+            link_header = ", ".join(
+                f'<{url}>; rel="{rel}"' for rel, url in links().items()
+            )
+            if link_header:
+                headers["Link"] = link_header
+        if not_modified:
+            return Response(status_code=304, headers=headers)
+        return Response(
+            body, status_code, headers=headers, media_type="application/json"
+        )
+
+    @staticmethod
+    def _json(status_code: int, payload: Any, headers: Dict[str, str]) -> Response:
+        return Response(
+            json.dumps(payload),
+            status_code,
+            headers=headers,
+            media_type="application/json",
+        )
+
+    def rate_limit_status(self, request: Request) -> Dict[str, Any]:
+        client, limit = self._client(request)
+        with self._lock:
+            used, reset_at = self._buckets.get(
+                client, [0, time.time() + self.rate_limit_window]
+            )
+        core = {
+            "limit": limit,
+            "used": int(used),
+            "remaining": max(limit - int(used), 0),
+            "reset": int(reset_at),
+        }
+        return {"resources": {"core": core}, "rate": core}
+
+
+def _pagination_links(
+    request: Request, page: int, per_page: int, total: int
+) -> Dict[str, str]:
+    last = max((total + per_page - 1) // per_page, 1)
+
+    def page_url(number: int) -> str:
+        params = dict(request.query_params)
+        params.update(page=str(number), per_page=str(per_page))
+        return str(request.url.replace_query_params(**params))
+
+    links = {}
+    if page < last:
+        links["next"] = page_url(page + 1)
+        links["last"] = page_url(last)
+    if page > 1:
+        links["first"] = page_url(1)
+        links["prev"] = page_url(min(page - 1, last))
+    return links
+
+
+def _page_bounds(page: int, per_page: int) -> Tuple[int, int, int]:
+    page = max(page, 1)
+    per_page = min(max(per_page, 1), 100)
+    return page, per_page, (page - 1) * per_page
+
+
+def _base_url(request: Request) -> str:
+    return str(request.base_url).rstrip("/")
+
+
+def create_app(github: Optional[SyntheticGitHub] = None) -> FastAPI:
+    github = github or SyntheticGitHub()
+    app = FastAPI(title="Synthetic GitHub API")
+    app.state.github = github
+
+    if github.latency > 0:
+
+        @app.middleware("http")
+        async def simulate_latency(request: Request, call_next):
+            await asyncio.sleep(github.latency)
+            return await call_next(request)
+
+    @app.get("/rate_limit")
+    async def rate_limit(request: Request):
+        return github.rate_limit_status(request)
+
+    @app.get("/repos/{owner}/{repo}/pulls")
+    def list_pull_requests(
+        request: Request,
+        owner: str,
+        repo: str,
+        state: str = "open",
+        direction: str = "desc",
+        page: int = 1,
+        per_page: int = 30,
+    ):
+        repository = github.repository(owner, repo)
+        # Sorted by update time; with numbers following updated_at,
+        # sort=created gives the same order here.
+        numbers = repository.numbers(state if state in ("open", "closed") else "all")
+        page, per_page, offset = _page_bounds(page, per_page)
+        total = len(numbers)
+
+        def payload():
+            if direction == "asc":
+                selected = [
+                    numbers[total - 1 - i]
+                    for i in range(offset, min(offset + per_page, total))
+                ]
+            else:
+                selected = numbers[offset : offset + per_page]
+            base_url = _base_url(request)
+            return [repository.pull_request(n, base_url) for n in selected]
+
+        return github.respond(
+            request, payload, lambda: _pagination_links(request, page, per_page, total)
+        )
+
+    @app.get("/repos/{owner}/{repo}/pulls/{number}")
+    def get_pull_request(request: Request, owner: str, repo: str, number: int):
+        repository = github.repository(owner, repo)
+        if not 1 <= number <= repository.size:
+            return _not_found(github, request)
+        return github.respond(
+            request,
+            lambda: repository.pull_request_details(number, _base_url(request)),
+        )
+
+    @app.get("/repos/{owner}/{repo}/pulls/{number}/reviews")
+    def list_reviews(
+        request: Request,
+        owner: str,
+        repo: str,
+        number: int,
+        page: int = 1,
+        per_page: int = 30,
+    ):
+        repository = github.repository(owner, repo)
+        if not 1 <= number <= repository.size:
+            return _not_found(github, request)
+        reviews = repository.reviews(number)
+        page, per_page, offset = _page_bounds(page, per_page)
+        return github.respond(
+            request,
+            lambda: reviews[offset : offset + per_page],
+            lambda: _pagination_links(request, page, per_page, len(reviews)),
+        )
+
+    @app.get("/repos/{owner}/{repo}/stats/contributors")
+    def contributor_stats(request: Request, owner: str, repo: str):
+        repository = github.repository(owner, repo)
+        if not github.warmed_up(repository.name):
+            # GitHub computes statistics in the background and answers 202
+            # until they are ready
+            return github.respond(request, lambda: {}, status_code=202)
+        return github.respond(request, repository.contributor_stats)
+
+    @app.get("/repos/{owner}/{repo}/languages")
+    def languages(request: Request, owner: str, repo: str):
+        repository = github.repository(owner, repo)
+        return github.respond(request, repository.languages)
+
+    return app
+
+
+def _not_found(github: SyntheticGitHub, request: Request) -> Response:
+    return github.respond(
+        request,
+        lambda: {
+            "message": "Not Found",
+            "documentation_url": "https://docs.github.com/rest",
+        },
+        status_code=404,
+    )
+
+
+def _app_from_env() -> FastAPI:
+    secondary_limit = os.getenv("SYNTHETIC_GITHUB_SECONDARY_LIMIT")
+    return create_app(
+        SyntheticGitHub(
+            seed=int(os.getenv("SYNTHETIC_GITHUB_SEED", "42")),
+            default_pull_requests=int(
+                os.getenv(
+                    "SYNTHETIC_GITHUB_PRS", str(SyntheticGitHub.DEFAULT_PULL_REQUESTS)
+                )
+            ),
+            rate_limit=int(os.getenv("SYNTHETIC_GITHUB_RATE_LIMIT", "5000")),
+            secondary_limit=int(secondary_limit) if secondary_limit else None,
+            warmup_requests=int(os.getenv("SYNTHETIC_GITHUB_WARMUP_REQUESTS", "1")),
+            latency=float(os.getenv("SYNTHETIC_GITHUB_LATENCY", "0")),
+        )
+    )
+
+
+app = _app_from_env()
@@ -1,18 +1,24 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 
 def calculate_date_range(args) -> tuple[datetime, datetime]:
+    # Aware UTC, like the PR timestamps the range is compared with
     if getattr(args, "days", None):
-        end_date = datetime.now()
+        end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=args.days)
     else:
+        # The current month and year default to UTC too, so the month is the
+        # same as the one the bounds are built in
+        now = datetime.now(timezone.utc)
+        year = getattr(args, "year", None) or now.year
+        month = getattr(args, "month", None) or now.month
         # First day of the specified month/year
-        start_date = datetime(args.year, args.month, 1)
+        start_date = datetime(year, month, 1, tzinfo=timezone.utc)
         # First day of the next month
-        if args.month == 12:
-            end_date = datetime(args.year + 1, 1, 1)
+        if month == 12:
+            end_date = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
         else:
-            end_date = datetime(args.year, args.month + 1, 1)
+            end_date = datetime(year, month + 1, 1, tzinfo=timezone.utc)
 
     if getattr(args, "debug", False):
         print(f"Date range: {start_date} to {end_date}")
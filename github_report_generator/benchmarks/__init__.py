@@ -0,0 +1 @@
+"""Benchmarks of internal hot paths, runnable with ``python -m``."""
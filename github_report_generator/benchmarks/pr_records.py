@@ -0,0 +1,129 @@
+"""Construction cost and memory of internal pull request objects.
+
+Compares validated ``PullRequest`` models (what every fetched PR used to
+be), ``model_construct`` and the slotted ``PullRequestRecord`` used now,
+plus the one-off validation of records when a report is serialized:
+
+    python -m github_report_generator.benchmarks.pr_records --prs 100000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from ..domain.model import (
+    PullRequest,
+    PullRequestRecord,
+    PullRequestState,
+    ReviewMetrics,
+    ReviewMetricsRecord,
+)
+
+_START = datetime(2024, 1, 1)
+
+
+def _fields(i: int) -> Dict[str, Any]:
+    """Already-parsed fields of a PR, as the services have them."""
+    created_at = _START + timedelta(minutes=7 * i)
+    return dict(
+        number=i,
+        title=f"Change number {i}",
+        state=PullRequestState.MERGED,
+        author=f"user{i % 50}",
+        created_at=created_at,
+        updated_at=created_at + timedelta(hours=30),
+        closed_at=created_at + timedelta(hours=30),
+        merged_at=created_at + timedelta(hours=30),
+        additions=i % 500,
+        deletions=i % 90,
+        changed_files=3,
+        comments=1,
+        review_comments=2,
+        commits=4,
+        branch=f"feature/topic-{i % 30}",
+        labels=["enhancement"],
+        reviewers=[f"user{(i + 1) % 50}", f"user{(i + 2) % 50}"],
+    )
+
+
+def _review_fields(i: int) -> Dict[str, Any]:
+    return dict(
+        time_to_first_review=float(i % 24),
+        time_to_approval=float(i % 48),
+        number_of_reviewers=2,
+        number_of_comments=i % 5,
+        number_of_review_rounds=1,
+    )
+
+
+BUILDERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], Any]] = {
+    "validated": lambda pr, review: PullRequest(
+        **pr, review_metrics=ReviewMetrics(**review)
+    ),
+    "model_construct": lambda pr, review: PullRequest.model_construct(
+        **pr, review_metrics=ReviewMetrics.model_construct(**review)
+    ),
+    "record": lambda pr, review: PullRequestRecord(
+        **pr, review_metrics=ReviewMetricsRecord(**review)
+    ),
+}
+
+
+def _inputs(count: int) -> List[tuple]:
+    # Fresh lists per PR, as parsing a response would give
+    return [(_fields(i), _review_fields(i)) for i in range(count)]
+
+
+def measure(name: str, count: int) -> Dict[str, float]:
+    """Microseconds and bytes per PR of building ``count`` PRs with ``name``."""
+    build = BUILDERS[name]
+
+    inputs = _inputs(count)
+    gc.collect()
+    started = time.perf_counter()
+    prs = [build(pr, review) for pr, review in inputs]
+    elapsed = time.perf_counter() - started
+    del prs
+
+    # Memory in a separate run: tracing slows construction down several times
+    inputs = _inputs(count)
+    gc.collect()
+    tracemalloc.start()
+    prs = [build(pr, review) for pr, review in inputs]
+    # Only what building allocated is traced: the parsed values were made
+    # before tracing and are shared, as they are when parsing a response
+    del inputs
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del prs
+    return {"us_per_pr": elapsed / count * 1e6, "bytes_per_pr": size / count}
+
+
+def measure_validation(count: int) -> float:
+    """Microseconds per PR of validating records into models on output."""
+    records = [BUILDERS["record"](pr, review) for pr, review in _inputs(count)]
+    started = time.perf_counter()
+    for record in records:
+        record.to_model()
+    return (time.perf_counter() - started) / count * 1e6
+
+
+def main(args=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prs", type=int, default=50000, help="PRs to build")
+    args = parser.parse_args(args)
+
+    print(f"{args.prs} pull requests")
+    print(f"{'':<16}{'us/PR':>10}{'bytes/PR':>12}")
+    for name in BUILDERS:
+        result = measure(name, args.prs)
+        print(f"{name:<16}{result['us_per_pr']:>10.2f}{result['bytes_per_pr']:>12.0f}")
+    print(f"{'validated()':<16}{measure_validation(args.prs):>10.2f}{'':>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,12 @@ from .model.models import (
     ContributorStats,
     InitiativeStats,
     RepositoryReport,
+    OrganizationReport,
     WeeklyMetrics,
     ReviewMetrics
 )
+from .model.records import PullRequestRecord, ReviewMetricsRecord
+from .service.pr_table import PullRequestTable
 from .service.report_generator import ReportGenerator
 from .service.velocity import create_velocity_charts
 
@@ -18,8 +21,12 @@ __all__ = [
     'ContributorStats',
     'InitiativeStats',
     'RepositoryReport',
+    'OrganizationReport',
     'WeeklyMetrics',
     'ReviewMetrics',
+    'PullRequestRecord',
+    'ReviewMetricsRecord',
+    'PullRequestTable',
     'ReportGenerator',
     'create_velocity_charts'
 ]
@@ -1,18 +1,32 @@
 import threading
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Callable
 
 from ...infrastructure.github.github_client import GitHubClient
 from ...application.services.pull_requests_service import PullRequestsService
 from ...application.services.contributors_service import ContributorsService
 from ...application.services.languages_service import LanguagesService
+from ...application.services.incremental_sync_service import IncrementalSyncService
+from ...application.services.stored_report_service import StoredReportService
+from ...infrastructure.storage import SQLiteStore
 from ..service.report_generator import ReportGenerator
 from ...infrastructure.error.error_handler import ErrorHandler
 
 
 class ReportManager:
-    def __init__(self, progress_manager):
+    def __init__(
+        self,
+        progress_manager,
+        store: Optional[SQLiteStore] = None,
+        max_age: Optional[timedelta] = None,
+    ):
         self.progress_manager = progress_manager
+        # Optional local store: fetched data is synced into it incrementally,
+        # and offline reports are built from it alone
+        self.store = store
+        # Repositories synced within max_age (e.g. by the sync daemon) are
+        # reported from the store without calling GitHub
+        self.max_age = max_age
         self.report = None
 
     def generate_report(
@@ -22,6 +36,7 @@ class ReportManager:
         token: Optional[str],
         on_complete: Callable,
         on_error: Optional[Callable] = None,
+        offline: bool = False,
     ) -> None:
         def run_report():
             try:
@@ -34,6 +49,27 @@ class ReportManager:
                 )
                 self.progress_manager.update_progress(0)
 
+                if offline and self.store is None:
+                    raise Exception("No local store configured for offline reports")
+                end_date = datetime.now(timezone.utc)
+                start_date = end_date - timedelta(days=days)
+                if offline or (
+                    self.store is not None
+                    and StoredReportService(self.store).is_fresh(
+                        repo_name, start_date, self.max_age
+                    )
+                ):
+                    self.progress_manager.update_status("Reading stored data...")
+                    self.progress_manager.update_progress(50)
+                    self.report = StoredReportService(self.store).generate_report(
+                        repo_name, start_date, end_date
+                    )
+                    self.progress_manager.update_status("Report generated successfully")
+                    self.progress_manager.update_progress(100)
+                    self.progress_manager.hide_progress()
+                    on_complete()
+                    return
+
                 # Initialize client
                 client = GitHubClient(token=token)
 
@@ -41,29 +77,39 @@ class ReportManager:
                 self.progress_manager.update_status("Calculating date range...")
                 self.progress_manager.update_progress(20)
 
-                end_date = datetime.now()
-                start_date = end_date - timedelta(days=days)
-
                 # Initialize services
                 prs_service = PullRequestsService(client)
-                contrib_service = ContributorsService(client)
-                lang_service = LanguagesService(client)
+                if self.store is not None:
+                    prs_service = IncrementalSyncService(prs_service, self.store)
+                contrib_service = ContributorsService(client, self.store)
+                lang_service = LanguagesService(client, self.store)
+
+                # Contributor stats are polled while the PRs are fetched
+                stats_poll = contrib_service.start_contributor_stats(repo_name)
 
                 # Get repository data
                 self.progress_manager.update_status("Fetching pull requests...")
                 self.progress_manager.update_progress(30)
-                prs = prs_service.get_pull_requests(
-                    repo_name, start_date=start_date, end_date=end_date
+                try:
+                    prs = prs_service.get_pull_requests(
+                        repo_name, start_date=start_date, end_date=end_date
+                    )
+
+                    self.progress_manager.update_status(
+                        "Fetching repository languages..."
+                    )
+                    self.progress_manager.update_progress(60)
+                    languages = lang_service.get_repository_languages(repo_name)
+
+                    self.progress_manager.update_status("Fetching contributor stats...")
+                    self.progress_manager.update_progress(70)
+                    contributor_stats = stats_poll.result(timeout=0)
+                finally:
+                    stats_poll.cancel()
+                missing_sections = (
+                    [] if contributor_stats is not None else ["contributor_stats"]
                 )
 
-                self.progress_manager.update_status("Fetching contributor stats...")
-                self.progress_manager.update_progress(50)
-                contributor_stats = contrib_service.get_contributor_stats(repo_name)
-
-                self.progress_manager.update_status("Fetching repository languages...")
-                self.progress_manager.update_progress(70)
-                languages = lang_service.get_repository_languages(repo_name)
-
                 # Generate report
                 self.progress_manager.update_status("Generating report...")
                 self.progress_manager.update_progress(80)
@@ -76,6 +122,7 @@ class ReportManager:
                     period_end=end_date,
                     contributor_stats=contributor_stats,
                     languages=languages,
+                    missing_sections=missing_sections,
                 )
 
                 # Complete
@@ -6,9 +6,11 @@ from .models import (
     ContributorStats,
     InitiativeStats,
     RepositoryReport,
+    OrganizationReport,
     WeeklyMetrics,
     ReviewMetrics
 )
+from .records import PullRequestRecord, ReviewMetricsRecord
 
 __all__ = [
     'PullRequest',
@@ -16,6 +18,9 @@ __all__ = [
     'ContributorStats',
     'InitiativeStats',
     'RepositoryReport',
+    'OrganizationReport',
     'WeeklyMetrics',
-    'ReviewMetrics'
+    'ReviewMetrics',
+    'PullRequestRecord',
+    'ReviewMetricsRecord'
 ]
@@ -1,8 +1,11 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
 class ReviewMetrics(BaseModel):
     time_to_first_review: Optional[float] = None  # in hours
     time_to_approval: Optional[float] = None  # in hours
@@ -52,6 +55,10 @@ class PullRequest(BaseModel):
     comments: int = 0
     review_comments: int = 0
     commits: int = 0
+    # From the PR timeline; None when unknown (e.g. fetched without a token)
+    first_commit_at: Optional[datetime] = None
+    ready_for_review_at: Optional[datetime] = None
+    review_requested_at: Optional[datetime] = None
     branch: str
     labels: List[str] = Field(default_factory=list)
     reviewers: List[str] = Field(default_factory=list)
@@ -75,7 +82,7 @@ class RepositoryReport(BaseModel):
     repo_name: str
     period_start: datetime
     period_end: datetime
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: datetime = Field(default_factory=_utc_now)
     
     # General statistics
     total_commits: int = 0
@@ -90,6 +97,8 @@ class RepositoryReport(BaseModel):
     prs: List[PullRequest] = Field(default_factory=list)
     median_lead_time: Optional[float] = None  # in hours
     median_cycle_time: Optional[float] = None  # in hours
+    median_coding_time: Optional[float] = None  # first commit to ready for review, in hours
+    median_review_wait_time: Optional[float] = None  # review requested to first review, in hours
     
     # Review statistics
     median_time_to_first_review: Optional[float] = None  # in hours
@@ -123,3 +132,43 @@ class RepositoryReport(BaseModel):
     
     # Highlights
     highlights: List[str] = Field(default_factory=list)
+
+    # Set when some data was not available in time (e.g. contributor
+    # statistics GitHub was still computing); lists the missing sections
+    partial: bool = False
+    missing_sections: List[str] = Field(default_factory=list)
+
+    def validated(self) -> "RepositoryReport":
+        """This report with its PRs validated into ``PullRequest`` models.
+
+        Reports are generated over unvalidated ``PullRequestRecord`` objects;
+        call this before the report leaves the process (JSON, API responses).
+        """
+        prs = [
+            pr if isinstance(pr, PullRequest)
+            else PullRequest.model_validate(pr, from_attributes=True)
+            for pr in self.prs
+        ]
+        return self.model_copy(update={"prs": prs})
+
+class OrganizationReport(BaseModel):
+    name: str  # organization, or a label for an explicit repository list
+    period_start: datetime
+    period_end: datetime
+    generated_at: datetime = Field(default_factory=_utc_now)
+
+    repositories: Dict[str, RepositoryReport] = Field(default_factory=dict)
+    # Repositories whose report failed, with the error
+    failed_repositories: Dict[str, str] = Field(default_factory=dict)
+
+    # All repositories as one: PRs, contributors and initiatives merged
+    rollup: Optional[RepositoryReport] = None
+
+    def validated(self) -> "OrganizationReport":
+        """This report with every repository report (and the rollup) validated."""
+        return self.model_copy(update={
+            "repositories": {
+                name: report.validated() for name, report in self.repositories.items()
+            },
+            "rollup": self.rollup.validated() if self.rollup else None,
+        })
@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import List, Optional
+
+from .models import PullRequest, PullRequestState
+
+
+class ReviewMetricsRecord:
+    """Unvalidated counterpart of ``ReviewMetrics`` (see ``PullRequestRecord``)."""
+
+    __slots__ = (
+        "time_to_first_review",
+        "time_to_approval",
+        "number_of_reviewers",
+        "number_of_comments",
+        "number_of_review_rounds",
+    )
+
+    def __init__(
+        self,
+        time_to_first_review: Optional[float] = None,
+        time_to_approval: Optional[float] = None,
+        number_of_reviewers: int = 0,
+        number_of_comments: int = 0,
+        number_of_review_rounds: int = 0,
+    ):
+        self.time_to_first_review = time_to_first_review
+        self.time_to_approval = time_to_approval
+        self.number_of_reviewers = number_of_reviewers
+        self.number_of_comments = number_of_comments
+        self.number_of_review_rounds = number_of_review_rounds
+
+
+class PullRequestRecord:
+    """Internal pull request, built from trusted data without validation.
+
+    Has the attributes of the ``PullRequest`` model, kept in ``__slots__``:
+    no per-instance ``__dict__``, no field-set bookkeeping and no validation,
+    which adds up over the 100k+ PRs of a large report. GitHub responses and
+    the local store are parsed into records; they become validated
+    ``PullRequest`` models only when a report leaves the process (see
+    ``RepositoryReport.validated``).
+    """
+
+    __slots__ = (
+        "number",
+        "title",
+        "state",
+        "author",
+        "created_at",
+        "updated_at",
+        "closed_at",
+        "merged_at",
+        "additions",
+        "deletions",
+        "changed_files",
+        "comments",
+        "review_comments",
+        "commits",
+        "first_commit_at",
+        "ready_for_review_at",
+        "review_requested_at",
+        "branch",
+        "labels",
+        "reviewers",
+        "initiatives",
+        "review_metrics",
+        "size_category",
+    )
+
+    def __init__(
+        self,
+        number: int,
+        title: str,
+        state: PullRequestState,
+        author: str,
+        created_at: datetime,
+        updated_at: datetime,
+        branch: str,
+        closed_at: Optional[datetime] = None,
+        merged_at: Optional[datetime] = None,
+        additions: int = 0,
+        deletions: int = 0,
+        changed_files: int = 0,
+        comments: int = 0,
+        review_comments: int = 0,
+        commits: int = 0,
+        first_commit_at: Optional[datetime] = None,
+        ready_for_review_at: Optional[datetime] = None,
+        review_requested_at: Optional[datetime] = None,
+        labels: Optional[List[str]] = None,
+        reviewers: Optional[List[str]] = None,
+        initiatives: Optional[List[str]] = None,
+        review_metrics: Optional[ReviewMetricsRecord] = None,
+        size_category: str = "medium",
+    ):
+        self.number = number
+        self.title = title
+        self.state = state
+        self.author = author
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.closed_at = closed_at
+        self.merged_at = merged_at
+        self.additions = additions
+        self.deletions = deletions
+        self.changed_files = changed_files
+        self.comments = comments
+        self.review_comments = review_comments
+        self.commits = commits
+        self.first_commit_at = first_commit_at
+        self.ready_for_review_at = ready_for_review_at
+        self.review_requested_at = review_requested_at
+        self.branch = branch
+        self.labels = labels if labels is not None else []
+        self.reviewers = reviewers if reviewers is not None else []
+        self.initiatives = initiatives if initiatives is not None else []
+        self.review_metrics = (
+            review_metrics if review_metrics is not None else ReviewMetricsRecord()
+        )
+        self.size_category = size_category
+
+    def __repr__(self) -> str:
+        return f"PullRequestRecord(number={self.number!r}, title={self.title!r})"
+
+    def to_model(self) -> PullRequest:
+        """The validated ``PullRequest`` model of this record."""
+        return PullRequest.model_validate(self, from_attributes=True)
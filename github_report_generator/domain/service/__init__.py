@@ -1,6 +1,7 @@
 """Domain services implementing core business logic."""
 
+from .pr_table import PullRequestTable
 from .report_generator import ReportGenerator
 from .velocity import create_velocity_charts
 
-__all__ = ['ReportGenerator', 'create_velocity_charts']
+__all__ = ['PullRequestTable', 'ReportGenerator', 'create_velocity_charts']
@@ -0,0 +1,190 @@
+import math
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from ..model.models import PullRequest, PullRequestState
+
+# State codes of the `state` column
+OPEN, CLOSED, MERGED = 0, 1, 2
+STATE_CODES = {
+    PullRequestState.OPEN: OPEN,
+    PullRequestState.CLOSED: CLOSED,
+    PullRequestState.MERGED: MERGED,
+}
+
+# Upper bounds (inclusive) of the xs, s, m and l size categories; larger is xl
+SIZE_BOUNDS = np.array([10, 50, 250, 1000])
+SIZE_CATEGORIES = ("xs", "s", "m", "l", "xl")
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass
+class PullRequestTable:
+    """Columnar view of a list of pull requests for vectorized metrics.
+
+    Built once per report from the fetched ``PullRequest`` objects: one NumPy
+    array per field, row ``i`` being ``prs[i]``. Timestamps are epoch
+    seconds (NaN when unknown), states are ``STATE_CODES``, and logins,
+    branches and initiatives are dictionary encoded as indices into
+    ``logins``, ``branches`` and ``initiatives``. Reviewers are stored
+    flattened: ``reviewer[k]`` reviewed PR ``reviewer_pr[k]``.
+    """
+
+    number: np.ndarray
+    state: np.ndarray
+    author: np.ndarray
+    branch: np.ndarray
+    created: np.ndarray
+    merged: np.ndarray
+    closed: np.ndarray
+    first_commit: np.ndarray
+    ready_for_review: np.ndarray
+    review_requested: np.ndarray
+    additions: np.ndarray
+    deletions: np.ndarray
+    time_to_first_review: np.ndarray
+    time_to_approval: np.ndarray
+    number_of_reviewers: np.ndarray
+    number_of_comments: np.ndarray
+    reviewer: np.ndarray
+    reviewer_pr: np.ndarray
+    # Logins in order of first appearance (each PR's author, then reviewers)
+    logins: List[str] = field(default_factory=list)
+    branches: List[str] = field(default_factory=list)
+    initiatives: List[str] = field(default_factory=list)
+    # branch_initiatives[b, j]: branch b matches initiative j
+    branch_initiatives: np.ndarray = field(
+        default_factory=lambda: np.zeros((0, 0), dtype=bool)
+    )
+
+    @classmethod
+    def from_pull_requests(
+        cls,
+        prs: Sequence[PullRequest],
+        initiative_patterns: Optional[Dict[str, str]] = None,
+    ) -> "PullRequestTable":
+        count = len(prs)
+
+        login_ids: Dict[str, int] = {}
+        branch_ids: Dict[str, int] = {}
+        author, branch, reviewer, reviewer_pr = [], [], [], []
+        # The only per-PR Python loop; dictionary encoding needs it anyway
+        for i, pr in enumerate(prs):
+            author.append(login_ids.setdefault(pr.author, len(login_ids)))
+            branch.append(branch_ids.setdefault(pr.branch, len(branch_ids)))
+            for login in pr.reviewers:
+                reviewer.append(login_ids.setdefault(login, len(login_ids)))
+                reviewer_pr.append(i)
+
+        review_metrics = list(map(attrgetter("review_metrics"), prs))
+        branches = list(branch_ids)
+        initiatives = list(initiative_patterns or {})
+        # Patterns are matched once per distinct branch, not once per PR
+        branch_mask = np.array(
+            [
+                [
+                    re.match(pattern, name.lower(), re.IGNORECASE) is not None
+                    for pattern in (initiative_patterns or {}).values()
+                ]
+                for name in branches
+            ],
+            dtype=bool,
+        ).reshape(len(branches), len(initiatives))
+
+        return cls(
+            number=_ints(prs, "number", count),
+            state=np.fromiter(
+                (STATE_CODES.get(state, OPEN) for state in map(attrgetter("state"), prs)),
+                dtype=np.int8,
+                count=count,
+            ),
+            author=np.array(author, dtype=np.int32),
+            branch=np.array(branch, dtype=np.int32),
+            created=_epoch_seconds(map(attrgetter("created_at"), prs)),
+            merged=_epoch_seconds(map(attrgetter("merged_at"), prs)),
+            closed=_epoch_seconds(map(attrgetter("closed_at"), prs)),
+            first_commit=_epoch_seconds(map(attrgetter("first_commit_at"), prs)),
+            ready_for_review=_epoch_seconds(map(attrgetter("ready_for_review_at"), prs)),
+            review_requested=_epoch_seconds(map(attrgetter("review_requested_at"), prs)),
+            additions=_ints(prs, "additions", count),
+            deletions=_ints(prs, "deletions", count),
+            time_to_first_review=_floats(review_metrics, "time_to_first_review", count),
+            time_to_approval=_floats(review_metrics, "time_to_approval", count),
+            number_of_reviewers=_ints(review_metrics, "number_of_reviewers", count),
+            number_of_comments=_ints(review_metrics, "number_of_comments", count),
+            reviewer=np.array(reviewer, dtype=np.int32),
+            reviewer_pr=np.array(reviewer_pr, dtype=np.int32),
+            logins=list(login_ids),
+            branches=branches,
+            initiatives=initiatives,
+            branch_initiatives=branch_mask,
+        )
+
+    def __len__(self) -> int:
+        return len(self.number)
+
+    @property
+    def initiative_mask(self) -> np.ndarray:
+        """``initiative_mask[i, j]``: PR i matches initiative j."""
+        return self.branch_initiatives[self.branch]
+
+    @property
+    def is_merged(self) -> np.ndarray:
+        return (self.state == MERGED) & ~np.isnan(self.merged)
+
+    @property
+    def review_count(self) -> np.ndarray:
+        """Number of reviewers listed on each PR (``len(pr.reviewers)``)."""
+        return np.bincount(self.reviewer_pr, minlength=len(self))
+
+    def size_codes(self) -> np.ndarray:
+        """Index into ``SIZE_CATEGORIES`` of each PR's size."""
+        return np.searchsorted(SIZE_BOUNDS, self.additions + self.deletions)
+
+    def opened(self) -> np.ndarray:
+        """When each PR was opened for review: ready for review (drafts) or
+        creation."""
+        return np.where(np.isnan(self.ready_for_review), self.created, self.ready_for_review)
+
+    def lead_times(self) -> np.ndarray:
+        """Hours from the first commit (or creation, if earlier or unknown)
+        to merge; NaN for unmerged PRs."""
+        return hours_between(np.fmin(self.created, self.first_commit), self.merged)
+
+    def cycle_times(self) -> np.ndarray:
+        """Hours from being opened for review to merge; NaN for unmerged PRs."""
+        return hours_between(self.opened(), self.merged)
+
+
+def hours_between(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    # Negative spans (clock skew, rebased commits) count as zero; NaN stays NaN
+    return np.maximum((end - start) / 3600, 0.0)
+
+
+def _ints(items: Sequence, name: str, count: int) -> np.ndarray:
+    return np.fromiter(map(attrgetter(name), items), dtype=np.int64, count=count)
+
+
+def _floats(items: Sequence, name: str, count: int) -> np.ndarray:
+    # None becomes NaN
+    return np.array(list(map(attrgetter(name), items)), dtype=np.float64).reshape(count)
+
+
+def _epoch_seconds(values: Iterable[Optional[datetime]]) -> np.ndarray:
+    """Epoch seconds of naive (UTC) or aware datetimes; NaN for None."""
+    return np.fromiter(map(_seconds, values), dtype=np.float64)
+
+
+def _seconds(value: Optional[datetime]) -> float:
+    if value is None:
+        return math.nan
+    if value.tzinfo is None:
+        # Much cheaper than np.datetime64 conversion of datetime objects
+        return (value - _EPOCH).total_seconds()
+    return value.timestamp()
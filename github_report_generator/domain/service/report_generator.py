@@ -1,15 +1,23 @@
-import re
 from datetime import datetime
 from typing import Dict, List, Optional
-import statistics
+
+import numpy as np
 
 from ..model.models import (
     ContributorStats,
     InitiativeStats,
     PullRequest,
-    PullRequestState,
     RepositoryReport,
 )
+from .pr_table import (
+    CLOSED,
+    MERGED,
+    OPEN,
+    SIZE_CATEGORIES,
+    PullRequestTable,
+    hours_between,
+)
+from .velocity import calculate_weekly_metrics
 
 
 class ReportGenerator:
@@ -66,27 +74,6 @@ class ReportGenerator:
             "Experiments": r"^exp/|^experimental/",
         }
 
-    def _categorize_pr_size(self, pr: PullRequest) -> str:
-        """Categorize PR size based on total number of changes.
-
-        Size categories:
-        - xs: ≤ 10 changes
-        - s:  11-50 changes
-        - m:  51-250 changes
-        - l:  251-1000 changes
-        - xl: > 1000 changes
-        """
-        total_changes = pr.additions + pr.deletions
-        if total_changes <= 10:
-            return "xs"
-        elif total_changes <= 50:
-            return "s"
-        elif total_changes <= 250:
-            return "m"
-        elif total_changes <= 1000:
-            return "l"
-        return "xl"
-
     def generate_report(
         self,
         repo_name: str,
@@ -95,6 +82,7 @@ class ReportGenerator:
         period_end: datetime,
         contributor_stats: Optional[Dict[str, ContributorStats]] = None,
         languages: Optional[Dict[str, int]] = None,
+        missing_sections: Optional[List[str]] = None,
     ) -> RepositoryReport:
         """Generate a repository report for the given time period.
 
@@ -105,6 +93,8 @@ class ReportGenerator:
             period_end: End of the reporting period
             contributor_stats: Optional pre-fetched contributor statistics
             languages: Optional pre-fetched language statistics
+            missing_sections: Sections that could not be fetched in time
+                            (e.g. "contributor_stats"); marks the report partial
 
         Returns:
             RepositoryReport containing the analysis
@@ -114,8 +104,11 @@ class ReportGenerator:
             repo_name=repo_name, period_start=period_start, period_end=period_end
         )
 
-        # Process PRs to extract metrics
-        self._process_prs(report, prs)
+        # Process PRs to extract metrics; the metrics are computed over a
+        # columnar copy of the PRs
+        report.prs = prs
+        table = PullRequestTable.from_pull_requests(prs, self.initiative_patterns)
+        self._process_prs(report, prs, table)
 
         # Add contributor statistics if provided
         if contributor_stats:
@@ -126,139 +119,130 @@ class ReportGenerator:
             report.languages = languages
 
         # Calculate metrics
-        self._calculate_metrics(report)
+        self._calculate_metrics(report, table)
+        report.weekly_metrics = calculate_weekly_metrics(table)
 
         # Generate highlights
         self._generate_highlights(report)
 
-        return report
+        if missing_sections:
+            report.partial = True
+            report.missing_sections = list(missing_sections)
+            report.highlights.append(
+                "This report is partial; not available in time: "
+                + ", ".join(s.replace("_", " ") for s in missing_sections)
+            )
 
-    def _process_prs(self, report: RepositoryReport, prs: List[PullRequest]) -> None:
-        """Process pull requests to extract metrics."""
-        # Initialize counters
-        report.prs_merged = 0
-        report.prs_open = 0
-        report.prs_closed = 0
-
-        # Lists for calculating medians
-        time_to_first_reviews = []
-        time_to_approvals = []
-        total_reviews = 0
-        total_review_comments = 0
-
-        for pr in prs:
-            # Categorize PR size
-            pr.size_category = self._categorize_pr_size(pr)
-            report.pr_size_distribution[pr.size_category] += 1
-
-            # Calculate review metrics
-            if pr.review_metrics:
-                if pr.review_metrics.time_to_first_review is not None:
-                    time_to_first_reviews.append(pr.review_metrics.time_to_first_review)
-                if pr.review_metrics.time_to_approval is not None:
-                    time_to_approvals.append(pr.review_metrics.time_to_approval)
-                total_reviews += pr.review_metrics.number_of_reviewers
-                total_review_comments += pr.review_metrics.number_of_comments
-
-            # Categorize PR by state
-            if pr.state == PullRequestState.MERGED:
-                report.prs_merged += 1
-            elif pr.state == PullRequestState.OPEN:
-                report.prs_open += 1
-            elif pr.state == PullRequestState.CLOSED:
-                report.prs_closed += 1
-
-            # Update contributor stats
-            self._update_contributor_stats(report, pr)
-
-            # Map initiatives from branch name
-            self._map_initiatives(report, pr)
-
-            # Update lead and cycle times for merged PRs
-            if pr.state == PullRequestState.MERGED and pr.merged_at:
-                lead_time = (
-                    pr.merged_at - pr.created_at
-                ).total_seconds() / 3600  # in hours
-                cycle_time = (
-                    pr.merged_at - pr.created_at
-                ).total_seconds() / 3600  # in hours
-
-                if pr.author in report.contributors:
-                    report.contributors[pr.author].lead_times.append(lead_time)
-                    report.contributors[pr.author].cycle_times.append(cycle_time)
+        return report
 
-    def _update_contributor_stats(
-        self, report: RepositoryReport, pr: PullRequest
+    def _process_prs(
+        self, report: RepositoryReport, prs: List[PullRequest], table: PullRequestTable
     ) -> None:
-        """Update contributor statistics based on a PR."""
-        # Initialize contributor if not exists
-        if pr.author not in report.contributors:
-            report.contributors[pr.author] = ContributorStats(login=pr.author)
+        """Count PRs by state and size, and build contributor and initiative
+        statistics."""
+        states = np.bincount(table.state, minlength=3)
+        report.prs_merged = int(states[MERGED])
+        report.prs_open = int(states[OPEN])
+        report.prs_closed = int(states[CLOSED])
+
+        # Size categories:
+        # - xs: ≤ 10 changes
+        # - s:  11-50 changes
+        # - m:  51-250 changes
+        # - l:  251-1000 changes
+        # - xl: > 1000 changes
+        sizes = table.size_codes()
+        report.pr_size_distribution = dict(
+            zip(SIZE_CATEGORIES, np.bincount(sizes, minlength=5).tolist())
+        )
+        for pr, size in zip(prs, sizes.tolist()):
+            pr.size_category = SIZE_CATEGORIES[size]
 
-        # Update PR authored count
-        if pr.state == PullRequestState.MERGED:
-            report.contributors[pr.author].prs_merged += 1
+        self._update_contributor_stats(report, table)
+        self._map_initiatives(report, prs, table)
 
-        report.contributors[pr.author].prs_authored += 1
+    def _update_contributor_stats(
+        self, report: RepositoryReport, table: PullRequestTable
+    ) -> None:
+        """Add PR and review counts, lead and cycle times per contributor."""
+        count = len(table.logins)
+        authored = np.bincount(table.author, minlength=count)
+        merged = np.bincount(table.author[table.state == MERGED], minlength=count)
+        reviews_given = np.bincount(table.reviewer, minlength=count)
+        # Each reviewer listed on a PR counts as a review its author received
+        reviews_received = np.bincount(
+            table.author, weights=table.review_count, minlength=count
+        )
 
-        # Update reviews received
-        for reviewer in pr.reviewers:
-            if reviewer not in report.contributors:
-                report.contributors[reviewer] = ContributorStats(login=reviewer)
-            report.contributors[reviewer].reviews_given += 1
+        lead_times = self._by_login(table, table.lead_times())
+        cycle_times = self._by_login(table, table.cycle_times())
+
+        # Logins are in order of first appearance, as the PRs were read
+        for i, login in enumerate(table.logins):
+            report.contributors[login] = ContributorStats(
+                login=login,
+                prs_authored=int(authored[i]),
+                prs_merged=int(merged[i]),
+                reviews_given=int(reviews_given[i]),
+                reviews_received=int(reviews_received[i]),
+                lead_times=lead_times.get(i, []),
+                cycle_times=cycle_times.get(i, []),
+            )
 
-            # Count reviews received by the PR author
-            report.contributors[pr.author].reviews_received += 1
+    @staticmethod
+    def _by_login(table: PullRequestTable, hours: np.ndarray) -> Dict[int, List[float]]:
+        # Times of merged PRs grouped by author ID, in PR order
+        rows = np.flatnonzero(table.is_merged)
+        rows = rows[np.argsort(table.author[rows], kind="stable")]
+        authors, starts = np.unique(table.author[rows], return_index=True)
+        groups = np.split(hours[rows], starts[1:])
+        return {
+            int(author): group.tolist() for author, group in zip(authors, groups)
+        }
 
-    def _map_initiatives(self, report: RepositoryReport, pr: PullRequest) -> None:
+    def _map_initiatives(
+        self, report: RepositoryReport, prs: List[PullRequest], table: PullRequestTable
+    ) -> None:
         """Map PRs to initiatives based on branch name patterns."""
-        if not self.initiative_patterns:
+        if not self.initiative_patterns or not len(table):
             return
 
-        branch = pr.branch.lower()
-        matched_initiatives = []
-
-        # Check branch name against each pattern
-        for initiative, pattern in self.initiative_patterns.items():
-            if re.match(pattern, branch, re.IGNORECASE):
-                matched_initiatives.append(initiative)
-
-                # Initialize initiative stats if not exists
-                if initiative not in report.initiatives:
-                    report.initiatives[initiative] = InitiativeStats(name=initiative)
-
-                # Update initiative stats
-                stats = report.initiatives[initiative]
-                stats.pr_count += 1
-                stats.contributors[pr.author] = stats.contributors.get(pr.author, 0) + 1
-
-                # Update timing metrics for merged PRs
-                if (
-                    pr.state == PullRequestState.MERGED
-                    and pr.merged_at
-                    and pr.created_at
-                ):
-                    lead_time = (pr.merged_at - pr.created_at).total_seconds() / 3600
-                    cycle_time = lead_time  # Simplified for now
-
-                    # Update averages using exponential moving average
-                    alpha = 0.3  # Smoothing factor
-                    if stats.avg_lead_time is None:
-                        stats.avg_lead_time = lead_time
-                    else:
-                        stats.avg_lead_time = (
-                            alpha * lead_time + (1 - alpha) * stats.avg_lead_time
-                        )
-
-                    if stats.avg_cycle_time is None:
-                        stats.avg_cycle_time = cycle_time
-                    else:
-                        stats.avg_cycle_time = (
-                            alpha * cycle_time + (1 - alpha) * stats.avg_cycle_time
-                        )
-
-        # Store matched initiatives in the PR
-        pr.initiatives = matched_initiatives
+        # Store matched initiatives in the PRs
+        names = [
+            [table.initiatives[j] for j in np.flatnonzero(row)]
+            for row in table.branch_initiatives
+        ]
+        for pr, branch in zip(prs, table.branch.tolist()):
+            pr.initiatives = list(names[branch])
+
+        mask = table.initiative_mask
+        merged = table.is_merged
+        lead_times = table.lead_times()
+        cycle_times = table.cycle_times()
+        # Initiatives in order of their first PR
+        first = mask.argmax(axis=0)
+        order = sorted(
+            np.flatnonzero(mask.any(axis=0)), key=lambda j: (first[j], j)
+        )
+        for j in order:
+            rows = mask[:, j]
+            authors, first_rows, counts = np.unique(
+                table.author[rows], return_index=True, return_counts=True
+            )
+            contributors = {
+                table.logins[authors[k]]: int(counts[k])
+                for k in np.argsort(first_rows)
+            }
+            stats = InitiativeStats(
+                name=table.initiatives[j],
+                pr_count=int(rows.sum()),
+                contributors=contributors,
+            )
+            done = rows & merged
+            if done.any():
+                stats.avg_lead_time = float(lead_times[done].mean())
+                stats.avg_cycle_time = float(cycle_times[done].mean())
+            report.initiatives[stats.name] = stats
 
     def _merge_contributor_stats(
         self,
@@ -277,74 +261,37 @@ class ReportGenerator:
                 existing.additions = stats.additions
                 existing.deletions = stats.deletions
 
-    def _calculate_metrics(self, report: RepositoryReport) -> None:
+    def _calculate_metrics(self, report: RepositoryReport, table: PullRequestTable) -> None:
         """Calculate metrics for the report."""
         # Calculate total PRs
         report.total_prs = report.prs_merged + report.prs_open + report.prs_closed
 
-        # Calculate lead and cycle times
-        all_lead_times = []
-        all_cycle_times = []
-        time_to_first_reviews = []
-        time_to_approvals = []
-        total_reviews = 0
-        total_review_comments = 0
-
-        for pr in report.prs:
-            if pr.review_metrics:
-                if pr.review_metrics.time_to_first_review is not None:
-                    time_to_first_reviews.append(pr.review_metrics.time_to_first_review)
-                if pr.review_metrics.time_to_approval is not None:
-                    time_to_approvals.append(pr.review_metrics.time_to_approval)
-                total_reviews += pr.review_metrics.number_of_reviewers
-                total_review_comments += pr.review_metrics.number_of_comments
-
-        for contributor in report.contributors.values():
-            if contributor.lead_times:
-                all_lead_times.extend(contributor.lead_times)
-            if contributor.cycle_times:
-                all_cycle_times.extend(contributor.cycle_times)
-
-        # Calculate medians
-        if all_lead_times:
-            report.median_lead_time = statistics.median(all_lead_times)
-        if all_cycle_times:
-            report.median_cycle_time = statistics.median(all_cycle_times)
-        if time_to_first_reviews:
-            report.median_time_to_first_review = statistics.median(
-                time_to_first_reviews
-            )
-        if time_to_approvals:
-            report.median_time_to_approval = statistics.median(time_to_approvals)
+        merged = table.is_merged
+        # First commit to ready for review (or creation)
+        coding_times = hours_between(table.first_commit, table.opened())
+        # Time to first review is measured from creation; the wait starts
+        # once a review was requested
+        requested = hours_between(table.created, table.review_requested)
+        review_wait_times = table.time_to_first_review - requested
+
+        # Calculate medians (NaN marks a missing value)
+        report.median_lead_time = _median(table.lead_times()[merged])
+        report.median_cycle_time = _median(table.cycle_times()[merged])
+        report.median_coding_time = _median(coding_times)
+        report.median_review_wait_time = _median(
+            review_wait_times[review_wait_times >= 0]
+        )
+        report.median_time_to_first_review = _median(table.time_to_first_review)
+        report.median_time_to_approval = _median(table.time_to_approval)
 
         # Calculate averages
         if report.total_prs > 0:
-            report.avg_reviews_per_pr = total_reviews / report.total_prs
-            report.avg_review_comments_per_pr = total_review_comments / report.total_prs
-
-        # Calculate initiative metrics
-        for initiative in report.initiatives.values():
-            # Calculate average lead and cycle times for the initiative
-            lead_times = []
-            cycle_times = []
-
-            for pr in report.prs:
-                if (
-                    initiative.name in pr.initiatives
-                    and pr.state == PullRequestState.MERGED
-                ):
-                    if pr.merged_at:
-                        lead_times.append(
-                            (pr.merged_at - pr.created_at).total_seconds() / 3600
-                        )
-                        cycle_times.append(
-                            (pr.merged_at - pr.created_at).total_seconds() / 3600
-                        )
-
-            if lead_times:
-                initiative.avg_lead_time = statistics.mean(lead_times)
-            if cycle_times:
-                initiative.avg_cycle_time = statistics.mean(cycle_times)
+            report.avg_reviews_per_pr = (
+                int(table.number_of_reviewers.sum()) / report.total_prs
+            )
+            report.avg_review_comments_per_pr = (
+                int(table.number_of_comments.sum()) / report.total_prs
+            )
 
     def _generate_highlights(self, report: RepositoryReport) -> None:
         """Generate highlight points for the report."""
@@ -410,6 +357,18 @@ class ReportGenerator:
                 f"Median cycle time (PR open to merge): {report.median_cycle_time:.1f} hours"
             )
 
+        if report.median_coding_time is not None:
+            highlights.append(
+                f"Median coding time (first commit to ready for review): "
+                f"{report.median_coding_time:.1f} hours"
+            )
+
+        if report.median_review_wait_time is not None:
+            highlights.append(
+                f"Median wait for review (review requested to first review): "
+                f"{report.median_review_wait_time:.1f} hours"
+            )
+
         # Top initiatives
         if report.initiatives:
             # Sort by both PR count and average cycle time
@@ -458,3 +417,8 @@ class ReportGenerator:
                     )
 
         report.highlights = highlights
+
+
+def _median(values: np.ndarray) -> Optional[float]:
+    values = values[~np.isnan(values)]
+    return float(np.median(values)) if len(values) else None
@@ -1,64 +1,85 @@
-from datetime import timedelta
-from typing import List, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple, Union
 
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from ..model.models import PullRequest, RepositoryReport, WeeklyMetrics
-
-
-def calculate_weekly_metrics(prs: List[PullRequest]) -> List[WeeklyMetrics]:
-    # Group PRs by week
-    weekly_data = {}
-
-    for pr in prs:
-        # Use merged_at for completed work
-        if pr.merged_at:
-            week_key = pr.merged_at.isocalendar()[:2]  # (year, week)
-            week_start = pr.merged_at - timedelta(days=pr.merged_at.weekday())
-
-            if week_key not in weekly_data:
-                weekly_data[week_key] = {
-                    "week_start": week_start,
-                    "completed_prs": 0,
-                    "completed_changes": 0,
-                    "review_times": [],
-                    "cycle_times": [],
-                    "contributors": set(),
-                    "total_reviews": 0,
-                    "total_comments": 0,
-                }
-
-            data = weekly_data[week_key]
-            data["completed_prs"] += 1
-            data["completed_changes"] += pr.additions + pr.deletions
-            data["contributors"].add(pr.author)
-            data["total_reviews"] += len(pr.reviewers)
-
-            if pr.review_metrics:
-                data["total_comments"] += pr.review_metrics.number_of_comments
-                if pr.review_metrics.time_to_approval is not None:
-                    data["review_times"].append(pr.review_metrics.time_to_approval)
-
-            if pr.created_at:
-                cycle_time = (pr.merged_at - pr.created_at).total_seconds() / 3600
-                data["cycle_times"].append(cycle_time)
+from .pr_table import PullRequestTable
+
+_DAY = 24 * 60 * 60
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def calculate_weekly_metrics(
+    prs: Union[List[PullRequest], PullRequestTable],
+) -> List[WeeklyMetrics]:
+    if not isinstance(prs, PullRequestTable):
+        # Only merged PRs count; skip building columns for the rest
+        prs = PullRequestTable.from_pull_requests([pr for pr in prs if pr.merged_at])
+    table = prs
+
+    # Use merged_at for completed work
+    rows = np.flatnonzero(~np.isnan(table.merged))
+    if not len(rows):
+        return []
+    merged = table.merged[rows]
+
+    # Group PRs by ISO week, identified by its Monday (1970-01-01 was a
+    # Thursday). A week starts at the merge time of its first PR moved back
+    # to Monday.
+    days = np.floor(merged / _DAY)
+    weekdays = (days + 3) % 7
+    _, first, week = np.unique(days - weekdays, return_index=True, return_inverse=True)
+    week_starts = merged[first] - weekdays[first] * _DAY
+    weeks = len(first)
+
+    def per_week(values: np.ndarray, where: Optional[np.ndarray] = None) -> np.ndarray:
+        if where is None:
+            return np.bincount(week, weights=values, minlength=weeks)
+        return np.bincount(week[where], weights=values[where], minlength=weeks)
+
+    completed_prs = np.bincount(week, minlength=weeks)
+    completed_changes = per_week(table.additions[rows] + table.deletions[rows])
+    total_reviews = per_week(table.review_count[rows])
+    total_comments = per_week(table.number_of_comments[rows])
+    # Distinct (week, author) pairs
+    logins = max(len(table.logins), 1)
+    pairs = np.unique(week * logins + table.author[rows])
+    contributors = np.bincount(pairs // logins, minlength=weeks)
+
+    review_times = table.time_to_approval[rows]
+    has_review = ~np.isnan(review_times)
+    review_counts = np.bincount(week[has_review], minlength=weeks)
+    review_sums = per_week(review_times, has_review)
+    # Drafts count from when they were marked ready for review
+    cycle_times = (merged - table.opened()[rows]) / 3600
+    cycle_sums = per_week(cycle_times)
+
+    weekly_data = [
+        {
+            "week_start": _EPOCH + timedelta(seconds=float(week_starts[i])),
+            "completed_prs": int(completed_prs[i]),
+            "completed_changes": int(completed_changes[i]),
+            "avg_review_time": (
+                float(review_sums[i] / review_counts[i]) if review_counts[i] else None
+            ),
+            "avg_cycle_time": float(cycle_sums[i] / completed_prs[i]),
+            "active_contributors": int(contributors[i]),
+            "total_reviews": int(total_reviews[i]),
+            "total_comments": int(total_comments[i]),
+        }
+        for i in range(weeks)
+    ]
 
     # Convert to WeeklyMetrics objects
     result = []
     prev_metrics = None
 
-    for week_key, data in sorted(weekly_data.items()):
-        avg_review_time = (
-            sum(data["review_times"]) / len(data["review_times"])
-            if data["review_times"]
-            else None
-        )
-        avg_cycle_time = (
-            sum(data["cycle_times"]) / len(data["cycle_times"])
-            if data["cycle_times"]
-            else None
-        )
+    for data in weekly_data:
+        avg_review_time = data["avg_review_time"]
+        avg_cycle_time = data["avg_cycle_time"]
 
         # Calculate trends
         throughput_trend = None
@@ -88,7 +109,7 @@ def calculate_weekly_metrics(prs: List[PullRequest]) -> List[WeeklyMetrics]:
             completed_changes=data["completed_changes"],
             avg_review_time=avg_review_time,
             avg_cycle_time=avg_cycle_time,
-            active_contributors=len(data["contributors"]),
+            active_contributors=data["active_contributors"],
             total_reviews=data["total_reviews"],
             total_comments=data["total_comments"],
             throughput_trend=throughput_trend,
@@ -184,7 +205,7 @@ def create_velocity_charts(report: RepositoryReport) -> Tuple[go.Figure, go.Figu
             name="Review Time",
             mode="lines+markers",
             line=dict(color="#e74c3c"),
-            text=[f"{time:.1f}h" for time in review_times],
+            text=[_hours_label(time) for time in review_times],
             textposition="top center",
         ),
         row=1,
@@ -201,8 +222,8 @@ def create_velocity_charts(report: RepositoryReport) -> Tuple[go.Figure, go.Figu
             line=dict(color="#9b59b6"),
             text=[
                 f"{time:.1f}h<br>{'+' if trend < 0 else ''}{abs(trend):.1f}%"
-                if trend is not None
-                else f"{time:.1f}h"
+                if trend is not None and time is not None
+                else _hours_label(time)
                 for time, trend in zip(cycle_times, cycle_trends)
             ],
             textposition="top center",
@@ -233,3 +254,8 @@ def create_velocity_charts(report: RepositoryReport) -> Tuple[go.Figure, go.Figu
     )
 
     return throughput_fig, cycle_fig
+
+
+def _hours_label(hours: Optional[float]) -> str:
+    # Weeks without approved (or merged) PRs have no average
+    return f"{hours:.1f}h" if hours is not None else ""
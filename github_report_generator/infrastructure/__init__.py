@@ -1,6 +1,7 @@
 """Infrastructure layer containing external service implementations."""
 
 from .github.github_client import GitHubClient
+from .github.async_github_client import AsyncGitHubClient
 from .visualization.visualizations import (
     create_pr_size_chart,
     create_review_time_chart,
@@ -9,6 +10,7 @@ from .visualization.visualizations import (
 
 __all__ = [
     'GitHubClient',
+    'AsyncGitHubClient',
     'create_pr_size_chart',
     'create_review_time_chart',
     'create_contributor_heatmap'
@@ -1,5 +1,19 @@
 """GitHub API client and related utilities."""
 
 from .github_client import GitHubClient
+from .async_github_client import AsyncGitHubClient
+from .cassette import Cassette, CassetteMissError
+from .concurrency_controller import AdaptiveConcurrencyController, SecondaryRateLimitError
+from .github_decorators import ResourceNotFoundError
+from .http_cache import HttpCache
+from .rate_limit_scheduler import RateLimitScheduler
+from .request_metrics import RequestMetrics
+from .response_cache import ResponseCache
+from .singleflight import SingleFlight
+from .timestamps import as_utc, parse_timestamp, parse_timestamps, utc_now
 
-__all__ = ['GitHubClient']
+__all__ = ['GitHubClient', 'AsyncGitHubClient', 'HttpCache', 'ResponseCache',
+           'RateLimitScheduler', 'AdaptiveConcurrencyController',
+           'SecondaryRateLimitError', 'RequestMetrics', 'Cassette',
+           'CassetteMissError', 'SingleFlight', 'ResourceNotFoundError',
+           'parse_timestamp', 'parse_timestamps', 'as_utc', 'utc_now']
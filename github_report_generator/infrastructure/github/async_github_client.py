@@ -0,0 +1,401 @@
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from .cassette import Cassette
+from .concurrency_controller import (
+    AdaptiveConcurrencyController,
+    SecondaryRateLimitError,
+    is_secondary_rate_limit,
+    retry_after_seconds,
+)
+from .github_client import GitHubClient
+from .github_decorators import ResourceNotFoundError
+from .http_cache import HttpCache
+from .json_stream import decode_json
+from .rate_limit_scheduler import RateLimitScheduler
+from .request_metrics import RequestMetrics
+from .response_cache import ResponseCache
+from .singleflight import SingleFlight
+
+
+class AsyncGitHubClient:
+    """asyncio counterpart of ``GitHubClient`` for fan-out heavy workloads.
+
+    Requests share one pooled HTTP/1.1 keep-alive transport, and at most
+    ``max_concurrency`` of them are in flight at any time; fewer while
+    GitHub is throttling (see ``AdaptiveConcurrencyController``).
+    """
+
+    BASE_URL = GitHubClient.BASE_URL
+    DEFAULT_CONCURRENCY = 10
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float = 30.0,
+        http_cache: Optional[HttpCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimitScheduler] = None,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+        metrics: Optional[RequestMetrics] = None,
+        cassette: Optional[Cassette] = None,
+        base_url: Optional[str] = None,
+        singleflight: Optional[SingleFlight] = None,
+    ):
+        self.token = token or os.getenv("GITHUB_TOKEN")
+        self.base_url = (
+            base_url or os.getenv("GITHUB_API_URL") or self.BASE_URL
+        ).rstrip("/")
+        self.rate_limiter = rate_limiter or RateLimitScheduler(
+            RateLimitScheduler.tokens_from_env(self.token)
+        )
+        self.http_cache = http_cache
+        self.response_cache = response_cache or ResponseCache()
+        self.metrics = metrics or RequestMetrics()
+        self.singleflight = singleflight or SingleFlight.shared()
+        self.max_concurrency = max(1, max_concurrency)
+
+        headers = {"User-Agent": "GitHub-Report-Generator"}
+        if self.token:
+            headers.update(
+                {
+                    "Authorization": f"token {self.token}",
+                    "Accept": "application/vnd.github.v3+json",
+                }
+            )
+
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+        )
+        self.cassette = cassette
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=timeout,
+            http2=False,
+            limits=limits,
+            transport=(
+                cassette.async_transport(limits=limits)
+                if cassette is not None
+                else None
+            ),
+        )
+        self.concurrency_controller = (
+            concurrency_controller
+            or AdaptiveConcurrencyController(self.max_concurrency)
+        )
+
+    async def make_request(
+        self, method: str, url: str, params: Optional[Dict] = None
+    ) -> Any:
+        # Read-only, as for GitHubClient.make_request
+        data, _ = await self._fetch(method, url, params=params)
+        return data
+
+    async def get_page(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[Any, Dict[str, str]]:
+        return await self._fetch("GET", url, params=params, fields=fields)
+
+    async def get_all_pages(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        max_pages: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        data, links = await self.get_page(url, params, fields)
+        return [data] + await self.get_remaining_pages(links, max_pages, fields)
+
+    async def get_remaining_pages(
+        self,
+        links: Dict[str, str],
+        max_pages: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        page_urls = GitHubClient._remaining_page_urls(links, max_pages)
+        if page_urls is None:
+            pages = []
+            while "next" in links and (
+                max_pages is None or len(pages) + 1 < max_pages
+            ):
+                data, links = await self.get_page(links["next"], fields=fields)
+                pages.append(data)
+            return pages
+
+        pages = await asyncio.gather(
+            *(self.get_page(u, fields=fields) for u in page_urls)
+        )
+        return [data for data, _ in pages]
+
+    async def iter_remaining_pages(
+        self,
+        links: Dict[str, str],
+        window: int,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Any]:
+        """Like ``get_remaining_pages``, but yields the pages in order with
+        at most ``window`` of them requested ahead of the consumer, so memory
+        stays bounded however many pages there are."""
+        page_urls = GitHubClient._remaining_page_urls(links)
+        if page_urls is None:
+            while "next" in links:
+                data, links = await self.get_page(links["next"], fields=fields)
+                yield data
+            return
+
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            for page_url in page_urls:
+                pending.append(
+                    asyncio.ensure_future(self.get_page(page_url, fields=fields))
+                )
+                if len(pending) >= window:
+                    data, _ = await pending.popleft()
+                    yield data
+            while pending:
+                data, _ = await pending.popleft()
+                yield data
+        finally:
+            # The consumer stopped early (or failed); drop the read-ahead
+            for future in pending:
+                future.cancel()
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        return self.response_cache.stats()
+
+    def projected_wait(self, pending_requests: int) -> float:
+        return self.rate_limiter.projected_wait(pending_requests)
+
+    _auth_headers = staticmethod(GitHubClient._auth_headers)
+    _cached_size = staticmethod(GitHubClient._cached_size)
+    _record_response = GitHubClient._record_response
+    _flight_key = GitHubClient._flight_key
+
+    async def _fetch(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[Any, Dict[str, str]]:
+        if not url.startswith("http"):
+            url = f"{self.base_url}/{url.lstrip('/')}"
+
+        memory_key = f"{method}:{url}:{str(params)}:None"
+        if fields:
+            memory_key += f":{','.join(fields)}"
+        page = self.response_cache.get(memory_key)
+        if page is not None:
+            self.metrics.record_cache(method, url, "hit")
+            return page
+
+        # Identical requests already in flight, from any client in this
+        # process, are waited for instead of sent again
+        page, shared = await self.singleflight.do_async(
+            self._flight_key(memory_key),
+            lambda: self._fetch_from_network(method, url, params, fields, memory_key),
+        )
+        if shared:
+            self.metrics.record_cache(method, url, "coalesced")
+        return page
+
+    async def _fetch_from_network(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        fields: Optional[Sequence[str]],
+        memory_key: str,
+    ) -> Tuple[Any, Dict[str, str]]:
+        cache_key = None
+        cached = None
+        headers = None
+        if self.http_cache is not None and method.upper() == "GET":
+            cache_key = HttpCache.make_key(method, url, params, self.token)
+            cached = self.http_cache.get(cache_key)
+            if cached is not None:
+                headers = cached.conditional_headers()
+
+        response = await self._send(method, url, params=params, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            self.metrics.record_cache(method, url, "revalidated")
+            page = (decode_json(cached.content, fields), cached.links)
+            self.response_cache.put(
+                memory_key, page, self._cached_size(page[0], cached.content, fields), url
+            )
+            return page
+
+        self.metrics.record_cache(method, url, "miss")
+        links = {rel: link["url"] for rel, link in response.links.items()}
+        page = (decode_json(response.content, fields), links)
+
+        if response.status_code == 200:
+            self.response_cache.put(
+                memory_key, page, self._cached_size(page[0], response.content, fields), url
+            )
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if cache_key is not None and (etag or last_modified):
+                self.http_cache.put(
+                    cache_key, response.content, links, etag, last_modified
+                )
+
+        return page
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        if not url.startswith("http"):
+            url = f"{self.base_url}/{url.lstrip('/')}"
+
+        retry_count = 0
+        max_retries = 3
+        response = None
+        while retry_count <= max_retries:
+            try:
+                await self.concurrency_controller.acquire_async()
+                try:
+                    token = await self.rate_limiter.acquire_async()
+                    response = None
+                    started = time.monotonic()
+                    try:
+                        response = await self.client.request(
+                            method,
+                            url,
+                            params=params,
+                            headers={
+                                **(headers or {}),
+                                **self._auth_headers(token),
+                            },
+                        )
+                    finally:
+                        self.rate_limiter.release(
+                            token,
+                            response.headers if response is not None else None,
+                        )
+                        self._record_response(method, url, response, started)
+                finally:
+                    self.concurrency_controller.release()
+
+                reset_time = datetime.fromtimestamp(
+                    int(response.headers.get("X-RateLimit-Reset", 0))
+                ).strftime("%Y-%m-%d %H:%M:%S")
+
+                if is_secondary_rate_limit(
+                    response.status_code, response.headers, response.text
+                ):
+                    delay = self.concurrency_controller.on_throttle(
+                        retry_after_seconds(response.headers), retry_count
+                    )
+                    if retry_count < max_retries:
+                        print(
+                            f"Secondary rate limit hit. Retrying in "
+                            f"{math.ceil(delay)} seconds with concurrency "
+                            f"{int(self.concurrency_controller.limit)}..."
+                        )
+                        self.metrics.record_retry(
+                            method, url, "secondary_rate_limit"
+                        )
+                        retry_count += 1
+                        continue
+                    raise SecondaryRateLimitError(
+                        "GitHub API secondary rate limit exceeded. "
+                        f"Retry after {math.ceil(delay)} seconds",
+                        delay,
+                    )
+
+                if (
+                    response.status_code == 403
+                    and "rate limit exceeded" in response.text.lower()
+                ):
+                    if retry_count < max_retries:
+                        print("Rate limit exceeded. Rescheduling request...")
+                        self.metrics.record_retry(method, url, "rate_limit")
+                        retry_count += 1
+                        continue
+                    raise Exception(
+                        f"GitHub API rate limit exceeded. Resets at {reset_time}"
+                    )
+
+                # httpx treats 304 as an error; it is the revalidation answer
+                if response.status_code != 304:
+                    response.raise_for_status()
+                self.concurrency_controller.on_success()
+
+                return response
+
+            except httpx.HTTPError as e:
+                if response is not None and response.status_code == 404:
+                    raise ResourceNotFoundError(f"Resource not found: {url}")
+                if retry_count < max_retries:
+                    self.metrics.record_retry(method, url, "error")
+                    retry_count += 1
+                    delay = (
+                        retry_after_seconds(response.headers)
+                        if response is not None
+                        else None
+                    )
+                    await asyncio.sleep(2**retry_count if delay is None else delay)
+                    continue
+                raise Exception(f"GitHub API request failed: {str(e)}")
+
+        raise Exception(f"Failed after {max_retries} retries")
+
+    async def batch_request(
+        self, urls: List[str], method: str = "GET", params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        async def fetch(url: str) -> Any:
+            try:
+                return await self.make_request(method, url, params)
+            except Exception as e:
+                print(f"Warning: Failed to fetch {url}: {str(e)}")
+                return None
+
+        results = await asyncio.gather(*(fetch(url) for url in urls))
+        return dict(zip(urls, results))
+
+    async def batch_all_pages(
+        self,
+        urls: List[str],
+        params: Optional[Dict] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Optional[List[Any]]]:
+        async def fetch(url: str) -> Optional[List[Any]]:
+            try:
+                pages = await self.get_all_pages(url, params, fields=fields)
+            except Exception as e:
+                print(f"Warning: Failed to fetch {url}: {str(e)}")
+                return None
+            return [item for page in pages for item in page or []]
+
+        results = await asyncio.gather(*(fetch(url) for url in urls))
+        return dict(zip(urls, results))
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
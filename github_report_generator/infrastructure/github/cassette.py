@@ -0,0 +1,264 @@
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+class CassetteMissError(Exception):
+    """Raised in replay mode for a request the cassette has no response for."""
+
+
+class Cassette:
+    """Directory of recorded GitHub responses for offline, repeatable runs.
+
+    In ``"record"`` mode every response passing through the client's
+    transport is written to ``directory`` (status, headers and gzipped body,
+    one file per request). In ``"replay"`` mode the same requests are
+    answered from those files without touching the network, optionally
+    after a simulated latency: a fixed ``latency`` in seconds, or the time
+    each response originally took with ``recorded_latency``.
+
+    Recording always asks for full bodies, so a cassette does not depend on
+    the HTTP cache it was recorded with. On replay, a conditional request
+    whose ETag matches the recorded one gets a ``304``.
+    """
+
+    MODES = ("record", "replay")
+    # Content-Encoding/Length describe the wire format; bodies are stored
+    # decoded, so these would be wrong on replay.
+    _DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+    _CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+    def __init__(
+        self,
+        directory: str,
+        mode: str = "replay",
+        latency: float = 0.0,
+        recorded_latency: bool = False,
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; use record or replay")
+        if mode == "replay" and not os.path.isdir(directory):
+            raise ValueError(f"Cassette directory not found: {directory}")
+        self.directory = directory
+        self.mode = mode
+        self.latency = latency
+        self.recorded_latency = recorded_latency
+        if mode == "record":
+            os.makedirs(directory, exist_ok=True)
+
+        # Repeated requests (e.g. polling a 202) are recorded in sequence and
+        # replayed in the same order; the last answer repeats once exhausted.
+        self._recorded: Dict[str, List[Dict[str, Any]]] = {}
+        self._replay_positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @staticmethod
+    def request_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+        # Query parameters are sorted so equivalent URLs share a recording
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        normalized = urlunsplit(parts._replace(query=query, fragment=""))
+        digest = hashlib.sha256(f"{method.upper()} {normalized}".encode())
+        if body:
+            digest.update(b"\n" + body)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json.gz")
+
+    def _load(self, key: str) -> List[Dict[str, Any]]:
+        if key not in self._recorded:
+            try:
+                with gzip.open(self._path(key), "rt", encoding="utf-8") as f:
+                    self._recorded[key] = json.load(f)["responses"]
+            except FileNotFoundError:
+                self._recorded[key] = []
+        return self._recorded[key]
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        status: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        elapsed: float,
+    ) -> None:
+        key = self.request_key(method, url, body)
+        entry = {
+            "status": status,
+            "headers": {
+                name: value
+                for name, value in headers.items()
+                if name.lower() not in self._DROPPED_HEADERS
+            },
+            "body": base64.b64encode(content).decode("ascii"),
+            "elapsed": elapsed,
+        }
+        with self._lock:
+            # Only what this run recorded; a re-recording replaces old files
+            responses = self._recorded.setdefault(key, [])
+            responses.append(entry)
+            payload = {"method": method.upper(), "url": url, "responses": responses}
+            tmp_path = self._path(key) + ".tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self._path(key))
+
+    def replay(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        request_headers: Mapping[str, str],
+    ) -> Tuple[int, Dict[str, str], bytes, float]:
+        """Return (status, headers, body, delay) recorded for a request."""
+        key = self.request_key(method, url, body)
+        with self._lock:
+            responses = self._load(key)
+            if not responses:
+                raise CassetteMissError(
+                    f"No recorded response for {method.upper()} {url} "
+                    f"in cassette {self.directory}"
+                )
+            position = self._replay_positions.get(key, 0)
+            self._replay_positions[key] = position + 1
+            entry = responses[min(position, len(responses) - 1)]
+
+        status = entry["status"]
+        headers = dict(entry["headers"])
+        content = base64.b64decode(entry["body"])
+        etag = CaseInsensitiveDict(headers).get("ETag")
+        if status == 200 and etag and request_headers.get("If-None-Match") == etag:
+            status, content = 304, b""
+
+        delay = entry["elapsed"] if self.recorded_latency else self.latency
+        return status, headers, content, delay
+
+    def strip_conditional_headers(self, headers: Any) -> None:
+        for name in self._CONDITIONAL_HEADERS:
+            if name in headers:
+                del headers[name]
+
+    def adapter(self, **adapter_kwargs) -> "CassetteAdapter":
+        return CassetteAdapter(self, **adapter_kwargs)
+
+    def async_transport(self, **transport_kwargs) -> "AsyncCassetteTransport":
+        return AsyncCassetteTransport(self, **transport_kwargs)
+
+
+class CassetteAdapter(BaseAdapter):
+    """``requests`` transport adapter that records to or replays a cassette."""
+
+    def __init__(self, cassette: Cassette, **adapter_kwargs):
+        super().__init__()
+        self.cassette = cassette
+        # Recording goes through a normal pooled adapter
+        self._adapter = HTTPAdapter(**adapter_kwargs) if cassette.recording else None
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        if self._adapter is not None:
+            self.cassette.strip_conditional_headers(request.headers)
+            started = time.monotonic()
+            response = self._adapter.send(request, **kwargs)
+            self.cassette.record(
+                request.method,
+                request.url,
+                body,
+                response.status_code,
+                response.headers,
+                response.content,
+                time.monotonic() - started,
+            )
+            return response
+
+        status, headers, content, delay = self.cassette.replay(
+            request.method, request.url, body, request.headers
+        )
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = content
+        response.url = request.url
+        response.request = request
+        response.reason = "Not Modified" if status == 304 else ""
+        return response
+
+    def close(self) -> None:
+        if self._adapter is not None:
+            self._adapter.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """httpx counterpart of ``CassetteAdapter`` for ``AsyncGitHubClient``."""
+
+    def __init__(self, cassette: Cassette, **transport_kwargs):
+        self.cassette = cassette
+        self._transport = (
+            httpx.AsyncHTTPTransport(**transport_kwargs) if cassette.recording else None
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        if self._transport is not None:
+            self.cassette.strip_conditional_headers(request.headers)
+            started = time.monotonic()
+            response = await self._transport.handle_async_request(request)
+            # Decoded here so the body can be stored and handed back alike
+            content = await httpx.Response(
+                response.status_code,
+                headers=response.headers,
+                stream=response.stream,
+                request=request,
+            ).aread()
+            self.cassette.record(
+                request.method,
+                str(request.url),
+                body,
+                response.status_code,
+                response.headers,
+                content,
+                time.monotonic() - started,
+            )
+            headers = [
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in Cassette._DROPPED_HEADERS
+            ]
+            return httpx.Response(
+                response.status_code, headers=headers, content=content, request=request
+            )
+
+        status, headers, content, delay = self.cassette.replay(
+            request.method, str(request.url), body, request.headers
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return httpx.Response(status, headers=headers, content=content, request=request)
+
+    async def aclose(self) -> None:
+        if self._transport is not None:
+            await self._transport.aclose()
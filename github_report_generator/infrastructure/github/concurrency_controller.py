@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Set, Tuple
+
+
+class SecondaryRateLimitError(Exception):
+    """Raised when GitHub keeps throttling a request after all retries.
+
+    ``retry_after`` is the delay in seconds GitHub asked for, so callers
+    retrying on their own can honour it instead of a fixed backoff.
+    """
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def is_secondary_rate_limit(
+    status_code: int, headers: Mapping[str, str], text: str = ""
+) -> bool:
+    # A 403 with an exhausted primary quota is left to the RateLimitScheduler;
+    # everything else GitHub throttles is answered with 429, or a 403 carrying
+    # Retry-After or a "secondary rate limit" message.
+    if status_code == 429:
+        return True
+    if status_code != 403 or headers.get("X-RateLimit-Remaining") == "0":
+        return False
+    return "Retry-After" in headers or "secondary rate limit" in text.lower()
+
+
+class AdaptiveConcurrencyController:
+    """Caps in-flight GitHub requests with an AIMD concurrency limit.
+
+    The limit grows by one request for every window of successful responses
+    and is halved when GitHub throttles, while all requests pause for the
+    ``Retry-After`` delay. Parallel fetching thus settles just below the rate
+    that trips GitHub's secondary (abuse) limits.
+    """
+
+    # GitHub asks clients to wait at least a minute when a secondary limit
+    # response carries no Retry-After header.
+    DEFAULT_BACKOFF = 60.0
+
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self.throttles = 0
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+        # Coroutines waiting for a slot, with the loop each one runs on;
+        # woken whenever a slot may have become free
+        self._async_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = set()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while True:
+                acquired, wait = self._try_acquire()
+                if acquired:
+                    return
+                self._condition.wait(wait)
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                acquired, wait = self._try_acquire()
+                if acquired:
+                    return
+                if wait is None:
+                    waiter = (loop, loop.create_future())
+                    self._async_waiters.add(waiter)
+            if wait is not None:
+                await asyncio.sleep(wait)
+                continue
+            try:
+                await waiter[1]
+            finally:
+                with self._condition:
+                    self._async_waiters.discard(waiter)
+
+    def _try_acquire(self) -> Tuple[bool, Optional[float]]:
+        # Returns whether a slot was taken, otherwise how long to wait
+        # (None: until another request releases its slot).
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            return False, pause
+        if self.in_flight >= int(self.limit):
+            return False, None
+        self.in_flight += 1
+        return True, None
+
+    def release(self) -> None:
+        with self._condition:
+            self.in_flight = max(self.in_flight - 1, 0)
+            self._notify()
+
+    def on_success(self) -> None:
+        with self._condition:
+            if self.limit < self.max_limit:
+                self.limit = min(self.limit + 1 / self.limit, float(self.max_limit))
+                self._notify()
+
+    def _notify(self) -> None:
+        # Called with the lock held. Every waiting coroutine is woken to try
+        # again, from whichever thread freed the slot; those that lose the
+        # race wait anew.
+        self._condition.notify()
+        waiters, self._async_waiters = self._async_waiters, set()
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                # The waiter's loop has been closed
+                pass
+
+    def on_throttle(self, retry_after: Optional[float], attempt: int = 0) -> float:
+        """Back off after a throttled response; returns the pause in seconds."""
+        delay = (
+            retry_after
+            if retry_after is not None
+            else self.DEFAULT_BACKOFF * 2**attempt
+        )
+        with self._condition:
+            now = time.monotonic()
+            # Requests already in flight when the limit was hit come back
+            # throttled too; only the first of them cuts the limit.
+            if now >= self._paused_until:
+                self.limit = max(self.limit / 2, float(self.min_limit))
+                self.throttles += 1
+            self._paused_until = max(self._paused_until, now + delay)
+        return delay
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._condition:
+            return {
+                "limit": int(self.limit),
+                "max_limit": self.max_limit,
+                "in_flight": self.in_flight,
+                "throttles": self.throttles,
+            }
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
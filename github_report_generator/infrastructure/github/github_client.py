@@ -1,19 +1,82 @@
+import hashlib
+import math
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Sequence, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
 
-from .github_decorators import cache_response, handle_github_request
+from .cassette import Cassette
+from .concurrency_controller import (
+    AdaptiveConcurrencyController,
+    SecondaryRateLimitError,
+    is_secondary_rate_limit,
+    retry_after_seconds,
+)
+from .github_decorators import ResourceNotFoundError, handle_github_request
+from .http_cache import HttpCache
+from .json_stream import decode_json, encoded_size
+from .rate_limit_scheduler import RateLimitScheduler
+from .request_metrics import RequestMetrics
+from .response_cache import ResponseCache
+from .singleflight import SingleFlight
 
 
 class GitHubClient:
     BASE_URL = "https://api.github.com"
+    DEFAULT_MAX_WORKERS = 10
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        http_cache: Optional[HttpCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        tokens: Optional[Sequence[str]] = None,
+        rate_limiter: Optional[RateLimitScheduler] = None,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+        metrics: Optional[RequestMetrics] = None,
+        cassette: Optional[Cassette] = None,
+        base_url: Optional[str] = None,
+        singleflight: Optional[SingleFlight] = None,
+    ):
         self.token = token or os.getenv("GITHUB_TOKEN")
+        # GITHUB_API_URL points the client at GitHub Enterprise or a local
+        # stand-in such as application.synthetic_api
+        self.base_url = (
+            base_url or os.getenv("GITHUB_API_URL") or self.BASE_URL
+        ).rstrip("/")
+        # Requests are spread over this token and any pooled ones
+        # (`tokens` or GITHUB_TOKENS) within each token's rate budget.
+        self.rate_limiter = rate_limiter or RateLimitScheduler(
+            RateLimitScheduler.tokens_from_env(self.token, tokens)
+        )
+        self.max_workers = max(1, max_workers)
+        # Shrinks the number of in-flight requests when GitHub throttles
+        # and grows it back while responses succeed.
+        self.concurrency_controller = (
+            concurrency_controller or AdaptiveConcurrencyController(self.max_workers)
+        )
+        # Optional persistent cache; GET responses are revalidated with
+        # If-None-Match / If-Modified-Since instead of being refetched.
+        self.http_cache = http_cache
         self.session = requests.Session()
+        # Keep one pooled connection per worker so parallel batches reuse
+        # keep-alive connections instead of opening and discarding them.
+        pool = {"pool_connections": self.max_workers, "pool_maxsize": self.max_workers}
+        # A cassette records responses to disk, or replays them without
+        # touching the network.
+        self.cassette = cassette
+        adapter = (
+            cassette.adapter(**pool) if cassette is not None else HTTPAdapter(**pool)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         if self.token:
             self.session.headers.update(
                 {
@@ -22,51 +85,341 @@ class GitHubClient:
                 }
             )
         self.session.headers.update({"User-Agent": "GitHub-Report-Generator"})
-        self._cache: Dict[str, Any] = {}
+        # Single bounded in-memory layer in front of the network
+        self.response_cache = response_cache or ResponseCache()
+        # Per-endpoint counts, latencies, retries and cache outcomes
+        self.metrics = metrics or RequestMetrics()
+        # Shared by default with every other client in the process
+        self.singleflight = singleflight or SingleFlight.shared()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
     @handle_github_request
-    @cache_response
-    def make_request(self, method: str, url: str, params: Optional[Dict] = None) -> Any:
-        cache_key = f"{method}:{url}:{str(params)}"
+    def make_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+    ) -> Any:
+        # The decoded payload may be shared with the response cache and with
+        # coalesced callers (see ResponseCache, SingleFlight): read-only.
+        data, _ = self._fetch(method, url, params=params, json=json)
+        return data
 
-        # Check cache
-        if hasattr(self, "_cache") and cache_key in self._cache:
-            return self._cache[cache_key]
+    def get_page(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[Any, Dict[str, str]]:
+        # Like make_request, but also returns the pagination links parsed from
+        # the Link header as {rel: url}, e.g. {"next": ..., "last": ...}.
+        # With `fields` (dotted paths such as "user.login") only those fields
+        # of each list item are decoded; see json_stream.decode_json.
+        return self._fetch("GET", url, params=params, fields=fields)
 
-        if not hasattr(self, "_cache"):
-            self._cache = {}
+    def get_all_pages(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        max_pages: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        """Fetch every page of a paginated list endpoint, in page order.
+
+        The first response's ``Link: rel="last"`` gives the page count, so the
+        remaining pages are fetched in one parallel wave on the worker pool.
+        """
+        data, links = self.get_page(url, params, fields)
+        return [data] + self.get_remaining_pages(links, max_pages, fields)
+
+    def get_remaining_pages(
+        self,
+        links: Dict[str, str],
+        max_pages: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        # Pages after the one whose Link header is given. A failed page raises,
+        # since merging the others would silently drop results.
+        page_urls = self._remaining_page_urls(links, max_pages)
+        if page_urls is None:
+            return self._follow_next_links(links, max_pages, fields)
+
+        def fetch(page_url: str) -> Any:
+            return self.get_page(page_url, fields=fields)[0]
+
+        # Waiting on the pool from one of its own workers could deadlock
+        in_worker = threading.current_thread().name.startswith("github-client")
+        if len(page_urls) <= 1 or self.max_workers == 1 or in_worker:
+            return [fetch(page_url) for page_url in page_urls]
+        return list(self._get_executor().map(fetch, page_urls))
+
+    def _follow_next_links(
+        self,
+        links: Dict[str, str],
+        max_pages: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        # Cursor-paginated endpoints have no page numbers to fan out over
+        pages = []
+        while "next" in links and (max_pages is None or len(pages) + 1 < max_pages):
+            data, links = self.get_page(links["next"], fields=fields)
+            pages.append(data)
+        return pages
+
+    @staticmethod
+    def _remaining_page_urls(
+        links: Dict[str, str], max_pages: Optional[int] = None
+    ) -> Optional[List[str]]:
+        """URLs of the pages after the current one, from its Link header.
+
+        Returns None when the links carry no page numbers to fan out over.
+        """
+        if "next" not in links:
+            return []
+        if "last" not in links:
+            return None
+
+        last = urlparse(links["last"])
+        query = parse_qs(last.query)
+        next_page = parse_qs(urlparse(links["next"]).query).get("page")
+        if "page" not in query or not next_page:
+            return None
+
+        last_page = int(query["page"][0])
+        if max_pages is not None:
+            last_page = min(last_page, max_pages)
+        return [
+            last._replace(query=urlencode({**query, "page": page}, doseq=True)).geturl()
+            for page in range(int(next_page[0]), last_page + 1)
+        ]
+
+    def can_read_repository(self, repo_name: str, token: str) -> bool:
+        """Whether ``token`` itself can read ``repo_name``.
+
+        Sent with that token alone, bypassing the caches and the pooled
+        tokens, since the answer is about one caller's access. GitHub
+        answers 404 (403 under SSO enforcement) for private repositories
+        a token cannot see.
+        """
+        url = f"{self.base_url}/repos/{repo_name}"
+        response = None
+        started = time.monotonic()
+        try:
+            response = self.session.get(url, headers=self._auth_headers(token))
+        finally:
+            self._record_response("GET", url, response, started)
+        if response.status_code in (401, 403, 404):
+            return False
+        response.raise_for_status()
+        return True
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        return self.response_cache.stats()
+
+    def projected_wait(self, pending_requests: int) -> float:
+        return self.rate_limiter.projected_wait(pending_requests)
+
+    @staticmethod
+    def _auth_headers(token: Optional[str]) -> Dict[str, str]:
+        return {"Authorization": f"token {token}"} if token else {}
+
+    def _fetch(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[Any, Dict[str, str]]:
         if not url.startswith("http"):
-            url = f"{self.BASE_URL}/{url.lstrip('/')}"
+            url = f"{self.base_url}/{url.lstrip('/')}"
+
+        memory_key = f"{method}:{url}:{str(params)}:{str(json)}"
+        if fields:
+            memory_key += f":{','.join(fields)}"
+        page = self.response_cache.get(memory_key)
+        if page is not None:
+            self.metrics.record_cache(method, url, "hit")
+            return page
+
+        # Identical requests already in flight, from any client in this
+        # process, are waited for instead of sent again
+        page, shared = self.singleflight.do(
+            self._flight_key(memory_key),
+            lambda: self._fetch_from_network(
+                method, url, params, json, fields, memory_key
+            ),
+        )
+        if shared:
+            self.metrics.record_cache(method, url, "coalesced")
+        return page
+
+    def _flight_key(self, memory_key: str) -> str:
+        # What a response contains depends on what the token may see, so
+        # requests made with different tokens are never coalesced
+        token = (
+            hashlib.sha256(self.token.encode()).hexdigest()[:16]
+            if self.token
+            else "anonymous"
+        )
+        return f"{memory_key}:{token}"
+
+    def _fetch_from_network(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        json: Optional[Dict],
+        fields: Optional[Sequence[str]],
+        memory_key: str,
+    ) -> Tuple[Any, Dict[str, str]]:
+        cache_key = None
+        cached = None
+        headers = None
+        if self.http_cache is not None and method.upper() == "GET":
+            cache_key = HttpCache.make_key(method, url, params, self.token)
+            cached = self.http_cache.get(cache_key)
+            if cached is not None:
+                headers = cached.conditional_headers()
+
+        response = self._send(method, url, params=params, json=json, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            self.metrics.record_cache(method, url, "revalidated")
+            page = (decode_json(cached.content, fields), cached.links)
+            self.response_cache.put(
+                memory_key, page, self._cached_size(page[0], cached.content, fields), url
+            )
+            return page
+
+        self.metrics.record_cache(method, url, "miss")
+        links = {rel: link["url"] for rel, link in response.links.items()}
+        page = (decode_json(response.content, fields), links)
+
+        # Only complete answers are cached; a 202 means GitHub is still
+        # computing the resource and the next call must go to the network.
+        if response.status_code == 200:
+            self.response_cache.put(
+                memory_key, page, self._cached_size(page[0], response.content, fields), url
+            )
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if cache_key is not None and (etag or last_modified):
+                self.http_cache.put(
+                    cache_key, response.content, links, etag, last_modified
+                )
+
+        return page
+
+    @staticmethod
+    def _cached_size(data: Any, content: bytes, fields: Optional[Sequence[str]]) -> int:
+        return encoded_size(data) if fields else len(content)
+
+    def _record_response(
+        self, method: str, url: str, response: Any, started: float
+    ) -> None:
+        # Shared with AsyncGitHubClient; requests and httpx responses both
+        # expose status_code, content and headers.
+        elapsed = time.monotonic() - started
+        if response is None:
+            self.metrics.record_response(method, url, None, elapsed)
+        else:
+            self.metrics.record_response(
+                method,
+                url,
+                response.status_code,
+                elapsed,
+                len(response.content),
+                response.headers,
+            )
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        if not url.startswith("http"):
+            url = f"{self.base_url}/{url.lstrip('/')}"
 
         retry_count = 0
         max_retries = 3
         response = None
         while retry_count <= max_retries:
             try:
-                response = self.session.request(method, url, params=params)
+                # Wait for a concurrency slot; the scheduler then picks a
+                # token with budget left and blocks until the request may be
+                # sent without tripping the limit.
+                self.concurrency_controller.acquire()
+                try:
+                    token = self.rate_limiter.acquire()
+                    response = None
+                    started = time.monotonic()
+                    try:
+                        response = self.session.request(
+                            method,
+                            url,
+                            params=params,
+                            json=json,
+                            headers={
+                                **(headers or {}),
+                                **self._auth_headers(token),
+                            },
+                        )
+                    finally:
+                        self.rate_limiter.release(
+                            token,
+                            response.headers if response is not None else None,
+                        )
+                        self._record_response(method, url, response, started)
+                finally:
+                    self.concurrency_controller.release()
 
-                # Check rate limits
-                remaining = int(response.headers.get("X-RateLimit-Remaining", 0))
                 reset_time = datetime.fromtimestamp(
                     int(response.headers.get("X-RateLimit-Reset", 0))
                 ).strftime("%Y-%m-%d %H:%M:%S")
 
-                if remaining < 100:
-                    print("\nWARNING: GitHub API rate limit is low!")
-                    print(f"Remaining requests: {remaining}")
-                    print(f"Rate limit resets at: {reset_time}")
+                if is_secondary_rate_limit(
+                    response.status_code, response.headers, response.text
+                ):
+                    # Every request on this client pauses for Retry-After and
+                    # the concurrency limit is halved before retrying.
+                    delay = self.concurrency_controller.on_throttle(
+                        retry_after_seconds(response.headers), retry_count
+                    )
+                    if retry_count < max_retries:
+                        print(
+                            f"Secondary rate limit hit. Retrying in "
+                            f"{math.ceil(delay)} seconds with concurrency "
+                            f"{int(self.concurrency_controller.limit)}..."
+                        )
+                        self.metrics.record_retry(
+                            method, url, "secondary_rate_limit"
+                        )
+                        retry_count += 1
+                        continue
+                    raise SecondaryRateLimitError(
+                        "GitHub API secondary rate limit exceeded. "
+                        f"Retry after {math.ceil(delay)} seconds",
+                        delay,
+                    )
 
                 if (
                     response.status_code == 403
                     and "rate limit exceeded" in response.text.lower()
                 ):
-                    reset_seconds = int(
-                        response.headers.get("X-RateLimit-Reset", 0)
-                    ) - int(time.time())
-                    if reset_seconds > 0 and retry_count < max_retries:
-                        wait_time = min(reset_seconds + 1, 2**retry_count * 5)
-                        print(f"Rate limit exceeded. Waiting {wait_time} seconds...")
-                        time.sleep(wait_time)
+                    # The token's budget is now known to be empty, so the
+                    # next acquire rotates to another token or waits for
+                    # the reset.
+                    if retry_count < max_retries:
+                        print("Rate limit exceeded. Rescheduling request...")
+                        self.metrics.record_retry(method, url, "rate_limit")
                         retry_count += 1
                         continue
                     raise Exception(
@@ -74,37 +427,114 @@ class GitHubClient:
                     )
 
                 response.raise_for_status()
-                data = response.json()
-
-                # Cache the response if successful
-                self._cache[cache_key] = data
+                self.concurrency_controller.on_success()
 
-                return data
+                return response
 
             except requests.exceptions.RequestException as e:
+                if response is not None and response.status_code == 404:
+                    raise ResourceNotFoundError(f"Resource not found: {url}")
                 if retry_count < max_retries:
+                    self.metrics.record_retry(method, url, "error")
                     retry_count += 1
-                    time.sleep(2**retry_count)
+                    # 503s may also carry Retry-After
+                    delay = (
+                        retry_after_seconds(response.headers)
+                        if response is not None
+                        else None
+                    )
+                    time.sleep(2**retry_count if delay is None else delay)
                     continue
-                if response and response.status_code == 404:
-                    raise ValueError(f"Resource not found: {url}")
                 raise Exception(f"GitHub API request failed: {str(e)}")
 
         raise Exception(f"Failed after {max_retries} retries")
 
+    def graphql(
+        self, query: str, variables: Optional[Dict] = None, partial: bool = False
+    ) -> Dict[str, Any]:
+        # With `partial`, data GitHub returns alongside errors (e.g. for the
+        # other lookups of a query where one failed) is kept and the errors
+        # only reported; otherwise any error fails the query.
+        result = self.make_request(
+            "POST", "graphql", json={"query": query, "variables": variables or {}}
+        )
+        if result.get("errors"):
+            messages = "; ".join(e.get("message", str(e)) for e in result["errors"])
+            if partial and result.get("data"):
+                print(f"Warning: GitHub GraphQL query partly failed: {messages}")
+                return result["data"]
+            raise Exception(f"GitHub GraphQL query failed: {messages}")
+        return result.get("data") or {}
+
     def batch_request(
-        self, urls: List[str], method: str = "GET", params: Optional[Dict] = None
+        self,
+        urls: List[str],
+        method: str = "GET",
+        params: Optional[Dict] = None,
+        return_exceptions: bool = False,
+        on_done: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
-        # Make multiple requests in parallel to save on rate limits
-        results = {}
-        for url in urls:
+        # Make multiple requests in parallel on the shared worker pool.
+        # Results keep the input order; a failed URL maps to None, or to the
+        # raised exception when return_exceptions is set. `on_done` is called
+        # with each URL as soon as its request finishes (e.g. to drive a
+        # progress bar), from the worker that made it.
+        def fetch(url: str) -> Any:
+            try:
+                return self.make_request(method, url, params)
+            except Exception as e:
+                print(f"Warning: Failed to fetch {url}: {str(e)}")
+                return e if return_exceptions else None
+            finally:
+                if on_done is not None:
+                    on_done(url)
+
+        unique_urls = list(dict.fromkeys(urls))
+        if len(unique_urls) <= 1 or self.max_workers == 1:
+            return {url: fetch(url) for url in unique_urls}
+
+        results = self._get_executor().map(fetch, unique_urls)
+        return dict(zip(unique_urls, results))
+
+    def batch_all_pages(
+        self,
+        urls: List[str],
+        params: Optional[Dict] = None,
+        fields: Optional[Sequence[str]] = None,
+        on_done: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Optional[List[Any]]]:
+        # Like batch_request for paginated list endpoints: each URL maps to
+        # the items of all its pages, or to None if any page failed.
+        def fetch(url: str) -> Optional[List[Any]]:
             try:
-                results[url] = self.make_request(method, url, params)
+                pages = self.get_all_pages(url, params, fields=fields)
             except Exception as e:
                 print(f"Warning: Failed to fetch {url}: {str(e)}")
-                results[url] = None
-        return results
+                return None
+            finally:
+                if on_done is not None:
+                    on_done(url)
+            return [item for page in pages for item in page or []]
+
+        unique_urls = list(dict.fromkeys(urls))
+        if len(unique_urls) <= 1 or self.max_workers == 1:
+            return {url: fetch(url) for url in unique_urls}
+
+        results = self._get_executor().map(fetch, unique_urls)
+        return dict(zip(unique_urls, results))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="github-client",
+                )
+            return self._executor
 
     def close(self):
+        if getattr(self, "_executor", None) is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         if hasattr(self, "session"):
             self.session.close()
@@ -5,25 +5,12 @@ import time
 from datetime import datetime
 from typing import Callable
 
-def cache_response(func: Callable) -> Callable:
-    @functools.wraps(func)
-    def wrapper(self, *args, **kwargs):
-        # Generate cache key
-        cache_key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
-        
-        # Initialize cache if needed
-        if not hasattr(self, '_cache'):
-            self._cache = {}
-            
-        # Return cached response if available
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-            
-        # Get fresh response
-        response = func(self, *args, **kwargs)
-        self._cache[cache_key] = response
-        return response
-    return wrapper
+from .cassette import CassetteMissError
+from .concurrency_controller import SecondaryRateLimitError
+
+class ResourceNotFoundError(ValueError):
+    """Raised for a 404; retrying cannot make the resource appear."""
+
 
 def handle_github_request(func: Callable) -> Callable:
     @functools.wraps(func)
@@ -35,10 +22,16 @@ def handle_github_request(func: Callable) -> Callable:
             try:
                 response = func(self, *args, **kwargs)
                 
+                # Decoded payloads carry no headers; rate limits for those are
+                # tracked by the client's RateLimitScheduler instead.
+                headers = getattr(response, 'headers', None)
+                if headers is None:
+                    return response
+
                 # Check rate limits from response headers
-                remaining = int(getattr(response, 'headers', {}).get('X-RateLimit-Remaining', 0))
+                remaining = int(headers.get('X-RateLimit-Remaining', 0))
                 reset_time = datetime.fromtimestamp(
-                    int(getattr(response, 'headers', {}).get('X-RateLimit-Reset', 0))
+                    int(headers.get('X-RateLimit-Reset', 0))
                 ).strftime('%Y-%m-%d %H:%M:%S')
                 
                 if remaining < 100:
@@ -46,8 +39,9 @@ def handle_github_request(func: Callable) -> Callable:
                     print(f"Remaining requests: {remaining}")
                     print(f"Rate limit resets at: {reset_time}")
                 
-                if getattr(response, 'status_code', 0) == 403 and 'rate limit exceeded' in str(response).lower():
-                    reset_seconds = int(getattr(response, 'headers', {}).get('X-RateLimit-Reset', 0)) - int(time.time())
+                status_code = getattr(response, 'status_code', 0)
+                if status_code == 403 and 'rate limit exceeded' in str(response).lower():
+                    reset_seconds = int(headers.get('X-RateLimit-Reset', 0)) - int(time.time())
                     if reset_seconds > 0 and retry_count < max_retries:
                         wait_time = min(reset_seconds + 1, 2 ** retry_count * 5)
                         print(f"Rate limit exceeded. Waiting {wait_time} seconds...")
@@ -57,7 +51,11 @@ def handle_github_request(func: Callable) -> Callable:
                     raise Exception(f"GitHub API rate limit exceeded. Resets at {reset_time}")
                 
                 return response
-                
+
+            except (CassetteMissError, ResourceNotFoundError, SecondaryRateLimitError):
+                # Asking again cannot produce a different answer, and the
+                # client has already backed off and retried a secondary limit
+                raise
             except Exception as e:
                 if retry_count < max_retries:
                     retry_count += 1
@@ -0,0 +1,56 @@
+import json
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+import ijson
+
+FieldTree = Dict[str, "FieldTree"]
+
+
+def field_tree(fields: Iterable[str]) -> FieldTree:
+    """Turn dotted field paths such as ``"user.login"`` into a nested tree."""
+    tree: FieldTree = {}
+    for field in fields:
+        node = tree
+        for key in field.split("."):
+            node = node.setdefault(key, {})
+    return tree
+
+
+def project(value: Any, tree: FieldTree) -> Any:
+    # Lists are transparent, so "labels.name" keeps the name of every label.
+    # A leaf of the tree keeps the whole value below it.
+    if not tree or value is None:
+        return value
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: project(value[key], subtree)
+            for key, subtree in tree.items()
+            if key in value
+        }
+    return value
+
+
+def decode_json(content: bytes, fields: Optional[Sequence[str]] = None) -> Any:
+    """Decode a response body, keeping only ``fields`` when given.
+
+    JSON arrays are decoded one item at a time and each item is projected
+    onto the fields before the next is parsed, so only one full item (rather
+    than the whole page) is ever held as Python objects.
+    """
+    if not fields:
+        return json.loads(content)
+
+    tree = field_tree(fields)
+    if content.lstrip()[:1] != b"[":
+        return project(json.loads(content), tree)
+    return [
+        project(item, tree)
+        for item in ijson.items(content, "item", use_float=True)
+    ]
+
+
+def encoded_size(data: Any) -> int:
+    # Cache size of a projected payload, which is far smaller than the body
+    return len(json.dumps(data, separators=(",", ":")))
@@ -0,0 +1,222 @@
+import asyncio
+import math
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+@dataclass
+class TokenBudget:
+    token: Optional[str]
+    limit: int
+    remaining: int
+    reset_at: float = 0.0  # epoch seconds, 0 while unknown
+    in_flight: int = 0
+    next_slot: float = 0.0  # earliest epoch second the next request may start
+    warned: bool = False
+
+    @property
+    def label(self) -> str:
+        if not self.token:
+            return "unauthenticated"
+        return f"...{self.token[-4:]}"
+
+
+class RateLimitScheduler:
+    """Dispatches GitHub requests across a pool of tokens within their budgets.
+
+    Each token's remaining quota and reset time are tracked from the
+    ``X-RateLimit-*`` response headers. ``acquire`` hands out the token with
+    the most spendable budget and keeps ``safety_margin`` requests in
+    reserve, so requests wait for the reset instead of running into a 403.
+    Once a token's budget runs low while it is spending faster than its
+    window allows, its requests are paced evenly until the reset, like a
+    token bucket refilled at ``remaining / seconds_to_reset``.
+
+    ``budget_share`` caps the share of each token's limit this scheduler
+    spends: the rest is held in reserve, so a background job (such as the
+    sync daemon) leaves that much of the hourly budget to interactive
+    clients using the same tokens.
+    """
+
+    WINDOW_SECONDS = 3600
+    AUTHENTICATED_LIMIT = 5000
+    UNAUTHENTICATED_LIMIT = 60
+    DEFAULT_SAFETY_MARGIN = 50
+    # Share of the limit below which requests start being paced
+    PACING_THRESHOLD = 0.2
+
+    def __init__(
+        self,
+        tokens: Sequence[Optional[str]] = (),
+        safety_margin: int = DEFAULT_SAFETY_MARGIN,
+        budget_share: float = 1.0,
+    ):
+        unique = list(dict.fromkeys(t for t in tokens if t)) or [None]
+        self.safety_margin = safety_margin
+        self.budget_share = min(max(budget_share, 0.0), 1.0)
+        self._budgets: Dict[Optional[str], TokenBudget] = {
+            token: TokenBudget(
+                token=token,
+                limit=self._default_limit(token),
+                remaining=self._default_limit(token),
+            )
+            for token in unique
+        }
+        self._announced_reset = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def tokens_from_env(
+        primary: Optional[str] = None, extra: Optional[Sequence[str]] = None
+    ) -> List[str]:
+        # GITHUB_TOKENS holds additional tokens separated by commas or whitespace
+        pooled = re.split(r"[,\s]+", os.getenv("GITHUB_TOKENS", "").strip())
+        tokens = [primary or os.getenv("GITHUB_TOKEN")] + list(extra or []) + pooled
+        expanded = (os.path.expandvars(t) for t in tokens if t)
+        # Drop config entries such as ${GITHUB_TOKEN_2} whose variable is unset
+        return list(dict.fromkeys(t for t in expanded if t and "$" not in t))
+
+    @property
+    def tokens(self) -> List[Optional[str]]:
+        return list(self._budgets)
+
+    def _default_limit(self, token: Optional[str]) -> int:
+        if token:
+            return self.AUTHENTICATED_LIMIT
+        return self.UNAUTHENTICATED_LIMIT
+
+    def acquire(self) -> Optional[str]:
+        while True:
+            budget, delay = self._reserve()
+            if delay > 0:
+                time.sleep(delay)
+            if budget is not None:
+                return budget.token
+
+    async def acquire_async(self) -> Optional[str]:
+        while True:
+            budget, delay = self._reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if budget is not None:
+                return budget.token
+
+    def release(
+        self, token: Optional[str], headers: Optional[Mapping[str, str]] = None
+    ) -> None:
+        with self._lock:
+            budget = self._budgets.get(token)
+            if budget is None:
+                return
+            budget.in_flight = max(budget.in_flight - 1, 0)
+
+            if not headers or "X-RateLimit-Remaining" not in headers:
+                return
+            budget.remaining = int(headers["X-RateLimit-Remaining"])
+            budget.limit = int(headers.get("X-RateLimit-Limit", budget.limit))
+            reset_at = float(headers.get("X-RateLimit-Reset", 0))
+            if reset_at != budget.reset_at:
+                budget.warned = False
+            budget.reset_at = reset_at
+
+            if budget.remaining < 100 and not budget.warned:
+                budget.warned = True
+                print("\nWARNING: GitHub API rate limit is low!")
+                print(f"Token {budget.label}: {budget.remaining} requests remaining")
+                print(f"Rate limit resets at: {self._format_time(reset_at)}")
+
+    def _reserve(self) -> Tuple[Optional[TokenBudget], float]:
+        """Reserve a request slot on the best token.
+
+        Returns the reserved budget and how long to wait before sending, or
+        ``(None, wait)`` when every token is out of budget until a reset.
+        """
+        now = time.time()
+        with self._lock:
+            for budget in self._budgets.values():
+                if budget.reset_at and now >= budget.reset_at:
+                    budget.remaining = budget.limit
+                    budget.reset_at = 0.0
+                    budget.next_slot = 0.0
+
+            candidates = [b for b in self._budgets.values() if self._spendable(b) > 0]
+            if not candidates:
+                resets = [b.reset_at for b in self._budgets.values() if b.reset_at]
+                wait = max(min(resets) - now, 1.0) if resets else 1.0
+                if resets and min(resets) != self._announced_reset:
+                    self._announced_reset = min(resets)
+                    print(
+                        f"Rate limit budget exhausted on all tokens. "
+                        f"Waiting {math.ceil(wait)} seconds for the reset..."
+                    )
+                return None, wait
+
+            budget = min(
+                candidates,
+                key=lambda b: (max(b.next_slot - now, 0.0), -self._spendable(b)),
+            )
+            delay = max(budget.next_slot - now, 0.0)
+            budget.next_slot = max(budget.next_slot, now) + self._interval(budget, now)
+            budget.in_flight += 1
+            return budget, delay
+
+    def _margin(self, budget: TokenBudget) -> int:
+        # The unauthenticated limit is only 60, so the reserve scales down
+        margin = min(self.safety_margin, budget.limit // 10)
+        return max(margin, math.ceil(budget.limit * (1.0 - self.budget_share)))
+
+    def _spendable(self, budget: TokenBudget) -> int:
+        return budget.remaining - budget.in_flight - self._margin(budget)
+
+    def _interval(self, budget: TokenBudget, now: float) -> float:
+        # Spend freely while plenty of budget is left; once it runs low and
+        # is being spent faster than the window allows, spread what is left
+        # evenly until the reset.
+        if not budget.reset_at:
+            return 0.0
+        time_left = min(max(budget.reset_at - now, 0.0), self.WINDOW_SECONDS)
+        spendable = self._spendable(budget)
+        if spendable <= 0 or time_left <= 0:
+            return 0.0
+        share = spendable / max(budget.limit, 1)
+        if share >= self.PACING_THRESHOLD or share >= time_left / self.WINDOW_SECONDS:
+            return 0.0
+        return time_left / spendable
+
+    def projected_wait(self, pending_requests: int) -> float:
+        """Seconds of rate-limit waiting needed to send ``pending_requests`` more."""
+        now = time.time()
+        with self._lock:
+            budgets = list(self._budgets.values())
+            spendable = sum(max(self._spendable(b), 0) for b in budgets)
+            if pending_requests <= spendable:
+                return 0.0
+
+            per_window = sum(max(b.limit - self._margin(b), 1) for b in budgets)
+            resets = [b.reset_at - now for b in budgets if b.reset_at > now]
+            first_reset = min(resets) if resets else self.WINDOW_SECONDS
+
+        windows = math.ceil((pending_requests - spendable) / per_window)
+        return first_reset + (windows - 1) * self.WINDOW_SECONDS
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        with self._lock:
+            return [
+                {
+                    "token": b.label,
+                    "limit": b.limit,
+                    "remaining": b.remaining,
+                    "in_flight": b.in_flight,
+                    "resets_at": self._format_time(b.reset_at) if b.reset_at else None,
+                }
+                for b in self._budgets.values()
+            ]
+
+    @staticmethod
+    def _format_time(epoch: float) -> str:
+        return datetime.fromtimestamp(epoch).strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,309 @@
+import bisect
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+
+@dataclass
+class EndpointMetrics:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes: int = 0
+    latency_sum: float = 0.0
+    # Cumulative counts are derived on export; these are per-bucket
+    latency_buckets: List[int] = field(default_factory=list)
+    statuses: Dict[str, int] = field(default_factory=dict)
+    retry_reasons: Dict[str, int] = field(default_factory=dict)
+    cache_hits: int = 0
+    cache_revalidated: int = 0
+    cache_misses: int = 0
+    # Waited for an identical request already in flight (SingleFlight)
+    cache_coalesced: int = 0
+    rate_limit_used: int = 0
+
+
+class RequestMetrics:
+    """Per-endpoint counters and latency histograms for GitHub API calls.
+
+    Requests are grouped by method and endpoint template (``GET
+    /repos/{owner}/{repo}/pulls/{number}``), so a report run shows which
+    stage spends the time and whether the caches are paying off. One
+    instance can be shared by several clients; all methods are thread-safe.
+    """
+
+    LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    # Path segments that are followed by identifiers rather than resources
+    _NAMED_SEGMENTS = {
+        "repos": ("{owner}", "{repo}"),
+        "users": ("{user}",),
+        "orgs": ("{org}",),
+    }
+
+    def __init__(self):
+        self._endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self._rate_limit_remaining: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def endpoint_template(cls, url: str) -> str:
+        # /repos/o/r/pulls/12/reviews -> /repos/{owner}/{repo}/pulls/{number}/reviews
+        segments = [s for s in urlparse(url).path.split("/") if s]
+        template = []
+        i = 0
+        while i < len(segments):
+            segment = segments[i]
+            template.append(segment)
+            i += 1
+            for name in cls._NAMED_SEGMENTS.get(segment, ()):
+                if i < len(segments):
+                    template.append(name)
+                    i += 1
+            if i < len(segments) and re.fullmatch(r"\d+", segments[i]):
+                template.append("{number}")
+                i += 1
+        return "/" + "/".join(template)
+
+    def _endpoint(self, method: str, url: str) -> EndpointMetrics:
+        key = (method.upper(), self.endpoint_template(url))
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = EndpointMetrics(
+                latency_buckets=[0] * (len(self.LATENCY_BUCKETS) + 1)
+            )
+            self._endpoints[key] = endpoint
+        return endpoint
+
+    def record_response(
+        self,
+        method: str,
+        url: str,
+        status: Optional[int],
+        seconds: float,
+        size: int = 0,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Record one HTTP round trip; ``status`` is None when it failed."""
+        with self._lock:
+            endpoint = self._endpoint(method, url)
+            endpoint.requests += 1
+            endpoint.latency_sum += seconds
+            endpoint.latency_buckets[
+                bisect.bisect_left(self.LATENCY_BUCKETS, seconds)
+            ] += 1
+            endpoint.bytes += size
+            label = str(status) if status is not None else "error"
+            endpoint.statuses[label] = endpoint.statuses.get(label, 0) + 1
+            if status is None or status >= 400:
+                endpoint.errors += 1
+            # Conditional requests answered with 304 are not charged
+            if status is not None and status != 304:
+                endpoint.rate_limit_used += 1
+
+            remaining = (headers or {}).get("X-RateLimit-Remaining")
+            if remaining is not None and remaining.isdigit():
+                resource = (headers or {}).get("X-RateLimit-Resource", "core")
+                self._rate_limit_remaining[resource] = int(remaining)
+
+    def record_retry(self, method: str, url: str, reason: str) -> None:
+        with self._lock:
+            endpoint = self._endpoint(method, url)
+            endpoint.retries += 1
+            endpoint.retry_reasons[reason] = endpoint.retry_reasons.get(reason, 0) + 1
+
+    def record_cache(self, method: str, url: str, result: str) -> None:
+        """Record a cache lookup.
+
+        ``result`` is ``"hit"``, ``"revalidated"`` (304), ``"coalesced"``
+        (shared an in-flight request) or ``"miss"``.
+        """
+        with self._lock:
+            endpoint = self._endpoint(method, url)
+            if result == "hit":
+                endpoint.cache_hits += 1
+            elif result == "revalidated":
+                endpoint.cache_revalidated += 1
+            elif result == "coalesced":
+                endpoint.cache_coalesced += 1
+            else:
+                endpoint.cache_misses += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._rate_limit_remaining.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = []
+            for (method, template), endpoint in sorted(self._endpoints.items()):
+                endpoints.append(
+                    {
+                        "method": method,
+                        "endpoint": template,
+                        "requests": endpoint.requests,
+                        "errors": endpoint.errors,
+                        "retries": endpoint.retries,
+                        "retry_reasons": dict(endpoint.retry_reasons),
+                        "statuses": dict(endpoint.statuses),
+                        "bytes": endpoint.bytes,
+                        "latency_seconds": endpoint.latency_sum,
+                        "latency_buckets": dict(
+                            zip(
+                                [*map(str, self.LATENCY_BUCKETS), "+Inf"],
+                                endpoint.latency_buckets,
+                            )
+                        ),
+                        "cache_hits": endpoint.cache_hits,
+                        "cache_revalidated": endpoint.cache_revalidated,
+                        "cache_misses": endpoint.cache_misses,
+                        "cache_coalesced": endpoint.cache_coalesced,
+                        "rate_limit_used": endpoint.rate_limit_used,
+                    }
+                )
+            return {
+                "endpoints": endpoints,
+                "rate_limit_remaining": dict(self._rate_limit_remaining),
+            }
+
+    def summary(self) -> List[str]:
+        """Human readable lines, slowest endpoints (by total time) first."""
+        endpoints = sorted(
+            self.snapshot()["endpoints"],
+            key=lambda e: e["latency_seconds"],
+            reverse=True,
+        )
+        lines = []
+        for e in endpoints:
+            cached = e["cache_hits"] + e["cache_revalidated"] + e["cache_coalesced"]
+            lookups = cached + e["cache_misses"]
+            average = e["latency_seconds"] / e["requests"] if e["requests"] else 0.0
+            lines.append(
+                f"{e['method']} {e['endpoint']}: {e['requests']} requests, "
+                f"{e['latency_seconds']:.2f}s total ({average * 1000:.0f} ms avg), "
+                f"{e['bytes'] / 1024:.0f} KiB, {e['retries']} retries, "
+                f"cache {cached}/{lookups} "
+                f"({e['cache_revalidated']} revalidated, "
+                f"{e['cache_coalesced']} coalesced), "
+                f"{e['rate_limit_used']} rate limit points"
+            )
+        return lines
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def labels(**values: str) -> str:
+            pairs = ",".join(
+                f'{key}="{_escape_label(str(value))}"' for key, value in values.items()
+            )
+            return "{" + pairs + "}"
+
+        endpoints = snapshot["endpoints"]
+
+        family(
+            "github_requests_total", "counter", "GitHub API responses by status."
+        )
+        for e in endpoints:
+            for status, count in sorted(e["statuses"].items()):
+                lines.append(
+                    "github_requests_total"
+                    f"{labels(method=e['method'], endpoint=e['endpoint'], status=status)}"
+                    f" {count}"
+                )
+
+        family(
+            "github_request_duration_seconds",
+            "histogram",
+            "Latency of GitHub API round trips.",
+        )
+        for e in endpoints:
+            cumulative = 0
+            for le, count in e["latency_buckets"].items():
+                cumulative += count
+                lines.append(
+                    "github_request_duration_seconds_bucket"
+                    f"{labels(method=e['method'], endpoint=e['endpoint'], le=le)}"
+                    f" {cumulative}"
+                )
+            base = labels(method=e["method"], endpoint=e["endpoint"])
+            lines.append(
+                f"github_request_duration_seconds_sum{base} {e['latency_seconds']}"
+            )
+            lines.append(f"github_request_duration_seconds_count{base} {e['requests']}")
+
+        family(
+            "github_response_bytes_total",
+            "counter",
+            "Bytes received in GitHub API response bodies.",
+        )
+        for e in endpoints:
+            lines.append(
+                "github_response_bytes_total"
+                f"{labels(method=e['method'], endpoint=e['endpoint'])} {e['bytes']}"
+            )
+
+        family(
+            "github_request_retries_total", "counter", "Retried GitHub API requests."
+        )
+        for e in endpoints:
+            for reason, count in sorted(e["retry_reasons"].items()):
+                lines.append(
+                    "github_request_retries_total"
+                    f"{labels(method=e['method'], endpoint=e['endpoint'], reason=reason)}"
+                    f" {count}"
+                )
+
+        family(
+            "github_cache_lookups_total",
+            "counter",
+            "Response cache lookups by result (hit, revalidated, coalesced, miss).",
+        )
+        for e in endpoints:
+            for result, count in (
+                ("hit", e["cache_hits"]),
+                ("revalidated", e["cache_revalidated"]),
+                ("coalesced", e["cache_coalesced"]),
+                ("miss", e["cache_misses"]),
+            ):
+                lines.append(
+                    "github_cache_lookups_total"
+                    f"{labels(method=e['method'], endpoint=e['endpoint'], result=result)}"
+                    f" {count}"
+                )
+
+        family(
+            "github_rate_limit_used_total",
+            "counter",
+            "Rate limit points spent (responses other than 304).",
+        )
+        for e in endpoints:
+            lines.append(
+                "github_rate_limit_used_total"
+                f"{labels(method=e['method'], endpoint=e['endpoint'])}"
+                f" {e['rate_limit_used']}"
+            )
+
+        family(
+            "github_rate_limit_remaining",
+            "gauge",
+            "Last X-RateLimit-Remaining seen per resource.",
+        )
+        for resource, remaining in sorted(snapshot["rate_limit_remaining"].items()):
+            lines.append(
+                f"github_rate_limit_remaining{labels(resource=resource)} {remaining}"
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
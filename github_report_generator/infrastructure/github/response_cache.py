@@ -0,0 +1,114 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Pattern, Sequence, Tuple
+from urllib.parse import urlparse
+
+
+class ResponseCache:
+    """Bounded in-memory LRU cache for decoded GitHub responses.
+
+    Entries are charged by the size of their raw response body and evicted
+    least-recently-used first once ``max_bytes`` is exceeded. Each entry
+    expires after the TTL of its endpoint class, so slow-moving data such as
+    repository languages is kept far longer than PR lists.
+
+    Values are stored and handed out as they are, without copying: every
+    hit returns the same object, which other callers (even other report
+    jobs) may be reading too. Callers must never mutate cached values.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    DEFAULT_TTL = 10 * 60
+    DEFAULT_TTLS: Sequence[Tuple[str, float]] = (
+        (r"/languages$", 24 * 60 * 60),
+        (r"/stats/contributors$", 60 * 60),
+        (r"/pulls/\d+/reviews$", 15 * 60),
+        (r"/pulls/\d+$", 15 * 60),
+        (r"/pulls$", 5 * 60),
+        (r"/graphql$", 5 * 60),
+    )
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Optional[Sequence[Tuple[str, float]]] = None,
+        default_ttl: float = DEFAULT_TTL,
+    ):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._ttls: Sequence[Tuple[Pattern, float]] = [
+            (re.compile(pattern), ttl)
+            for pattern, ttl in (self.DEFAULT_TTLS if ttls is None else ttls)
+        ]
+        # key -> (value, size, expires_at), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def ttl_for(self, url: str) -> float:
+        path = urlparse(url).path
+        for pattern, ttl in self._ttls:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any, size: int, url: str) -> None:
+        ttl = self.ttl_for(url)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic() + ttl)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
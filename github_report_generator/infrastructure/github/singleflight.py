@@ -0,0 +1,91 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class SingleFlight:
+    """Coalesces concurrent identical requests into one.
+
+    The first caller for a key runs the request; callers arriving while it
+    is in flight wait for and share its result (or exception) instead of
+    sending a duplicate. Nothing is kept once the request completes, so this
+    only collapses bursts; the response caches handle repeats.
+
+    Works across threads and event loops, so sync and async clients (and
+    concurrent report jobs) in one process can share the instance returned
+    by ``SingleFlight.shared()``.
+
+    Every caller of a coalesced call gets the very same result object, so
+    results (decoded GitHub payloads) must be treated as read-only: build
+    new lists and dicts from them rather than changing them in place.
+    """
+
+    _shared: Optional["SingleFlight"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._calls: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    @classmethod
+    def shared(cls) -> "SingleFlight":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        # Returns the call's future and whether this caller leads it
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def _finish(self, key: str) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run ``fn`` once per in-flight ``key``; returns (result, shared)."""
+        future, leader = self._join(key)
+        if not leader:
+            return future.result(), True
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result, False
+
+    async def do_async(
+        self, key: str, fn: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future), True
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Cancelling the leader must not cancel the callers waiting on it
+            self._finish(key)
+            future.set_exception(Exception("Coalesced request was cancelled"))
+            raise
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
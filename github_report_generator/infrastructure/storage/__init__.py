@@ -0,0 +1,5 @@
+"""Local storage for data synced from GitHub."""
+
+from .sqlite_store import SQLiteStore, SyncState
+
+__all__ = ['SQLiteStore', 'SyncState']
@@ -0,0 +1,516 @@
+import json
+import sqlite3
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ...domain.model import (
+    ContributorStats,
+    PullRequest,
+    PullRequestRecord,
+    PullRequestState,
+    ReviewMetricsRecord,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS repositories (
+    repo_name TEXT PRIMARY KEY,
+    high_water_mark TEXT,
+    covered_since TEXT,
+    languages TEXT,
+    synced_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS pull_requests (
+    repo_name TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    state TEXT NOT NULL,
+    author TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    closed_at TEXT,
+    merged_at TEXT,
+    additions INTEGER NOT NULL DEFAULT 0,
+    deletions INTEGER NOT NULL DEFAULT 0,
+    changed_files INTEGER NOT NULL DEFAULT 0,
+    comments INTEGER NOT NULL DEFAULT 0,
+    review_comments INTEGER NOT NULL DEFAULT 0,
+    commits INTEGER NOT NULL DEFAULT 0,
+    branch TEXT NOT NULL,
+    first_commit_at TEXT,
+    ready_for_review_at TEXT,
+    review_requested_at TEXT,
+    time_to_first_review REAL,
+    time_to_approval REAL,
+    number_of_reviewers INTEGER NOT NULL DEFAULT 0,
+    number_of_comments INTEGER NOT NULL DEFAULT 0,
+    number_of_review_rounds INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (repo_name, number)
+);
+CREATE INDEX IF NOT EXISTS idx_pull_requests_updated_at
+    ON pull_requests (repo_name, updated_at);
+CREATE INDEX IF NOT EXISTS idx_pull_requests_merged_at
+    ON pull_requests (repo_name, merged_at);
+CREATE INDEX IF NOT EXISTS idx_pull_requests_author
+    ON pull_requests (repo_name, author);
+
+CREATE TABLE IF NOT EXISTS labels (
+    repo_name TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (repo_name, number, name)
+);
+
+CREATE TABLE IF NOT EXISTS reviews (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    repo_name TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    reviewer TEXT NOT NULL,
+    state TEXT,
+    submitted_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reviews_pull_request
+    ON reviews (repo_name, number);
+CREATE INDEX IF NOT EXISTS idx_reviews_reviewer
+    ON reviews (repo_name, reviewer);
+
+CREATE TABLE IF NOT EXISTS contributor_weeks (
+    repo_name TEXT NOT NULL,
+    login TEXT NOT NULL,
+    week_start TEXT NOT NULL,
+    commits INTEGER NOT NULL DEFAULT 0,
+    additions INTEGER NOT NULL DEFAULT 0,
+    deletions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (repo_name, login, week_start)
+);
+"""
+
+PULL_REQUEST_COLUMNS = (
+    "number",
+    "title",
+    "state",
+    "author",
+    "created_at",
+    "updated_at",
+    "closed_at",
+    "merged_at",
+    "additions",
+    "deletions",
+    "changed_files",
+    "comments",
+    "review_comments",
+    "commits",
+    "branch",
+    "first_commit_at",
+    "ready_for_review_at",
+    "review_requested_at",
+)
+DATETIME_COLUMNS = {
+    "created_at",
+    "updated_at",
+    "closed_at",
+    "merged_at",
+    "first_commit_at",
+    "ready_for_review_at",
+    "review_requested_at",
+}
+# PullRequest.review_metrics, flattened into the pull_requests table
+REVIEW_METRICS_COLUMNS = {
+    "time_to_first_review": "REAL",
+    "time_to_approval": "REAL",
+    "number_of_reviewers": "INTEGER NOT NULL DEFAULT 0",
+    "number_of_comments": "INTEGER NOT NULL DEFAULT 0",
+    "number_of_review_rounds": "INTEGER NOT NULL DEFAULT 0",
+}
+STORED_COLUMNS = PULL_REQUEST_COLUMNS + tuple(REVIEW_METRICS_COLUMNS)
+# Columns added to pull_requests after its first release
+ADDED_COLUMNS = {
+    "first_commit_at": "TEXT",
+    "ready_for_review_at": "TEXT",
+    "review_requested_at": "TEXT",
+    **REVIEW_METRICS_COLUMNS,
+}
+
+
+@dataclass
+class SyncState:
+    # Latest updated_at seen for the repository; the next sync only asks for
+    # pull requests updated since then.
+    high_water_mark: Optional[datetime] = None
+    # Oldest updated_at the stored pull requests are complete from
+    # (None: the whole history)
+    covered_since: Optional[datetime] = None
+    # When the repository was last synced (UTC); set by save_sync_state
+    synced_at: Optional[datetime] = None
+
+
+class SQLiteStore:
+    """Embedded system of record for data synced from GitHub.
+
+    Holds pull requests with their labels and reviews, contributor weekly
+    statistics and repository languages, so reports over any stored period
+    can be built without calling GitHub. Timestamps are stored as ISO-8601
+    text, which SQLite compares in chronological order.
+    """
+
+    FILENAME = "report_store.sqlite3"
+
+    def __init__(self, path: str):
+        path = Path(path).expanduser()
+        if path.is_dir() or not path.suffix:
+            path = path / self.FILENAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._add_missing_columns()
+        self._conn.commit()
+
+    def _add_missing_columns(self) -> None:
+        # Older stores lack the newer columns; their PRs get the values the
+        # next time a sync fetches them.
+        existing = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(pull_requests)")
+        }
+        for column, definition in ADDED_COLUMNS.items():
+            if column not in existing:
+                self._conn.execute(
+                    f"ALTER TABLE pull_requests ADD COLUMN {column} {definition}"
+                )
+
+    # Sync state
+
+    def get_sync_state(self, repo_name: str) -> Optional[SyncState]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT high_water_mark, covered_since, synced_at FROM repositories "
+                "WHERE repo_name = ? AND synced_at IS NOT NULL",
+                (repo_name,),
+            ).fetchone()
+        if row is None:
+            return None
+        return SyncState(
+            high_water_mark=self._parse(row[0]),
+            covered_since=self._parse(row[1]),
+            synced_at=self._parse(row[2]),
+        )
+
+    def save_sync_state(self, repo_name: str, state: SyncState) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO repositories
+                    (repo_name, high_water_mark, covered_since, synced_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (repo_name) DO UPDATE SET
+                    high_water_mark = excluded.high_water_mark,
+                    covered_since = excluded.covered_since,
+                    synced_at = excluded.synced_at
+                """,
+                (
+                    repo_name,
+                    self._format(state.high_water_mark),
+                    self._format(state.covered_since),
+                    self._format(datetime.now(timezone.utc)),
+                ),
+            )
+
+    def has_repository(self, repo_name: str) -> bool:
+        with self._lock:
+            return (
+                self._conn.execute(
+                    "SELECT 1 FROM repositories WHERE repo_name = ?", (repo_name,)
+                ).fetchone()
+                is not None
+            )
+
+    # Pull requests
+
+    def upsert_pull_requests(
+        self,
+        repo_name: str,
+        prs: Iterable[PullRequest],
+        reviews: Optional[Dict[int, List[Dict[str, Any]]]] = None,
+    ) -> int:
+        """Insert or update pull requests in one transaction.
+
+        Labels and reviews of the given PRs are replaced. ``reviews`` maps a
+        PR number to its review records (``reviewer``, ``state``,
+        ``submitted_at``); PRs without an entry get one record per reviewer.
+        """
+        # A sync may see the same PR twice (overlap, backfill); keep the newest
+        latest: Dict[int, PullRequest] = {}
+        for pr in prs:
+            if pr.number not in latest or pr.updated_at >= latest[pr.number].updated_at:
+                latest[pr.number] = pr
+        prs = list(latest.values())
+        if not prs:
+            return 0
+        reviews = reviews or {}
+
+        pr_rows = [self._pull_request_row(repo_name, pr) for pr in prs]
+        label_rows = [
+            (repo_name, pr.number, label) for pr in prs for label in set(pr.labels)
+        ]
+        review_rows = []
+        for pr in prs:
+            records = reviews.get(pr.number) or [
+                {"reviewer": reviewer} for reviewer in pr.reviewers
+            ]
+            review_rows.extend(
+                (
+                    repo_name,
+                    pr.number,
+                    record["reviewer"],
+                    record.get("state"),
+                    self._format(record.get("submitted_at")),
+                )
+                for record in records
+            )
+        numbers = [(repo_name, pr.number) for pr in prs]
+
+        columns = ", ".join(STORED_COLUMNS)
+        updates = ", ".join(
+            f"{column} = excluded.{column}"
+            for column in STORED_COLUMNS
+            if column != "number"
+        )
+        placeholders = ", ".join("?" * (len(STORED_COLUMNS) + 1))
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"""
+                INSERT INTO pull_requests (repo_name, {columns})
+                VALUES ({placeholders})
+                ON CONFLICT (repo_name, number) DO UPDATE SET {updates}
+                """,
+                pr_rows,
+            )
+            self._conn.executemany(
+                "DELETE FROM labels WHERE repo_name = ? AND number = ?", numbers
+            )
+            self._conn.executemany(
+                "INSERT INTO labels (repo_name, number, name) VALUES (?, ?, ?)",
+                label_rows,
+            )
+            self._conn.executemany(
+                "DELETE FROM reviews WHERE repo_name = ? AND number = ?", numbers
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO reviews (repo_name, number, reviewer, state, submitted_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                review_rows,
+            )
+        return len(prs)
+
+    def _pull_request_row(self, repo_name: str, pr: PullRequest) -> tuple:
+        values = []
+        for column in PULL_REQUEST_COLUMNS:
+            value = getattr(pr, column)
+            if column in DATETIME_COLUMNS:
+                value = self._format(value)
+            elif column == "state":
+                value = value.value
+            values.append(value)
+        for column in REVIEW_METRICS_COLUMNS:
+            values.append(getattr(pr.review_metrics, column))
+        return (repo_name, *values)
+
+    def get_pull_requests(
+        self,
+        repo_name: str,
+        state: PullRequestState = PullRequestState.ALL,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[PullRequestRecord]:
+        """Stored PRs updated within the window, most recently updated first."""
+        conditions = ["repo_name = ?"]
+        params: List[Any] = [repo_name]
+        if state == PullRequestState.MERGED:
+            conditions.append("merged_at IS NOT NULL")
+        elif state == PullRequestState.CLOSED:
+            # Like GitHub's "closed" filter, this includes merged PRs
+            conditions.append("state != 'open'")
+        elif state != PullRequestState.ALL:
+            conditions.append("state = ?")
+            params.append(state.value)
+        if start_date:
+            conditions.append("updated_at >= ?")
+            params.append(self._format(start_date))
+        if end_date:
+            conditions.append("updated_at <= ?")
+            params.append(self._format(end_date))
+        where = " AND ".join(conditions)
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(STORED_COLUMNS)} FROM pull_requests "
+                f"WHERE {where} ORDER BY updated_at DESC, number DESC",
+                params,
+            ).fetchall()
+            # Labels and reviewers for the whole window in two queries
+            labels = defaultdict(list)
+            for number, name in self._conn.execute(
+                f"SELECT number, name FROM labels WHERE repo_name = ? AND number IN "
+                f"(SELECT number FROM pull_requests WHERE {where}) ORDER BY name",
+                [repo_name] + params,
+            ):
+                labels[number].append(name)
+            reviewers = defaultdict(list)
+            for number, reviewer in self._conn.execute(
+                f"SELECT DISTINCT number, reviewer FROM reviews WHERE repo_name = ? "
+                f"AND number IN (SELECT number FROM pull_requests WHERE {where}) "
+                f"ORDER BY reviewer",
+                [repo_name] + params,
+            ):
+                reviewers[number].append(reviewer)
+
+        prs = []
+        for row in rows:
+            values = dict(zip(PULL_REQUEST_COLUMNS, row))
+            for column in DATETIME_COLUMNS:
+                values[column] = self._parse(values[column])
+            if values["merged_at"]:
+                # Stored before merged PRs were told apart from closed ones
+                values["state"] = PullRequestState.MERGED
+            else:
+                values["state"] = PullRequestState(values["state"])
+            review_metrics = ReviewMetricsRecord(
+                **dict(zip(REVIEW_METRICS_COLUMNS, row[len(PULL_REQUEST_COLUMNS):]))
+            )
+            number = values["number"]
+            prs.append(
+                PullRequestRecord(
+                    **values,
+                    labels=labels[number],
+                    reviewers=reviewers[number],
+                    review_metrics=review_metrics,
+                )
+            )
+        return prs
+
+    # Contributor statistics and languages
+
+    def replace_contributor_weeks(
+        self, repo_name: str, contributors: List[Dict[str, Any]]
+    ) -> None:
+        """Store the weekly rows of a ``/stats/contributors`` payload.
+
+        The endpoint always returns the full history, so the repository's
+        previous rows are replaced. Weeks without activity are skipped.
+        """
+        rows = [
+            (
+                repo_name,
+                contributor["author"]["login"],
+                self._format(datetime.fromtimestamp(week["w"], timezone.utc)),
+                week.get("c", 0),
+                week.get("a", 0),
+                week.get("d", 0),
+            )
+            for contributor in contributors
+            if contributor.get("author")
+            for week in contributor.get("weeks", [])
+            if week.get("c") or week.get("a") or week.get("d")
+        ]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM contributor_weeks WHERE repo_name = ?", (repo_name,)
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO contributor_weeks
+                    (repo_name, login, week_start, commits, additions, deletions)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+
+    def get_contributor_stats(
+        self,
+        repo_name: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Dict[str, ContributorStats]:
+        # Without a window the totals match ContributorsService, which sums
+        # the contributor's whole history.
+        conditions = ["repo_name = ?"]
+        params: List[Any] = [repo_name]
+        if start_date:
+            conditions.append("week_start >= ?")
+            params.append(self._format(start_date))
+        if end_date:
+            conditions.append("week_start <= ?")
+            params.append(self._format(end_date))
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT login, SUM(commits), SUM(additions), SUM(deletions)
+                FROM contributor_weeks
+                WHERE {' AND '.join(conditions)}
+                GROUP BY login
+                """,
+                params,
+            ).fetchall()
+        return {
+            login: ContributorStats(
+                login=login, commits=commits, additions=additions, deletions=deletions
+            )
+            for login, commits, additions, deletions in rows
+        }
+
+    def save_languages(self, repo_name: str, languages: Dict[str, int]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO repositories (repo_name, languages) VALUES (?, ?)
+                ON CONFLICT (repo_name) DO UPDATE SET languages = excluded.languages
+                """,
+                (repo_name, json.dumps(languages)),
+            )
+
+    def get_languages(self, repo_name: str) -> Dict[str, int]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT languages FROM repositories WHERE repo_name = ?",
+                (repo_name,),
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] else {}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _parse(value: Optional[str]) -> Optional[datetime]:
+        # Stored as naive UTC text; read back as aware UTC
+        if not value:
+            return None
+        if len(value) == 19:
+            return datetime.fromisoformat(value + "+00:00")
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
+
+    @staticmethod
+    def _format(value: Optional[datetime]) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return value
+        if value.tzinfo is not None:
+            # Naive UTC text keeps rows comparable as strings, as before
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat(timespec="seconds")
@@ -27,10 +27,13 @@ setup(
         "python-dotenv>=0.19.0",
         "PyGithub>=1.55",
         "pandas>=1.3.0",
+        "numpy>=1.21.0",
         "matplotlib>=3.4.0",
         "python-dateutil>=2.8.2",
         "pydantic>=1.8.0",
         "requests>=2.26.0",
+        "httpx>=0.23.0",
+        "ijson>=3.1",
         "tqdm>=4.62.0",
         "plotly>=5.3.0",
         "python-multipart>=0.0.5",
@@ -41,6 +44,7 @@ setup(
     entry_points={
         "console_scripts": [
             "github-report=github_report_generator.application.cli:main",
+            "github-report-sync=github_report_generator.application.sync_daemon:main",
         ],
     },
 )
@@ -0,0 +1,93 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from github_report_generator.application import api
+from github_report_generator.infrastructure import GitHubClient
+from github_report_generator.infrastructure.storage import SQLiteStore, SyncState
+
+READABLE = {("owner/repo", "reader-token")}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    store = SQLiteStore(str(tmp_path / "store.db"))
+    # Synced earlier with some other token
+    store.save_sync_state("owner/repo", SyncState())
+    monkeypatch.setattr(api, "_store", store)
+    monkeypatch.setattr(
+        GitHubClient,
+        "can_read_repository",
+        lambda self, repo_name, token: (repo_name, token) in READABLE,
+    )
+    yield TestClient(api.app)
+    store.close()
+
+
+def report(client, **fields):
+    return client.post(
+        "/api/report", json={"repo_name": "owner/repo", "offline": True, **fields}
+    )
+
+
+def test_offline_report_needs_a_token(client):
+    assert report(client).status_code == 401
+
+
+def test_offline_report_needs_read_access(client):
+    assert report(client, github_token="other-token").status_code == 403
+
+
+def test_offline_report_for_a_reader(client):
+    response = report(client, github_token="reader-token")
+    assert response.status_code == 200
+    assert response.json()["report"]["repo_name"] == "owner/repo"
+
+
+@pytest.fixture
+def fresh_store(client, monkeypatch):
+    # Synced by the daemon moments ago, so within any max age
+    api._store.save_sync_state("owner/repo", SyncState())
+    monkeypatch.setenv("GITHUB_REPORT_MAX_AGE", "3600")
+    fetched = []
+
+    def fetch(self, **kwargs):
+        fetched.append(kwargs["repo_name"])
+        raise Exception("Not Found")
+
+    monkeypatch.setattr(
+        "github_report_generator.application.services.incremental_sync_service."
+        "IncrementalSyncService.get_pull_requests",
+        fetch,
+    )
+    monkeypatch.setattr(
+        "github_report_generator.application.services.contributors_service."
+        "ContributorsService.start_contributor_stats",
+        lambda self, repo_name: StatsPoll(),
+    )
+    return fetched
+
+
+class StatsPoll:
+    def result(self, timeout=None):
+        return None
+
+    def cancel(self):
+        pass
+
+
+@pytest.mark.parametrize("token", [None, "other-token"])
+def test_fresh_store_not_served_without_read_access(client, fresh_store, token):
+    response = client.post(
+        "/api/report", json={"repo_name": "owner/repo", "github_token": token}
+    )
+    assert response.status_code == 500
+    assert fresh_store == ["owner/repo"]
+
+
+def test_fresh_store_served_to_a_reader(client, fresh_store):
+    response = client.post(
+        "/api/report",
+        json={"repo_name": "owner/repo", "github_token": "reader-token"},
+    )
+    assert response.status_code == 200
+    assert fresh_store == []
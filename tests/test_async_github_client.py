@@ -0,0 +1,41 @@
+import asyncio
+
+from github_report_generator.infrastructure.github import AsyncGitHubClient
+
+LINKS = {
+    "next": "https://api.github.com/repos/o/r/pulls?page=2",
+    "last": "https://api.github.com/repos/o/r/pulls?page=10",
+}
+
+
+class CountingClient(AsyncGitHubClient):
+    """Serves numbered pages and records how many were requested at once."""
+
+    def __init__(self):
+        super().__init__()
+        self.requested = 0
+        self.consumed = 0
+        self.max_ahead = 0
+
+    async def get_page(self, url, params=None, fields=None):
+        self.requested += 1
+        self.max_ahead = max(self.max_ahead, self.requested - self.consumed)
+        await asyncio.sleep(0)
+        return int(url.rsplit("=", 1)[1]), {}
+
+
+def test_iter_remaining_pages_reads_a_bounded_window_ahead():
+    async def consume(client):
+        pages = []
+        async for page in client.iter_remaining_pages(LINKS, window=2):
+            client.consumed += 1
+            pages.append(page)
+            # A slow consumer: the client must not race ahead meanwhile
+            await asyncio.sleep(0.01)
+        return pages
+
+    client = CountingClient()
+    pages = asyncio.run(consume(client))
+
+    assert pages == list(range(2, 11))
+    assert client.max_ahead <= 2
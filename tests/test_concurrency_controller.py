@@ -0,0 +1,43 @@
+import asyncio
+import threading
+
+from github_report_generator.infrastructure.github import (
+    AdaptiveConcurrencyController,
+)
+
+
+class CountingController(AdaptiveConcurrencyController):
+    def __init__(self, max_limit):
+        super().__init__(max_limit)
+        self.attempts = 0
+
+    def _try_acquire(self):
+        self.attempts += 1
+        return super()._try_acquire()
+
+
+def test_async_waiters_sleep_until_a_slot_is_released():
+    controller = CountingController(1)
+    controller.acquire()
+
+    async def wait_for_slots():
+        waiters = [
+            asyncio.ensure_future(controller.acquire_async()) for _ in range(5)
+        ]
+        # Saturated: the waiters must not keep re-checking meanwhile
+        await asyncio.sleep(0.3)
+        assert controller.attempts == 6
+        assert not any(waiter.done() for waiter in waiters)
+
+        # Released from another thread, as the thread pool clients do
+        for _ in waiters:
+            threading.Thread(target=controller.release).start()
+            done, _ = await asyncio.wait(
+                [w for w in waiters if not w.done()],
+                timeout=1,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            assert len(done) == 1
+
+    asyncio.run(wait_for_slots())
+    assert controller.in_flight == 1
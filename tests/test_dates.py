@@ -0,0 +1,28 @@
+from argparse import Namespace
+from datetime import datetime, timezone
+
+from github_report_generator.application.utils import dates
+
+
+class LateOnNewYearsEve(datetime):
+    """23:30 UTC on 31 December: already January east of UTC."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2024, 12, 31, 23, 30, tzinfo=timezone.utc).astimezone(tz)
+
+
+def test_month_defaults_to_the_current_utc_month(monkeypatch):
+    monkeypatch.setattr(dates, "datetime", LateOnNewYearsEve)
+
+    start, end = dates.calculate_date_range(Namespace(month=None, year=None))
+
+    assert start == datetime(2024, 12, 1, tzinfo=timezone.utc)
+    assert end == datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_given_month_and_year():
+    start, end = dates.calculate_date_range(Namespace(month=2, year=2024))
+
+    assert start == datetime(2024, 2, 1, tzinfo=timezone.utc)
+    assert end == datetime(2024, 3, 1, tzinfo=timezone.utc)
@@ -0,0 +1,53 @@
+import pytest
+
+from github_report_generator.infrastructure.github import (
+    GitHubClient,
+    SecondaryRateLimitError,
+)
+
+
+class ThrottledClient(GitHubClient):
+    """Answers every request as if its own retries ran out on a secondary
+    rate limit."""
+
+    def __init__(self):
+        super().__init__(token="token")
+        self.sent = 0
+
+    def _send(self, method, url, params=None, json=None, headers=None):
+        self.sent += 1
+        raise SecondaryRateLimitError("secondary rate limit", 480.0)
+
+
+def test_secondary_rate_limit_is_not_retried_again():
+    client = ThrottledClient()
+    with pytest.raises(SecondaryRateLimitError):
+        client.make_request("GET", "repos/o/r")
+    assert client.sent == 1
+
+
+class PagedClient(GitHubClient):
+    def __init__(self):
+        super().__init__(token="token", max_workers=4)
+
+    def make_request(self, method, url, params=None, json=None):
+        if url.endswith("/2"):
+            raise Exception("boom")
+        return {"url": url}
+
+    def get_all_pages(self, url, params=None, max_pages=None, fields=None):
+        return [[self.make_request("GET", url)]]
+
+
+def test_batches_report_each_finished_request():
+    client = PagedClient()
+    urls = [f"repos/o/r/pulls/{n}" for n in range(1, 6)]
+    done = []
+
+    details = client.batch_request(urls, on_done=done.append)
+    reviews = client.batch_all_pages(urls, on_done=done.append)
+    client.close()
+
+    # Failed requests count as finished too
+    assert sorted(done) == sorted(urls * 2)
+    assert details[urls[1]] is None and reviews[urls[1]] is None
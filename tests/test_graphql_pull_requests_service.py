@@ -0,0 +1,96 @@
+from github_report_generator.application.services.graphql_pull_requests_service import (
+    GraphQLPullRequestsService,
+)
+
+
+def review(i, state="COMMENTED"):
+    return {
+        "author": {"login": f"reviewer{i}"},
+        "state": state,
+        "submittedAt": f"2024-01-0{1 + i // 100}T{i % 24:02d}:00:00Z",
+        "comments": {"totalCount": 0},
+    }
+
+
+def reviews_page(reviews, next_cursor=None):
+    return {
+        "pageInfo": {"hasNextPage": next_cursor is not None, "endCursor": next_cursor},
+        "nodes": reviews,
+    }
+
+
+class FakeGraphQLClient:
+    """One PR with 250 reviews, only the last of which approves, and 120
+    labels."""
+
+    def __init__(self):
+        self.reviews = [review(i) for i in range(249)] + [review(249, "APPROVED")]
+        self.labels = [{"name": f"label{i}"} for i in range(120)]
+        self.queries = []
+        # The same payload for every list query, as a response cache hit
+        # or a coalesced request hands out
+        self.node = {
+            "number": 7,
+            "title": "Big review",
+            "state": "MERGED",
+            "createdAt": "2024-01-01T00:00:00Z",
+            "updatedAt": "2024-01-05T00:00:00Z",
+            "closedAt": "2024-01-05T00:00:00Z",
+            "mergedAt": "2024-01-05T00:00:00Z",
+            "author": {"login": "alice"},
+            "headRefName": "feature/big",
+            "reviews": reviews_page(self.reviews[:100], "c100"),
+            "labels": reviews_page(self.labels[:100], "c100"),
+        }
+
+    def graphql(self, query, variables):
+        self.queries.append(variables)
+        if "pullRequests(" in query:
+            return {
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        "nodes": [self.node],
+                    }
+                }
+            }
+        pr = {}
+        for connection, items in (("reviews", self.reviews), ("labels", self.labels)):
+            if f"{connection}7" in variables:
+                offset = int(variables[f"{connection}7"][1:])
+                more = items[offset : offset + 100]
+                cursor = f"c{offset + 100}" if offset + 100 < len(items) else None
+                pr[connection] = reviews_page(more, cursor)
+        return {"repository": {"pr7": pr}}
+
+
+def test_reviews_past_the_first_page_are_fetched():
+    client = FakeGraphQLClient()
+
+    prs = GraphQLPullRequestsService(client).get_pull_requests(
+        "o/r", show_progress=False
+    )
+
+    assert len(client.queries) == 3
+    metrics = prs[0].review_metrics
+    assert metrics.number_of_reviewers == 250
+    assert metrics.number_of_comments == 249
+    # The approval is only on the third page of reviews
+    assert metrics.time_to_approval == 57.0
+    assert prs[0].labels == [f"label{i}" for i in range(120)]
+
+
+def test_shared_payloads_are_left_as_they_are():
+    client = FakeGraphQLClient()
+    service = GraphQLPullRequestsService(client)
+
+    # Two reports over the same (cached) list payload
+    first = service.get_pull_requests("o/r", show_progress=False)
+    second = service.get_pull_requests("o/r", show_progress=False)
+
+    for connection in ("reviews", "labels"):
+        assert len(client.node[connection]["nodes"]) == 100
+        assert client.node[connection]["pageInfo"]["endCursor"] == "c100"
+    for prs in (first, second):
+        assert prs[0].review_metrics.number_of_reviewers == 250
+        assert len(prs[0].labels) == 120
@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+
+from github_report_generator.application.services.pull_requests_service import (
+    PaginationStats,
+    PullRequestsService,
+)
+
+
+class ShortBudgetClient:
+    """Stands in for a client whose rate limit budget is spent."""
+
+    def projected_wait(self, requests):
+        return 3600.0
+
+
+def budget_warning(capsys, start_date, windowed=True):
+    service = PullRequestsService(ShortBudgetClient(), windowed=windowed)
+    stats = PaginationStats(pages_fetched=1, pages_total=5)
+    service._warn_if_budget_short(service.github_client, stats, start_date)
+    return capsys.readouterr().out
+
+
+def test_no_budget_warning_for_windowed_runs(capsys):
+    start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert budget_warning(capsys, start_date) == ""
+
+
+def test_budget_warning_for_full_scans(capsys):
+    assert "WARNING" in budget_warning(capsys, None)
+    start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert "WARNING" in budget_warning(capsys, start_date, windowed=False)
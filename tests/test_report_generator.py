@@ -0,0 +1,360 @@
+"""The vectorized metrics checked against the straightforward per-PR
+computation they replaced, over random pull requests."""
+
+import random
+import re
+import statistics
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from github_report_generator.domain import (
+    ContributorStats,
+    PullRequestRecord,
+    PullRequestState,
+    ReportGenerator,
+    ReviewMetricsRecord,
+)
+from github_report_generator.domain.service.velocity import calculate_weekly_metrics
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+PATTERNS = {
+    "Features": r"^feature/|^feat/",
+    "Bug Fixes": r"^fix/|^bugfix/",
+    "Docs": r"^docs/",
+    "Anything with f": r"^f",
+}
+BRANCHES = ["feature/x", "feat/y", "fix/z", "docs/a", "chore/b", "random", "FIX/upper"]
+
+
+def random_prs(count, seed):
+    rnd = random.Random(seed)
+    prs = []
+    for number in range(1, count + 1):
+        created_at = START + timedelta(seconds=rnd.randint(0, 90 * 86400))
+        state = rnd.choice(
+            [
+                PullRequestState.OPEN,
+                PullRequestState.CLOSED,
+                PullRequestState.MERGED,
+                PullRequestState.MERGED,
+            ]
+        )
+        merged_at = None
+        if state == PullRequestState.MERGED and rnd.random() < 0.95:
+            merged_at = created_at + timedelta(seconds=rnd.randint(0, 20 * 86400))
+        closed_at = merged_at or (
+            created_at + timedelta(hours=rnd.randint(1, 100))
+            if state == PullRequestState.CLOSED
+            else None
+        )
+        reviewers = rnd.sample([f"user{k}" for k in range(15)], rnd.randint(0, 4))
+        prs.append(
+            PullRequestRecord(
+                number=number,
+                title=f"PR {number}",
+                state=state,
+                author=f"user{rnd.randint(0, 20)}",
+                created_at=created_at,
+                updated_at=created_at,
+                closed_at=closed_at,
+                merged_at=merged_at,
+                additions=rnd.choice([0, 5, 10, 11, 50, 51, rnd.randint(0, 2000)]),
+                deletions=rnd.randint(0, 300),
+                branch=rnd.choice(BRANCHES),
+                # First commits may come after creation (rebases), drafts
+                # are marked ready later, and most timings can be unknown
+                first_commit_at=created_at - timedelta(hours=rnd.randint(-5, 50))
+                if rnd.random() < 0.7
+                else None,
+                ready_for_review_at=created_at + timedelta(hours=rnd.randint(0, 40))
+                if rnd.random() < 0.3
+                else None,
+                review_requested_at=created_at + timedelta(hours=rnd.randint(-2, 30))
+                if rnd.random() < 0.6
+                else None,
+                reviewers=reviewers,
+                review_metrics=ReviewMetricsRecord(
+                    time_to_first_review=rnd.choice([None, rnd.uniform(0, 60)]),
+                    time_to_approval=rnd.choice([None, rnd.uniform(0, 90)]),
+                    number_of_reviewers=len(reviewers),
+                    number_of_comments=rnd.randint(0, 9),
+                ),
+            )
+        )
+    return prs
+
+
+# Reference: one PR at a time, as metrics were computed before the
+# columnar PullRequestTable
+
+
+def hours(start, end):
+    return max((end - start).total_seconds() / 3600, 0.0)
+
+
+def lead_time(pr):
+    start = pr.created_at
+    if pr.first_commit_at and pr.first_commit_at < start:
+        start = pr.first_commit_at
+    return hours(start, pr.merged_at)
+
+
+def cycle_time(pr):
+    return hours(pr.ready_for_review_at or pr.created_at, pr.merged_at)
+
+
+def size_category(pr):
+    changes = pr.additions + pr.deletions
+    for bound, category in ((10, "xs"), (50, "s"), (250, "m"), (1000, "l")):
+        if changes <= bound:
+            return category
+    return "xl"
+
+
+def median(values):
+    return statistics.median(values) if values else None
+
+
+def reference_report(prs):
+    expected = {
+        "prs_merged": 0,
+        "prs_open": 0,
+        "prs_closed": 0,
+        "pr_size_distribution": {"xs": 0, "s": 0, "m": 0, "l": 0, "xl": 0},
+    }
+    contributors = {}
+    initiatives = {}
+    initiative_times = defaultdict(lambda: ([], []))
+    pr_initiatives = {}
+
+    def contributor(login):
+        return contributors.setdefault(
+            login,
+            {
+                "prs_authored": 0,
+                "prs_merged": 0,
+                "reviews_given": 0,
+                "reviews_received": 0,
+                "lead_times": [],
+                "cycle_times": [],
+            },
+        )
+
+    for pr in prs:
+        expected["pr_size_distribution"][size_category(pr)] += 1
+        expected[f"prs_{pr.state.value}"] += 1
+
+        author = contributor(pr.author)
+        author["prs_authored"] += 1
+        if pr.state == PullRequestState.MERGED:
+            author["prs_merged"] += 1
+        for reviewer in pr.reviewers:
+            contributor(reviewer)["reviews_given"] += 1
+            author["reviews_received"] += 1
+
+        merged = pr.state == PullRequestState.MERGED and pr.merged_at
+        if merged:
+            author["lead_times"].append(lead_time(pr))
+            author["cycle_times"].append(cycle_time(pr))
+
+        matched = []
+        for name, pattern in PATTERNS.items():
+            if re.match(pattern, pr.branch.lower(), re.IGNORECASE):
+                matched.append(name)
+                stats = initiatives.setdefault(name, {"pr_count": 0, "contributors": {}})
+                stats["pr_count"] += 1
+                stats["contributors"][pr.author] = (
+                    stats["contributors"].get(pr.author, 0) + 1
+                )
+                if merged:
+                    initiative_times[name][0].append(lead_time(pr))
+                    initiative_times[name][1].append(cycle_time(pr))
+        pr_initiatives[pr.number] = matched
+
+    for name, stats in initiatives.items():
+        lead_times, cycle_times = initiative_times[name]
+        stats["avg_lead_time"] = statistics.mean(lead_times) if lead_times else None
+        stats["avg_cycle_time"] = statistics.mean(cycle_times) if cycle_times else None
+
+    coding_times, review_wait_times = [], []
+    for pr in prs:
+        if pr.first_commit_at:
+            coding_times.append(
+                hours(pr.first_commit_at, pr.ready_for_review_at or pr.created_at)
+            )
+        first_review = pr.review_metrics.time_to_first_review
+        if pr.review_requested_at and first_review is not None:
+            requested = hours(pr.created_at, pr.review_requested_at)
+            if first_review >= requested:
+                review_wait_times.append(first_review - requested)
+
+    total = len(prs)
+    metrics = [pr.review_metrics for pr in prs]
+    expected.update(
+        total_prs=total,
+        contributors=contributors,
+        initiatives=initiatives,
+        pr_initiatives=pr_initiatives,
+        median_lead_time=median(
+            [t for c in contributors.values() for t in c["lead_times"]]
+        ),
+        median_cycle_time=median(
+            [t for c in contributors.values() for t in c["cycle_times"]]
+        ),
+        median_coding_time=median(coding_times),
+        median_review_wait_time=median(review_wait_times),
+        median_time_to_first_review=median(
+            [m.time_to_first_review for m in metrics if m.time_to_first_review is not None]
+        ),
+        median_time_to_approval=median(
+            [m.time_to_approval for m in metrics if m.time_to_approval is not None]
+        ),
+        avg_reviews_per_pr=sum(m.number_of_reviewers for m in metrics) / total
+        if total
+        else 0.0,
+        avg_review_comments_per_pr=sum(m.number_of_comments for m in metrics) / total
+        if total
+        else 0.0,
+    )
+    return expected
+
+
+def reference_weekly_metrics(prs):
+    weeks = {}
+    for pr in prs:
+        if not pr.merged_at:
+            continue
+        week = weeks.setdefault(
+            pr.merged_at.isocalendar()[:2],
+            {
+                "week_start": pr.merged_at - timedelta(days=pr.merged_at.weekday()),
+                "completed_prs": 0,
+                "completed_changes": 0,
+                "review_times": [],
+                "cycle_times": [],
+                "contributors": set(),
+                "total_reviews": 0,
+                "total_comments": 0,
+            },
+        )
+        week["completed_prs"] += 1
+        week["completed_changes"] += pr.additions + pr.deletions
+        week["contributors"].add(pr.author)
+        week["total_reviews"] += len(pr.reviewers)
+        week["total_comments"] += pr.review_metrics.number_of_comments
+        if pr.review_metrics.time_to_approval is not None:
+            week["review_times"].append(pr.review_metrics.time_to_approval)
+        opened_at = pr.ready_for_review_at or pr.created_at
+        week["cycle_times"].append((pr.merged_at - opened_at).total_seconds() / 3600)
+
+    expected = []
+    previous = None
+    for _, week in sorted(weeks.items()):
+        avg_cycle_time = statistics.mean(week["cycle_times"])
+        throughput_trend = cycle_time_trend = None
+        if previous:
+            throughput_trend = (
+                (week["completed_prs"] - previous["completed_prs"])
+                / previous["completed_prs"]
+                * 100
+            )
+            cycle_time_trend = (
+                (avg_cycle_time - previous["avg_cycle_time"])
+                / previous["avg_cycle_time"]
+                * 100
+            )
+        current = {
+            "week_start": week["week_start"].date(),
+            "completed_prs": week["completed_prs"],
+            "completed_changes": week["completed_changes"],
+            "avg_review_time": statistics.mean(week["review_times"])
+            if week["review_times"]
+            else None,
+            "avg_cycle_time": avg_cycle_time,
+            "active_contributors": len(week["contributors"]),
+            "total_reviews": week["total_reviews"],
+            "total_comments": week["total_comments"],
+            "throughput_trend": throughput_trend,
+            "cycle_time_trend": cycle_time_trend,
+        }
+        expected.append(current)
+        previous = current
+    return expected
+
+
+def approx(value):
+    return None if value is None else pytest.approx(value)
+
+
+@pytest.mark.parametrize("count, seed", [(0, 0), (1, 1), (7, 7), (500, 500)])
+def test_report_metrics_match_the_per_pr_computation(count, seed):
+    prs = random_prs(count, seed)
+    expected = reference_report(prs)
+
+    report = ReportGenerator(initiative_patterns=PATTERNS).generate_report(
+        "o/r",
+        prs,
+        START,
+        START + timedelta(days=90),
+        contributor_stats={"user1": ContributorStats(login="user1", commits=5)},
+    )
+
+    for field in ("prs_merged", "prs_open", "prs_closed", "total_prs"):
+        assert getattr(report, field) == expected[field], field
+    assert report.pr_size_distribution == expected["pr_size_distribution"]
+    assert [pr.size_category for pr in prs] == [size_category(pr) for pr in prs]
+    assert {pr.number: pr.initiatives for pr in prs} == expected["pr_initiatives"]
+
+    for field in (
+        "median_lead_time",
+        "median_cycle_time",
+        "median_coding_time",
+        "median_review_wait_time",
+        "median_time_to_first_review",
+        "median_time_to_approval",
+        "avg_reviews_per_pr",
+        "avg_review_comments_per_pr",
+    ):
+        assert getattr(report, field) == approx(expected[field]), field
+
+    # Pre-fetched statistics add contributors without PRs
+    assert set(report.contributors) == set(expected["contributors"]) | {"user1"}
+    for login, stats in expected["contributors"].items():
+        actual = report.contributors[login]
+        for field in ("prs_authored", "prs_merged", "reviews_given", "reviews_received"):
+            assert getattr(actual, field) == stats[field], (login, field)
+        assert actual.lead_times == pytest.approx(stats["lead_times"]), login
+        assert actual.cycle_times == pytest.approx(stats["cycle_times"]), login
+
+    assert set(report.initiatives) == set(expected["initiatives"])
+    for name, stats in expected["initiatives"].items():
+        actual = report.initiatives[name]
+        assert actual.pr_count == stats["pr_count"], name
+        assert actual.contributors == stats["contributors"], name
+        assert actual.avg_lead_time == approx(stats["avg_lead_time"]), name
+        assert actual.avg_cycle_time == approx(stats["avg_cycle_time"]), name
+
+
+@pytest.mark.parametrize("count, seed", [(0, 0), (1, 1), (7, 7), (500, 500)])
+def test_weekly_metrics_match_the_per_pr_computation(count, seed):
+    prs = random_prs(count, seed)
+    expected = reference_weekly_metrics(prs)
+
+    for weekly in (
+        calculate_weekly_metrics(prs),
+        ReportGenerator(initiative_patterns=PATTERNS)
+        .generate_report("o/r", prs, START, START + timedelta(days=90))
+        .weekly_metrics,
+    ):
+        assert len(weekly) == len(expected)
+        for actual, week in zip(weekly, expected):
+            assert actual.week_start.date() == week["week_start"]
+            for field, value in week.items():
+                if field == "week_start":
+                    continue
+                if isinstance(value, float) or value is None:
+                    assert getattr(actual, field) == approx(value), field
+                else:
+                    assert getattr(actual, field) == value, field
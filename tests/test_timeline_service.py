@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+
+from github_report_generator.application.services.timeline_service import (
+    TimelineService,
+)
+from github_report_generator.domain import PullRequestRecord, PullRequestState
+from github_report_generator.infrastructure import GitHubClient
+
+CREATED = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+
+def pr(number):
+    return PullRequestRecord(
+        number=number,
+        title=f"PR {number}",
+        state=PullRequestState.OPEN,
+        author="alice",
+        created_at=CREATED,
+        updated_at=CREATED,
+        branch="feature/x",
+    )
+
+
+def timeline():
+    return {
+        "firstCommit": {
+            "nodes": [
+                {
+                    "commit": {
+                        "authoredDate": "2024-01-01T00:00:00Z",
+                        "committedDate": "2024-01-01T06:00:00Z",
+                    }
+                }
+            ]
+        }
+    }
+
+
+class FlakyClient(GitHubClient):
+    """Fails the first batch outright; in the second, PR 4 cannot be
+    looked up and GitHub answers for the others alongside the error."""
+
+    def __init__(self):
+        super().__init__(token="token")
+        self.batches = 0
+
+    def make_request(self, method, url, params=None, json=None):
+        self.batches += 1
+        if self.batches == 1:
+            raise Exception("Something went wrong while executing your query")
+        return {
+            "data": {"repository": {"pr3": timeline(), "pr4": None}},
+            "errors": [{"message": "Could not resolve to a PullRequest"}],
+        }
+
+
+def test_failed_batches_do_not_drop_the_rest(capsys):
+    prs = [pr(number) for number in (1, 2, 3, 4)]
+    service = TimelineService(FlakyClient(), batch_size=2)
+
+    assert service.add_timelines("o/r", prs) == 1
+
+    assert [p.first_commit_at for p in prs] == [
+        None,
+        None,
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        None,
+    ]
+    out = capsys.readouterr().out
+    assert "Error fetching PR timelines" in out
+    assert "Could not resolve to a PullRequest" in out
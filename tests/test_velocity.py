@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, timezone
+
+from github_report_generator.domain import (
+    PullRequestRecord,
+    PullRequestState,
+    ReportGenerator,
+    ReviewMetricsRecord,
+    create_velocity_charts,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def merged_pr(number, days, time_to_approval=None):
+    created_at = START + timedelta(days=days)
+    return PullRequestRecord(
+        number=number,
+        title=f"PR {number}",
+        state=PullRequestState.MERGED,
+        author="alice",
+        created_at=created_at,
+        updated_at=created_at + timedelta(hours=5),
+        closed_at=created_at + timedelta(hours=5),
+        merged_at=created_at + timedelta(hours=5),
+        branch=f"feature/{number}",
+        review_metrics=ReviewMetricsRecord(time_to_approval=time_to_approval),
+    )
+
+
+def test_velocity_charts_for_weeks_without_approvals():
+    # Week one has no approved PR, week two has one
+    prs = [merged_pr(1, 0), merged_pr(2, 1), merged_pr(3, 8, time_to_approval=2.0)]
+    report = ReportGenerator().generate_report(
+        "o/r", prs, START, START + timedelta(days=14)
+    )
+    assert report.weekly_metrics[0].avg_review_time is None
+
+    throughput_fig, cycle_fig = create_velocity_charts(report)
+
+    review_trace = cycle_fig.data[0]
+    assert list(review_trace.text) == ["", "2.0h"]
+    assert throughput_fig.data[0].y is not None
+
+
+def test_velocity_charts_for_a_single_unapproved_pr():
+    report = ReportGenerator().generate_report(
+        "o/r", [merged_pr(1, 0)], START, START + timedelta(days=7)
+    )
+
+    _, cycle_fig = create_velocity_charts(report)
+
+    assert list(cycle_fig.data[0].text) == [""]